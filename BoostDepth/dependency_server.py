@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Boost Dependency Neighborhood Server
+Keeps the module graph of boost_modules_dependencies.csv in memory and answers
+make-dependency.py-style queries over HTTP, without rewriting any files.
+
+Endpoints (all GET, JSON unless format=dot):
+  /neighborhood?seed=asio&depth=2&reverse=true[&format=json|dot]
+      nodes and edges of traverse_neighborhood(), or the generate_dot() graph
+  /layers?seed=asio&depth=2&reverse=true
+      ancestor/descendant layers (calculate_ancestor_descendant_layers)
+  /modules      all module names
+  /metadata     CSV path, graph size and cache statistics
+
+Results are kept in an LRU cache keyed by (graph, seed, depth, reverse); the
+graph and the cache are reloaded when the CSV changes. If the CSV cannot be
+read, requests get a 503 JSON error.
+
+Usage examples:
+  python3 dependency_server.py --port 8766
+  curl 'http://127.0.0.1:8766/neighborhood?seed=asio&depth=2&reverse=true'
+  curl 'http://127.0.0.1:8766/neighborhood?seed=json&depth=1&format=dot' | dot -Tsvg > json.svg
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_CACHE_SIZE = 512
+
+
+def _load_make_dependency():
+    """Import make-dependency.py (not importable by name because of the hyphen)."""
+    path = Path(__file__).parent / "make-dependency.py"
+    spec = importlib.util.spec_from_file_location("make_dependency", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+make_dependency = _load_make_dependency()
+
+
+class _Graph:
+    """One loaded version of the CSV; replaced as a whole on reload, never mutated."""
+
+    __slots__ = ("generation", "forward_deps", "reverse_deps", "modules", "module_set")
+
+    def __init__(self, generation, forward_deps, reverse_deps):
+        self.generation = generation
+        self.forward_deps = forward_deps
+        self.reverse_deps = reverse_deps
+        self.modules = sorted(make_dependency.get_all_modules(forward_deps, reverse_deps))
+        self.module_set = frozenset(self.modules)
+
+
+class DependencyQueryService:
+    """In-memory module graph with cached neighborhood and layer queries."""
+
+    def __init__(self, csv_path, cache_size=DEFAULT_CACHE_SIZE):
+        self.csv_path = Path(csv_path)
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._graph = None
+        # Keyed by the graph snapshot too, so a result computed from a replaced
+        # graph and stored after cache_clear() is never returned for the new one
+        self._neighborhood = lru_cache(maxsize=cache_size)(self._compute_neighborhood)
+        self.refresh()
+
+    @property
+    def modules(self):
+        """Sorted module names of the current graph."""
+        return self._graph.modules
+
+    def refresh(self):
+        """Reload the graph and drop cached results if the CSV changed."""
+        mtime = os.stat(self.csv_path).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            fwd, rev = make_dependency.load_csv_dependencies(str(self.csv_path))
+            if fwd is None:
+                raise FileNotFoundError(f"CSV not found: {self.csv_path}")
+            generation = self._graph.generation + 1 if self._graph is not None else 0
+            self._graph = _Graph(generation, fwd, rev)
+            self._neighborhood.cache_clear()
+            self._mtime = mtime
+
+    def _snapshot(self, seed):
+        """The current graph, after checking that it contains seed."""
+        graph = self._graph
+        if seed not in graph.module_set:
+            raise KeyError(f"Unknown module '{seed}'")
+        return graph
+
+    @staticmethod
+    def _compute_neighborhood(graph, seed, depth, reverse):
+        nodes, edges = make_dependency.traverse_neighborhood(
+            seed, graph.forward_deps, graph.reverse_deps, depth=depth, include_reverse=reverse
+        )
+        return frozenset(nodes), frozenset(edges)
+
+    def neighborhood(self, seed, depth=-1, reverse=False):
+        """Nodes and edges around seed, in make-dependency.py's JSON layout."""
+        nodes, edges = self._neighborhood(self._snapshot(seed), seed, depth, reverse)
+        return {
+            "seed": seed,
+            "depth": depth,
+            "reverse": reverse,
+            "nodes": sorted(nodes),
+            "edges": [{"from": u, "to": v} for (u, v) in sorted(edges)],
+        }
+
+    def dot(self, seed, depth=-1, reverse=False):
+        """Graphviz source of the neighborhood (same as make-dependency.py's .dot files)."""
+        nodes, edges = self._neighborhood(self._snapshot(seed), seed, depth, reverse)
+        return make_dependency.generate_dot(seed, set(nodes), set(edges))
+
+    def layers(self, seed, depth=-1, reverse=False):
+        """Ancestor and descendant layers of the neighborhood, layer number -> sorted modules."""
+        nodes, edges = self._neighborhood(self._snapshot(seed), seed, depth, reverse)
+        ancestors, descendants = make_dependency.calculate_ancestor_descendant_layers(seed, nodes, edges)
+        return {
+            "seed": seed,
+            "depth": depth,
+            "reverse": reverse,
+            "ancestors": {str(layer): sorted(mods) for layer, mods in sorted(ancestors.items())},
+            "descendants": {str(layer): sorted(mods) for layer, mods in sorted(descendants.items())},
+        }
+
+    def metadata(self):
+        graph = self._graph
+        info = self._neighborhood.cache_info()
+        return {
+            "csv": str(self.csv_path),
+            "generation": graph.generation,
+            "modules": len(graph.modules),
+            "edges": sum(len(deps) for deps in graph.forward_deps.values()),
+            "cache": {"hits": info.hits, "misses": info.misses,
+                      "size": info.currsize, "max_size": info.maxsize},
+        }
+
+
+def _query_args(params):
+    """(seed, depth, reverse) from query parameters."""
+    seed = params.get("seed", "")
+    if not seed:
+        raise ValueError("Missing 'seed' parameter")
+    try:
+        depth = int(params.get("depth", -1))
+    except ValueError:
+        raise ValueError(f"Invalid depth: {params['depth']}")
+    return seed, depth, make_dependency.parse_bool(params.get("reverse", "false"))
+
+
+def _make_handler(service):
+    class DependencyHandler(BaseHTTPRequestHandler):
+        """GET /neighborhood, /layers, /modules and /metadata."""
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            try:
+                service.refresh()
+            except (OSError, csv.Error, ValueError) as e:
+                self._send_json(503, {"error": f"Dependency graph unavailable: {e}"})
+                return
+            try:
+                if url.path == "/neighborhood":
+                    args = _query_args(params)
+                    if params.get("format", "json") == "dot":
+                        self._send(200, service.dot(*args).encode("utf-8"), "text/vnd.graphviz")
+                    else:
+                        self._send_json(200, service.neighborhood(*args))
+                elif url.path == "/layers":
+                    self._send_json(200, service.layers(*_query_args(params)))
+                elif url.path == "/modules":
+                    self._send_json(200, {"modules": service.modules})
+                elif url.path == "/metadata":
+                    self._send_json(200, service.metadata())
+                else:
+                    self._send_json(404, {"error": f"Unknown path {url.path}"})
+            except KeyError as e:
+                self._send_json(404, {"error": e.args[0]})
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+
+        def _send_json(self, status, payload):
+            self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return DependencyHandler
+
+
+def serve(service, host="127.0.0.1", port=8766):
+    """Serve queries over HTTP until interrupted."""
+    server = ThreadingHTTPServer((host, port), _make_handler(service))
+    print(f"🌐 Serving dependency queries on http://{host}:{port}/neighborhood "
+          f"({len(service.modules)} modules, metadata at /metadata)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Serve Boost module dependency neighborhoods over HTTP')
+    parser.add_argument('--csv', type=str, default=str(Path(__file__).parent / 'boost_modules_dependencies.csv'),
+                        help='Path to boostdep CSV')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'Maximum number of cached neighborhoods (default: {DEFAULT_CACHE_SIZE})')
+    args = parser.parse_args()
+
+    serve(DependencyQueryService(args.csv, args.cache_size), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
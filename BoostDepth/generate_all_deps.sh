@@ -6,29 +6,9 @@
 echo "🚀 Generating dependencies for all libraries..."
 echo "=============================================="
 
-# Read libraries from lib_list.txt
-while IFS= read -r lib; do
-    # Skip empty lines
-    if [ -z "$lib" ]; then
-        continue
-    fi
-    
-    echo ""
-    echo "📚 Processing library: $lib"
-    echo "------------------------"
-    
-    # Generate depth 1 with reverse
-    echo "🔍 Generating depth 1 with reverse dependencies..."
-    python3 make-dependency.py --lib "$lib" --dep 1 --rev true
-    
-    # Generate depth 2 with reverse (without cleanup to preserve depth 1 files)
-    echo "🔍 Generating depth 2 with reverse dependencies..."
-    python3 make-dependency.py --lib "$lib" --dep 2 --rev true
-    
-    echo "✅ Completed: $lib"
-    echo ""
-    
-done < lib_list.txt
+# Load the CSV once and build depth 1 and depth 2 with reverse dependencies for
+# every library in lib_list.txt (WORKERS processes, default: one per CPU)
+python3 make-dependency.py --all --lib-list lib_list.txt --depths 1,2 --rev true --workers "${WORKERS:-0}"
 
 echo "🎉 All libraries processed!"
 echo ""
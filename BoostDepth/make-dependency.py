@@ -8,46 +8,45 @@ Usage examples:
   python3 make-dependency.py --lib asio
   python3 make-dependency.py --lib asio --depth 2
   python3 make-dependency.py --lib asio --inverse true --depth 2
+
+Batch mode (CSV loaded once, seeds processed on a process pool):
+  python3 make-dependency.py --all --lib-list lib_list.txt --depths 1,2 --rev true --workers 8
+
+Images are rendered by a queue of concurrent `dot` processes; renders whose
+DOT content and settings are unchanged are skipped. Quick look:
+  python3 make-dependency.py --lib asio --dep 2 --preview
 """
 
 import argparse
-import csv
+import hashlib
 import json
 import os
 import re
 import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import deque
+
+sys.path.insert(0, str(Path(__file__).parent / "statistics"))
+from dependency_graph import load_dependency_graph
 
 def load_csv_dependencies(csv_path="boost_modules_dependencies.csv"):
     """Load Primary and Reverse relationships from the boostdep CSV export.
 
+    The CSV is parsed once and cached as a binary graph keyed by its hash
+    (see statistics/dependency_graph.py).
+
     Returns two dicts:
       forward_deps: module -> set(dependency_module)
       reverse_deps: module -> set(dependent_module)
     """
-    forward_deps = defaultdict(set)
-    reverse_deps = defaultdict(set)
-
     if not Path(csv_path).exists():
         print(f"❌ Error: CSV not found at {csv_path}. Run export_boost_deps.sh first.")
         return None, None
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        for row in reader:
-            if not row or len(row) < 4:
-                continue
-            operation, module, dep_module = row[0].strip(), row[1].strip(), row[2].strip()
-            if not module or not dep_module:
-                continue
-            if operation.lower() == 'primary':
-                forward_deps[module].add(dep_module)
-            elif operation.lower() == 'reverse':
-                reverse_deps[module].add(dep_module)
-
-    return forward_deps, reverse_deps
+    return load_dependency_graph(csv_path).to_adjacency_sets()
 
 def get_all_modules(forward_deps, reverse_deps):
     modules = set(forward_deps.keys()) | set(reverse_deps.keys())
@@ -201,7 +200,7 @@ def generate_dot(seed, nodes, edges):
     # Add 2-cycle information
     if two_cycles:
         lines.append("  // 2-CYCLES DETECTED (Direct Bidirectional Dependencies):")
-        for cycle_edge in two_cycles:
+        for cycle_edge in sorted(two_cycles):
             lines.append(f"  // {cycle_edge[0]} <-> {cycle_edge[1]} (2-CYCLE)")
     
     lines.append("}")
@@ -301,49 +300,72 @@ def generate_markdown_report(lib_data, all_deps, dependents, data):
     """Deprecated in CSV mode: no markdown emitted."""
     return ""
 
-def generate_graph_image(dot_file, output_format="png"):
-    """Generate graph image from DOT file using Graphviz with optimal settings."""
+def preview_dot(dot_content):
+    """DOT text of a preview render: generate_dot() output with PREVIEW_GRAPH_ATTRIBUTES appended."""
+    body, brace, rest = dot_content.rpartition("}")
+    return body + "".join(f"  {attribute};\n" for attribute in PREVIEW_GRAPH_ATTRIBUTES) + brace + rest
+
+def graphviz_command(dot_file, output_format, output_file, dpi=600, preview=False):
+    """Graphviz command line for rendering dot_file (None: DOT text on stdin) to output_file."""
+    source = [dot_file] if dot_file is not None else []
+    if preview:
+        # Quick look: plain SVG, no edge concentration (layout cost comes from the DOT attributes)
+        return ["dot", "-T", output_format,
+                "-Gfontname=Arial",
+                "-Nfontname=Arial",
+                "-Gbgcolor=white",
+                "-Gcharset=utf8",
+                "-o", output_file] + source
+    # Ultra high-quality settings for maximum readability - VERTICAL LAYOUT
+    if output_format == "svg":
+        # SVG settings (vector, infinitely scalable) - VERTICAL
+        cmd = ["dot", "-T", output_format, 
+               "-Grankdir=TB",                 # Force vertical layout
+               "-Granksep=4.0",                # Much more space between ranks
+               "-Gnodesep=2.5",                # Space between nodes
+               "-Gfontsize=20",                # Large font
+               "-Gfontname=Arial",             # Clear font
+               "-Gbgcolor=white",              # White background
+               "-Nfontsize=18",                # Large node font
+               "-Nfontname=Arial",             # Node font
+               "-Efontsize=14",                # Large edge font
+               "-Efontname=Arial",             # Edge font
+               "-Gmargin=0.5",                 # Small margin
+               "-Gcharset=utf8",               # UTF-8 encoding
+               "-Gconcentrate=true",           # Concentrate edges
+               "-Goverlap=false",              # Prevent node overlap
+               "-o", output_file] + source
+    else:
+        # PNG settings (raster, high DPI) - VERTICAL
+        cmd = ["dot", "-T", output_format, 
+               "-Grankdir=TB",                 # Force vertical layout
+               f"-Gdpi={dpi}",                 # Ultra high DPI for crisp text (600 by default)
+               "-Gsize=24,48",                 # Taller canvas for vertical layout
+               "-Granksep=4.0",                # Much more space between ranks
+               "-Gnodesep=2.5",                # Space between nodes
+               "-Gfontsize=20",                # Large font
+               "-Gfontname=Arial",             # Clear font
+               "-Gbgcolor=white",              # White background
+               "-Nfontsize=18",                # Large node font
+               "-Nfontname=Arial",             # Node font
+               "-Efontsize=14",                # Large edge font
+               "-Efontname=Arial",             # Edge font
+               "-o", output_file] + source
+    return cmd
+
+def generate_graph_image(dot_file, output_format="png", dpi=600, output_file=None, timeout=None,
+                         preview_content=None):
+    """Generate graph image from DOT file using Graphviz with optimal settings.
+
+    With preview_content (see preview_dot), that DOT text is rendered from stdin
+    with the cheap preview settings instead of dot_file.
+    """
     try:
-        base_name = Path(dot_file).stem
-        output_dir = Path(dot_file).parent
-        output_file = str(output_dir / f"{base_name}.{output_format}")
-        
-        # Ultra high-quality settings for maximum readability - VERTICAL LAYOUT
-        if output_format == "svg":
-            # SVG settings (vector, infinitely scalable) - VERTICAL
-            cmd = ["dot", "-T", output_format, 
-                   "-Grankdir=TB",                 # Force vertical layout
-                   "-Granksep=4.0",                # Much more space between ranks
-                   "-Gnodesep=2.5",                # Space between nodes
-                   "-Gfontsize=20",                # Large font
-                   "-Gfontname=Arial",             # Clear font
-                   "-Gbgcolor=white",              # White background
-                   "-Nfontsize=18",                # Large node font
-                   "-Nfontname=Arial",             # Node font
-                   "-Efontsize=14",                # Large edge font
-                   "-Efontname=Arial",             # Edge font
-                   "-Gmargin=0.5",                 # Small margin
-                   "-Gcharset=utf8",               # UTF-8 encoding
-                   "-Gconcentrate=true",           # Concentrate edges
-                   "-Goverlap=false",              # Prevent node overlap
-                   "-o", output_file, dot_file]
-        else:
-            # PNG settings (raster, high DPI) - VERTICAL
-            cmd = ["dot", "-T", output_format, 
-                   "-Grankdir=TB",                 # Force vertical layout
-                   "-Gdpi=600",                    # Ultra high DPI for crisp text
-                   "-Gsize=24,48",                 # Taller canvas for vertical layout
-                   "-Granksep=4.0",                # Much more space between ranks
-                   "-Gnodesep=2.5",                # Space between nodes
-                   "-Gfontsize=20",                # Large font
-                   "-Gfontname=Arial",             # Clear font
-                   "-Gbgcolor=white",              # White background
-                   "-Nfontsize=18",                # Large node font
-                   "-Nfontname=Arial",             # Node font
-                   "-Efontsize=14",                # Large edge font
-                   "-Efontname=Arial",             # Edge font
-               "-o", output_file, dot_file]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        if output_file is None:
+            output_file = str(Path(dot_file).parent / f"{Path(dot_file).stem}.{output_format}")
+        preview = preview_content is not None
+        cmd = graphviz_command(None if preview else dot_file, output_format, output_file, dpi, preview)
+        result = subprocess.run(cmd, input=preview_content, capture_output=True, text=True, timeout=timeout)
         
         if result.returncode == 0:
             return output_file
@@ -351,6 +373,11 @@ def generate_graph_image(dot_file, output_format="png"):
             print(f"❌ Error generating graph: {result.stderr}")
             return None
             
+    except subprocess.TimeoutExpired:
+        print(f"⏱️  Graphviz timed out after {timeout}s: {output_file}")
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        return None
     except FileNotFoundError:
         print("❌ Graphviz not found. Install with: sudo apt-get install graphviz")
         return None
@@ -358,7 +385,93 @@ def generate_graph_image(dot_file, output_format="png"):
         print(f"❌ Error generating graph: {e}")
         return None
 
-def cleanup_old_files(lib_name, depth=None):
+# Image sets: (format, file suffix). Preview renders go to separate files so they
+# never replace full-quality images.
+FULL_RENDER = (("png", "png"), ("svg", "svg"))
+PREVIEW_RENDER = (("svg", "preview.svg"),)
+# Graph attributes appended to the DOT text of preview renders; the last assignment
+# wins, so they replace generate_dot()'s orthogonal edge routing (the slowest part
+# of the layout) and wide spacing, and cap crossing-minimization passes
+PREVIEW_GRAPH_ATTRIBUTES = ("splines=line", "ranksep=1.0", "nodesep=0.4", "mclimit=0.3")
+RENDER_HASHES_FILE = ".render_hashes.json"
+
+class RenderQueue:
+    """Runs Graphviz renders on a thread pool, skipping images whose DOT content is unchanged.
+
+    A render is keyed by the SHA-256 of the DOT text and the render settings; keys of
+    finished renders are kept per output directory in .render_hashes.json, and a
+    render is skipped when its image exists with the same key.
+    """
+
+    def __init__(self, workers=2, timeout=None, preview=False, dpi=600, force=False):
+        self.workers = max(1, workers)
+        self.timeout = timeout or None
+        self.preview = preview
+        self.render_set = PREVIEW_RENDER if preview else FULL_RENDER
+        self.dpi = dpi
+        self.force = force
+        self._pool = None
+        self._pending = []
+        self._hashes = {}
+        self.stats = {"rendered": 0, "skipped": 0, "failed": 0}
+
+    def _directory_hashes(self, directory):
+        if directory not in self._hashes:
+            path = Path(directory) / RENDER_HASHES_FILE
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._hashes[directory] = json.load(f)
+            except (OSError, ValueError):
+                self._hashes[directory] = {}
+        return self._hashes[directory]
+
+    def submit(self, dot_file, dot_content):
+        """Queue every image of the render set for dot_file."""
+        directory = str(Path(dot_file).parent)
+        hashes = self._directory_hashes(directory)
+        preview_content = preview_dot(dot_content) if self.preview else None
+        for output_format, suffix in self.render_set:
+            output_file = str(Path(directory) / f"{Path(dot_file).stem}.{suffix}")
+            settings = f"{output_format}|dpi={self.dpi if output_format == 'png' else ''}|"
+            key = hashlib.sha256((settings + (preview_content or dot_content)).encode('utf-8')).hexdigest()
+            name = Path(output_file).name
+            if not self.force and hashes.get(name) == key and os.path.exists(output_file):
+                self.stats["skipped"] += 1
+                print(f"⏭️  Unchanged, skipped: {output_file}")
+                continue
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            future = self._pool.submit(generate_graph_image, dot_file, output_format,
+                                       self.dpi, output_file, self.timeout, preview_content)
+            self._pending.append((future, directory, name, key, output_format))
+
+    def wait(self):
+        """Wait for queued renders and record their hashes. Returns the running stats."""
+        for future, directory, name, key, output_format in self._pending:
+            output_file = future.result()
+            hashes = self._directory_hashes(directory)
+            if output_file:
+                self.stats["rendered"] += 1
+                hashes[name] = key
+                print(f"📊 {output_format.upper()} image generated: {output_file}")
+            else:
+                self.stats["failed"] += 1
+                hashes.pop(name, None)
+        touched = {directory for _, directory, _, _, _ in self._pending}
+        self._pending = []
+        for directory in touched:
+            path = Path(directory) / RENDER_HASHES_FILE
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self._hashes[directory], f, indent=2, sort_keys=True)
+        return self.stats
+
+    def close(self):
+        self.wait()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+def cleanup_old_files(lib_name, depth=None, keep_images=False):
     """Clean up old files for the library."""
     import os
     import glob
@@ -373,6 +486,9 @@ def cleanup_old_files(lib_name, depth=None):
                 pattern = f"{lib_name}_deps_d{depth}_rev.*"
                 old_files = glob.glob(f"{deps_dir}/{pattern}")
                 for file in old_files:
+                    # Images are re-rendered only if their DOT changed (see RenderQueue)
+                    if keep_images and file.endswith(('.png', '.svg')):
+                        continue
                     os.remove(file)
                     print(f"🗑️  Removed old file: {file}")
             else:
@@ -391,39 +507,179 @@ def cleanup_old_files(lib_name, depth=None):
         except:
             pass
     
-def save_dot_and_image(output_base, dot_content):
+def save_dot(output_base, dot_content):
     dot_file = f"{output_base}.dot"
     with open(dot_file, 'w', encoding='utf-8') as f:
         f.write(dot_content)
     print(f"💾 DOT saved: {dot_file}")
+    return dot_file
+
+def save_dot_and_image(output_base, dot_content, render_queue=None):
+    """Save the DOT file and queue its PNG and SVG renders (rendered immediately without a queue)."""
+    dot_file = save_dot(output_base, dot_content)
     
-    # Generate both PNG and SVG for maximum quality
-    png_image = generate_graph_image(dot_file, "png")
-    if png_image:
-        print(f"📊 PNG image generated: {png_image}")
-    
-    svg_image = generate_graph_image(dot_file, "svg")
-    if svg_image:
-        print(f"📊 SVG image generated: {svg_image} (vector, infinitely scalable)")
+    if render_queue is None:
+        queue = RenderQueue(workers=2)
+        queue.submit(dot_file, dot_content)
+        queue.close()
+    else:
+        render_queue.submit(dot_file, dot_content)
+
+def output_base(lib, depth, reverse):
+    """Output path prefix: dependencies/{lib}/{lib}_deps[_d{depth}][_rev]."""
+    base = f"dependencies/{lib}/{lib}_deps"
+    if depth is not None and depth >= 0:
+        base += f"_d{depth}"
+    if reverse:
+        base += "_rev"
+    return base
+
+def build_library_outputs(lib, fwd, rev, depth, reverse, render_queue=None):
+    """Traverse one seed's neighborhood and write its JSON and DOT, queueing images on render_queue."""
+    cleanup_old_files(lib, depth, keep_images=render_queue is not None)
+
+    nodes, edges = traverse_neighborhood(lib, fwd, rev, depth=depth, include_reverse=reverse)
+    print(f"📊 {lib} (depth={depth}, reverse={reverse}) Nodes: {len(nodes)} | Edges: {len(edges)}")
+
+    os.makedirs(f"dependencies/{lib}", exist_ok=True)
+    base = output_base(lib, depth, reverse)
+
+    write_json(base, lib, nodes, edges, depth, reverse)
+    dot_text = generate_dot(lib, nodes, edges)
+    if render_queue is not None:
+        save_dot_and_image(base, dot_text, render_queue)
+    else:
+        save_dot(base, dot_text)
+    return len(nodes), len(edges)
+
+# Graph and render queue of batch worker processes (set once per process by _init_batch_worker)
+_batch_graph = None
+_batch_render_queue = None
+
+def _init_batch_worker(fwd, rev, render_options):
+    global _batch_graph, _batch_render_queue
+    _batch_graph = (fwd, rev)
+    _batch_render_queue = RenderQueue(**render_options) if render_options is not None else None
+
+def _batch_job(job):
+    lib, depth, reverse = job
+    fwd, rev = _batch_graph
+    return lib, depth, build_library_outputs(lib, fwd, rev, depth, reverse, _batch_render_queue)
+
+def _batch_library_jobs(lib_jobs, wait=True):
+    results = [_batch_job(job) for job in lib_jobs]
+    if wait and _batch_render_queue is not None:
+        # Process pool tasks must finish their renders before returning
+        _batch_render_queue.wait()
+    return results
+
+def read_lib_list(path):
+    """Library names from a lib_list.txt-style file (one per line, blank lines ignored)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+def run_batch(fwd, rev, libs, depths, reverse, workers=1, render_options=None):
+    """Build outputs for every (library, depth) pair from one loaded graph.
+
+    Each depth is processed for one library before the next library starts, so
+    per-depth cleanup never removes files written in the same run.
+
+    render_options are RenderQueue arguments (None = no images); each worker
+    process runs its own render queue.
+    """
+    modules = get_all_modules(fwd, rev)
+    missing = [lib for lib in libs if lib not in modules]
+    for lib in missing:
+        print(f"⚠️  Module '{lib}' not found in CSV, skipping")
+    libs = [lib for lib in libs if lib in modules]
+
+    # Jobs of one library run in order inside one task; libraries run in parallel
+    jobs = [[(lib, depth, reverse) for depth in depths] for lib in libs]
+    start = time.perf_counter()
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(fwd, rev, render_options)) as pool:
+            results = [r for lib_results in pool.map(_batch_library_jobs, jobs) for r in lib_results]
+    else:
+        # One render queue keeps `dot` busy across libraries
+        _init_batch_worker(fwd, rev, render_options)
+        results = [r for lib_jobs in jobs for r in _batch_library_jobs(lib_jobs, wait=False)]
+        if _batch_render_queue is not None:
+            stats = _batch_render_queue.stats
+            _batch_render_queue.close()
+            print(f"🖼️  Images: {stats['rendered']} rendered, {stats['skipped']} unchanged, {stats['failed']} failed")
+    elapsed = time.perf_counter() - start
+
+    print("=" * 50)
+    print(f"✅ Batch done: {len(results)} graphs for {len(libs)} libraries in {elapsed:.2f}s "
+          f"({workers} worker(s), {len(missing)} skipped)")
+    return results
+
+def parse_bool(value):
+    return str(value).lower() in ('1', 't', 'true', 'yes', 'y')
 
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description='Explore Boost module dependencies from CSV')
-    parser.add_argument('--lib', required=True, help='Seed Boost module, e.g., asio')
+    seeds = parser.add_mutually_exclusive_group(required=True)
+    seeds.add_argument('--lib', help='Seed Boost module, e.g., asio')
+    seeds.add_argument('--all', action='store_true',
+                       help='Batch mode: every module in --lib-list (or in the CSV), CSV loaded once')
     parser.add_argument('--dep', type=int, default=-1, help='Traversal depth; -1 for full closure')
+    parser.add_argument('--depths', type=str, default=None,
+                        help='Batch mode: comma-separated depths, e.g. 1,2 (default: --dep)')
+    parser.add_argument('--lib-list', type=str, default=None,
+                        help='Batch mode: file with one library per line (default: all modules in the CSV)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Batch mode: worker processes (0 = one per CPU)')
+    parser.add_argument('--images', type=str, default='true',
+                        help='Render PNG/SVG with Graphviz: true/false (JSON and DOT are always written)')
+    parser.add_argument('--render-workers', type=int, default=0,
+                        help='Concurrent Graphviz processes (0 = one per CPU; per batch worker)')
+    parser.add_argument('--render-timeout', type=float, default=600,
+                        help='Seconds before a Graphviz render is killed (0 = no limit)')
+    parser.add_argument('--dpi', type=int, default=600, help='PNG resolution')
+    parser.add_argument('--preview', action='store_true',
+                        help='Fast preview: SVG only with straight edges and compact spacing, '
+                             'written to *.preview.svg')
+    parser.add_argument('--force-render', action='store_true',
+                        help='Render images even if their DOT content is unchanged')
     parser.add_argument('--rev', type=str, default='false', help='Include reverse (dependents): true/false')
     parser.add_argument('--csv', type=str, default='boost_modules_dependencies.csv', help='Path to boostdep CSV')
     args = parser.parse_args()
     
+    reverse = parse_bool(args.rev)
+    render_options = None
+    if parse_bool(args.images):
+        render_options = {
+            "workers": args.render_workers if args.render_workers > 0 else (os.cpu_count() or 1),
+            "timeout": args.render_timeout,
+            "preview": args.preview,
+            "dpi": args.dpi,
+            "force": args.force_render,
+        }
+
+    if args.all:
+        fwd, rev = load_csv_dependencies(args.csv)
+        if fwd is None:
+            return
+        libs = read_lib_list(args.lib_list) if args.lib_list else sorted(get_all_modules(fwd, rev))
+        depths = [int(d) for d in args.depths.split(',')] if args.depths else [args.dep]
+        workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+        print(f"🚀 Building {len(libs)} libraries x depths {depths} (reverse={reverse}, workers={workers})")
+        print("=" * 50)
+        if render_options is not None and workers > 1 and args.render_workers <= 0:
+            # Share the CPUs between batch workers
+            render_options["workers"] = max(1, render_options["workers"] // workers)
+        run_batch(fwd, rev, libs, depths, reverse, workers=workers, render_options=render_options)
+        return
+
     lib = args.lib
     depth = args.dep
-    reverse = str(args.rev).lower() in ('1', 't', 'true', 'yes', 'y')
 
     print(f"🔍 Building dependency neighborhood for '{lib}' (depth={depth}, reverse={reverse})")
     print("=" * 50)
     
-    cleanup_old_files(lib, depth)
-    
     fwd, rev = load_csv_dependencies(args.csv)
     if fwd is None:
         return
@@ -433,23 +689,10 @@ def main():
         print(f"❌ Module '{lib}' not found in CSV. Run export_boost_deps.sh first.")
         return
     
-    nodes, edges = traverse_neighborhood(lib, fwd, rev, depth=depth, include_reverse=reverse)
-    print(f"📊 Nodes: {len(nodes)} | Edges: {len(edges)}")
-
-    # Create dependencies/{lib} directory
-    import os
-    deps_dir = f"dependencies/{lib}"
-    os.makedirs(deps_dir, exist_ok=True)
-    
-    base = f"{deps_dir}/{lib}_deps"
-    if depth is not None and depth >= 0:
-        base += f"_d{depth}"
-    if reverse:
-        base += "_rev"
-
-    write_json(base, lib, nodes, edges, depth, reverse)
-    dot_text = generate_dot(lib, nodes, edges)
-    save_dot_and_image(base, dot_text)
+    render_queue = RenderQueue(**render_options) if render_options is not None else None
+    build_library_outputs(lib, fwd, rev, depth, reverse, render_queue)
+    if render_queue is not None:
+        render_queue.close()
     print(f"\n✅ Done for {lib}")
 
 if __name__ == "__main__":
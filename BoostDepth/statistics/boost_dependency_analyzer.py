@@ -5,14 +5,14 @@ This module provides a class to analyze Boost module dependencies from CSV data.
 It creates relation mappings for both module-to-module and header-to-header dependencies.
 """
 
-import csv
-from collections import defaultdict
+import json
+from collections import defaultdict, deque
 from typing import Dict, DefaultDict
 from pathlib import Path
-from clang import cindex
-import os
-import re
-import json
+
+from dependency_graph import load_dependency_graph
+from header_scanner import DEFAULT_CACHE_FILE, HeaderCache
+from reachability import ReachabilityIndex
 
 class BoostDependencyAnalyzer:
     """
@@ -49,6 +49,10 @@ class BoostDependencyAnalyzer:
         self.header_relation_count: Dict[str, Dict[str, int]] = {}
         self.header_deps: Dict[str, Dict[str, int]] = {}
         
+        # Reachability indexes by relation value (1 / -1), built by the count_* methods
+        self.module_reachability: Dict[int, ReachabilityIndex] = {}
+        self.header_reachability: Dict[int, ReachabilityIndex] = {}
+        
         # Temporary storage for tracking operations
         self._module_operations: DefaultDict[str, DefaultDict[str, set]] = defaultdict(lambda: defaultdict(set))
         self._header_operations: DefaultDict[str, DefaultDict[str, set]] = defaultdict(lambda: defaultdict(set))
@@ -57,36 +61,23 @@ class BoostDependencyAnalyzer:
         """
         Read the CSV file and populate relation data structures.
         """
-        if not self.csv_file_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {self.csv_file_path}")
+        # Parsed once and cached in binary form (see dependency_graph.py)
+        graph = load_dependency_graph(self.csv_file_path)
         
-        with open(self.csv_file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                operation = row['Operation']
-                module_a = row['Module_A']  # Source module
-                module_b = row['Module_B']  # Dependent module
-                sub_header = row['Header']  # Header file path from Module_B
-                from_headers = row['From']  # Space-separated header files from Module_A
-                
-                # Track module operations
-                self._module_operations[module_a][module_b].add(operation)
-                if operation == "Primary":
-                    self._module_operations[module_b][module_a].add("Reverse")
-                elif operation == "Reverse":
-                    self._module_operations[module_b][module_a].add("Primary")
-                
-                # Track header operations: relation between headers
-                # header_relation[header_b][from_header] based on operation type
-                # Primary -> -1, Reverse -> 1
-                if sub_header and from_headers:
-                    header_list = from_headers.strip().split()
-                    for from_header in header_list:
-                        if from_header:  # Skip empty strings
-                            # Store the operation directly (Primary maps to -1, Reverse maps to 1 later)
-                            self._header_operations[sub_header][from_header].add("Reverse")
-                            self._header_operations[from_header][sub_header].add("Primary")
+        for module_a, module_b, operation in graph.iter_module_edges():
+            # Track module operations
+            self._module_operations[module_a][module_b].add(operation)
+            if operation == "Primary":
+                self._module_operations[module_b][module_a].add("Reverse")
+            elif operation == "Reverse":
+                self._module_operations[module_b][module_a].add("Primary")
+        
+        # Track header operations: relation between headers
+        # header_relation[header_b][from_header] based on operation type
+        # Primary -> -1, Reverse -> 1
+        for from_header, sub_header in graph.iter_header_edges():
+            self._header_operations[sub_header][from_header].add("Reverse")
+            self._header_operations[from_header][sub_header].add("Primary")
         
         # Build final relation data
         self._build_module_relations()
@@ -96,14 +87,8 @@ class BoostDependencyAnalyzer:
         self._module_operations.clear()
         self._header_operations.clear()
         
-        header_deps_file = "headers_dependencies.json"
+        # Header includes: only headers changed since the last scan are lexed again
         self.get_header_relation_by_header()
-        
-        if not Path(header_deps_file).exists():
-            self.get_header_relation_by_header()
-        else:
-            with open(header_deps_file, "r", encoding="utf-8") as f:
-                self.header_deps = json.load(f)
         self.complete_header_relation()
     
     def complete_header_relation(self) -> None:
@@ -124,63 +109,67 @@ class BoostDependencyAnalyzer:
         print(f"Completed header relation for {len(self.header_relation)} headers")
         
     def get_header_relation_by_header(self, boost_root_path: str = None, 
-                                      libclang_path: str = r"C:\Program Files\LLVM\bin") -> Dict[str, Dict[str, int]]:
+                                      libclang_path: str = None,
+                                      workers: int = None,
+                                      cache_file: Path = DEFAULT_CACHE_FILE,
+                                      force: bool = False,
+                                      json_file: str = "headers_dependencies.json") -> Dict[str, Dict[str, int]]:
         """
-        Parse Boost headers using libclang to build header-to-header dependencies.
+        Scan Boost headers to build header-to-header dependencies.
         
-        This method directly analyzes header files using libclang to extract #include
-        directives and build a dependency graph.
+        Headers are memory-mapped and their #include directives extracted on a
+        process pool (see header_scanner.py). Results are cached per file in
+        cache_file, so only headers whose content changed are lexed again.
+        
+        Without the Boost tree, the last scan of that root is loaded from the
+        cache; if the cache has none, json_file (the original scanner's output,
+        looked up in the working directory, then next to this module) is
+        imported into the cache first.
         
         Args:
             boost_root_path: Path to the Boost installation root (containing boost/ directory)
                            If None, defaults to 'D:\\boost_1_89_0\\boost'
-            libclang_path: Path to libclang library
+            libclang_path: Unused (kept for backward compatibility; includes are lexed directly)
+            workers: Worker processes for the scan (None = one per CPU)
+            cache_file: SQLite per-file include cache
+            force: Re-lex every header, ignoring cached entries
+            json_file: headers_dependencies.json to import when the tree and cache are both missing
             
         Returns:
             Dictionary mapping header paths to their dependencies with relation values
+            
+        Raises:
+            FileNotFoundError: If the Boost tree is missing and neither the cache nor json_file has its headers
         """
         if boost_root_path is None:
             boost_root_path = r'D:\boost_1_89_0\boost'
-        
-        print(f"Parsing Boost headers from: {boost_root_path}")
-        print(f"Using libclang from: {libclang_path}")
-        
-        # Configure libclang
-        cindex.Config.set_library_path(libclang_path)
-        index = cindex.Index.create()
-        
-        # Temporary storage for direct dependencies
-        direct_deps = {}
-        header_count = 0
-        boost_Path = Path(boost_root_path)
-        # Walk through all Boost headers
-        for root, _, files in os.walk(boost_Path):
-            for f in files:
-                if f.endswith('.hpp') or f.endswith('.h'):
-                    cur_header = Path(root) / f
-                    cur_header_str = "boost/" + cur_header.relative_to(boost_Path).as_posix()
-                    self.header_deps[cur_header_str] = {}
-                    path = os.path.join(root, f)
-                    
-                    with open(path, encoding='utf-8') as header_file:
-                        header_content = header_file.read()
-                    header_content = re.sub(r"/\*.*?\*/", "", header_content, flags=re.DOTALL)
-                    for line in header_content.split("\n"):
-                        if line.startswith("//") or line.startswith("/*"):
-                            continue
-                        if line.startswith("``"):
-                            continue
-                        m = re.search(r'#include\s+[<"](.+?)[">]', line)
-                        if m:
-                            header_name = m.group(1)
-                            header_name = header_name.replace("//", "/")
-                            if "boost/" in header_name and ".h" in header_name:
-                                self.header_deps[cur_header_str][header_name] = 1
-                                
-        print(f"Successfully parsed {header_count} headers")
-        file_name = "headers_dependencies.json"
-        with open(file_name, "w", encoding="utf-8") as f:
-            json.dump(self.header_deps, f, indent=4)
+        boost_path = Path(boost_root_path)
+        
+        with HeaderCache(Path(cache_file)) as cache:
+            if not boost_path.exists():
+                self.header_deps = cache.load(boost_path)
+                if self.header_deps:
+                    print(f"Warning: Boost tree {boost_root_path} not found; "
+                          f"loaded {len(self.header_deps)} cached headers from {cache_file}")
+                    return self.header_deps
+                
+                json_path = next((p for p in (Path(json_file), Path(__file__).parent / json_file)
+                                  if p.exists()), None)
+                if json_path is None:
+                    raise FileNotFoundError(
+                        f"Boost tree {boost_root_path} not found, and neither {cache_file} "
+                        f"nor {json_file} has its header dependencies")
+                with open(json_path, "r", encoding="utf-8") as f:
+                    cache.import_header_deps(boost_path, json.load(f))
+                self.header_deps = cache.load(boost_path)
+                print(f"Warning: Boost tree {boost_root_path} not found; "
+                      f"imported {len(self.header_deps)} headers from {json_path} into {cache_file}")
+                return self.header_deps
+            
+            print(f"Parsing Boost headers from: {boost_root_path}")
+            self.header_deps = cache.scan(boost_path, workers=workers, force=force)
+        print(f"Successfully parsed {len(self.header_deps)} headers")
+        return self.header_deps
         
     
     def _build_module_relations(self) -> None:
@@ -313,12 +302,12 @@ class BoostDependencyAnalyzer:
             Count of transitive relations
         """
         initial_deps = relation_dict.get(source, {})
-        relation_list = [name for name, rel_value in initial_deps.items() if rel_value == target_value]
+        relation_list = deque(name for name, rel_value in initial_deps.items() if rel_value == target_value)
         seen_items = set(relation_list)
         count = 0
         
         while relation_list:
-            next_item = relation_list.pop(0)
+            next_item = relation_list.popleft()
             for item_name, rel_value in relation_dict.get(next_item, {}).items():
                 if rel_value == target_value and item_name not in seen_items:
                     count += 1
@@ -327,6 +316,23 @@ class BoostDependencyAnalyzer:
         
         return count
     
+    def module_reaches(self, module_a: str, module_b: str, relation_value: int = 1) -> bool:
+        """
+        Check whether module_a transitively reaches module_b in O(1).
+        
+        Args:
+            module_a: Source module
+            module_b: Target module
+            relation_value: 1 to follow Primary relations, -1 to follow Reverse relations
+            
+        Returns:
+            True if a chain of relations with relation_value leads from module_a to module_b
+        """
+        if relation_value not in self.module_reachability:
+            self.module_reachability[relation_value] = \
+                ReachabilityIndex.from_relation(self.module_relation, relation_value)
+        return self.module_reachability[relation_value].reaches(module_a, module_b)
+    
     def count_negative_relations_by_module(self) -> Dict[str, Dict[str, int]]:
         """
         Count the number of relations with value = -1 and 1 for each module.
@@ -348,12 +354,17 @@ class BoostDependencyAnalyzer:
                 "Reverse_total": reverse_level_1
             }
         
-        # Calculate transitive counts
+        # Calculate transitive counts: every node reachable from the module, from one
+        # reachability index per direction (same result as _count_transitive_relations)
+        self.module_reachability = {
+            1: ReachabilityIndex.from_relation(self.module_relation, 1),
+            -1: ReachabilityIndex.from_relation(self.module_relation, -1),
+        }
         for mod_name in self.module_relation:
-            self.module_relation_count[mod_name]["Primary_total"] += \
-                self._count_transitive_relations(self.module_relation, mod_name, 1)
-            self.module_relation_count[mod_name]["Reverse_total"] += \
-                self._count_transitive_relations(self.module_relation, mod_name, -1)
+            self.module_relation_count[mod_name]["Primary_total"] = \
+                self.module_reachability[1].reachable_count(mod_name)
+            self.module_relation_count[mod_name]["Reverse_total"] = \
+                self.module_reachability[-1].reachable_count(mod_name)
         
         return self.module_relation_count
     
@@ -386,12 +397,16 @@ class BoostDependencyAnalyzer:
                 "Reverse_total": reverse_level_1
             }
         
-        # Calculate transitive counts
+        # Calculate transitive counts (see count_negative_relations_by_module)
+        self.header_reachability = {
+            1: ReachabilityIndex.from_relation(target_data, 1),
+            -1: ReachabilityIndex.from_relation(target_data, -1),
+        }
         for hdr_name in target_data:
-            self.header_relation_count[hdr_name]["Primary_total"] += \
-                self._count_transitive_relations(target_data, hdr_name, 1)
-            self.header_relation_count[hdr_name]["Reverse_total"] += \
-                self._count_transitive_relations(target_data, hdr_name, -1)
+            self.header_relation_count[hdr_name]["Primary_total"] = \
+                self.header_reachability[1].reachable_count(hdr_name)
+            self.header_relation_count[hdr_name]["Reverse_total"] = \
+                self.header_reachability[-1].reachable_count(hdr_name)
         
                 
         return self.header_relation_count
@@ -0,0 +1,193 @@
+"""
+Shared Dependency Graph Loader
+
+This module parses boost_modules_dependencies.csv once into an integer-indexed
+graph and caches it as a compact binary file, so every BoostDepth tool loads
+the same module and header ids in milliseconds instead of re-parsing the CSV.
+
+Graph contents:
+- Modules and headers are numbered by sorted name
+- Module edges (Module_A, Module_B, operation) and header edges (From header
+  includes Header) in CSV order, without duplicates, as parallel id arrays
+
+The cache lives in .graph_cache/ next to the CSV and is keyed by the CSV's
+SHA-256, so editing or re-exporting the CSV rebuilds it automatically.
+"""
+
+import csv
+import hashlib
+import os
+import pickle
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import DefaultDict, Dict, Iterator, List, Optional, Set, Tuple
+
+CACHE_VERSION = 3
+CACHE_DIR_NAME = ".graph_cache"
+
+PRIMARY = 0
+REVERSE = 1
+OPERATION_NAMES = ("Primary", "Reverse")
+
+
+class DependencyGraph:
+    """Integer-indexed module and header edge lists of boost_modules_dependencies.csv."""
+
+    def __init__(self, modules: List[str], headers: List[str],
+                 module_edges: Tuple[array, array, array], header_edges: Tuple[array, array]):
+        """
+        Args:
+            modules: Module names, index = module id
+            headers: Header paths, index = header id
+            module_edges: (source ids, target ids, operations) in CSV order
+            header_edges: (including header ids, included header ids) in CSV order
+        """
+        self.modules = modules
+        self.headers = headers
+        self.module_ids: Dict[str, int] = {name: i for i, name in enumerate(modules)}
+        self.header_ids: Dict[str, int] = {name: i for i, name in enumerate(headers)}
+        self.module_edges = module_edges
+        self.header_edges = header_edges
+
+    @classmethod
+    def from_csv(cls, csv_path: Path) -> 'DependencyGraph':
+        """Parse the boostdep CSV export."""
+        module_rows: List[Tuple[str, str, int]] = []
+        header_rows: List[Tuple[str, str]] = []
+        seen_module_rows: Set[Tuple[str, str, int]] = set()
+        seen_header_rows: Set[Tuple[str, str]] = set()
+
+        with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                if not row or len(row) < 4:
+                    continue
+                operation, module_a, module_b = row[0].strip().lower(), row[1].strip(), row[2].strip()
+                if not module_a or not module_b or operation not in ('primary', 'reverse'):
+                    continue
+                key = (module_a, module_b, PRIMARY if operation == 'primary' else REVERSE)
+                if key not in seen_module_rows:
+                    seen_module_rows.add(key)
+                    module_rows.append(key)
+
+                sub_header = row[3].strip()
+                from_headers = row[4] if len(row) > 4 else ''
+                if sub_header and from_headers:
+                    for from_header in from_headers.split():
+                        pair = (from_header, sub_header)
+                        if pair not in seen_header_rows:
+                            seen_header_rows.add(pair)
+                            header_rows.append(pair)
+
+        modules = sorted({m for a, b, _ in module_rows for m in (a, b)})
+        headers = sorted({h for pair in header_rows for h in pair})
+        module_ids = {name: i for i, name in enumerate(modules)}
+        header_ids = {name: i for i, name in enumerate(headers)}
+        module_edges = (array('i', (module_ids[a] for a, _, _ in module_rows)),
+                        array('i', (module_ids[b] for _, b, _ in module_rows)),
+                        array('b', (op for _, _, op in module_rows)))
+        header_edges = (array('i', (header_ids[a] for a, _ in header_rows)),
+                        array('i', (header_ids[b] for _, b in header_rows)))
+        return cls(modules, headers, module_edges, header_edges)
+
+    def iter_module_edges(self) -> Iterator[Tuple[str, str, str]]:
+        """(Module_A, Module_B, "Primary"/"Reverse") in CSV order."""
+        modules = self.modules
+        for source, target, operation in zip(*self.module_edges):
+            yield modules[source], modules[target], OPERATION_NAMES[operation]
+
+    def iter_header_edges(self) -> Iterator[Tuple[str, str]]:
+        """(From header, Header) include pairs in CSV order."""
+        headers = self.headers
+        for including, included in zip(*self.header_edges):
+            yield headers[including], headers[included]
+
+    def to_adjacency_sets(self) -> Tuple[DefaultDict[str, Set[str]], DefaultDict[str, Set[str]]]:
+        """
+        Dict-of-sets view used by make-dependency.py.
+
+        Returns:
+            (forward_deps, reverse_deps): module -> set(dependency) from Primary rows,
+            module -> set(dependent) from Reverse rows
+        """
+        forward_deps: DefaultDict[str, Set[str]] = defaultdict(set)
+        reverse_deps: DefaultDict[str, Set[str]] = defaultdict(set)
+        modules = self.modules
+        for source, target, operation in zip(*self.module_edges):
+            deps = forward_deps if operation == PRIMARY else reverse_deps
+            deps[modules[source]].add(modules[target])
+        return forward_deps, reverse_deps
+
+    # ----- cache -----
+
+    def _state(self) -> Dict:
+        return {
+            'version': CACHE_VERSION,
+            'modules': self.modules,
+            'headers': self.headers,
+            'module_edges': self.module_edges,
+            'header_edges': self.header_edges,
+        }
+
+
+def _csv_sha256(csv_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_path(csv_path: Path, csv_hash: Optional[str] = None) -> Path:
+    """Cache file of a CSV: .graph_cache/<csv stem>.<sha256 prefix>.v<version>.pickle next to it."""
+    csv_path = Path(csv_path)
+    csv_hash = csv_hash or _csv_sha256(csv_path)
+    return csv_path.parent / CACHE_DIR_NAME / f"{csv_path.stem}.{csv_hash[:16]}.v{CACHE_VERSION}.pickle"
+
+
+def load_dependency_graph(csv_path: Optional[str] = None, use_cache: bool = True) -> DependencyGraph:
+    """
+    Load the dependency graph of a boostdep CSV, from the binary cache when it is current.
+
+    Args:
+        csv_path: Path to boost_modules_dependencies.csv (default: BoostDepth/ directory)
+        use_cache: Read and write the cache (False always parses the CSV)
+
+    Returns:
+        DependencyGraph
+    """
+    if csv_path is None:
+        csv_path = Path(__file__).parent.parent / "boost_modules_dependencies.csv"
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    if not use_cache:
+        return DependencyGraph.from_csv(csv_path)
+
+    cache_file = cache_path(csv_path)
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                state = pickle.load(f)
+            if state.get('version') == CACHE_VERSION:
+                return DependencyGraph(state['modules'], state['headers'],
+                                       state['module_edges'], state['header_edges'])
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+            pass  # Unreadable cache: rebuild below
+
+    graph = DependencyGraph.from_csv(csv_path)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(graph._state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        # Drop caches of earlier versions of the same CSV
+        for stale in cache_file.parent.glob(f"{csv_path.stem}.*.pickle"):
+            if stale != cache_file:
+                stale.unlink()
+    except OSError as e:
+        print(f"Warning: could not write graph cache {cache_file}: {e}")
+    return graph
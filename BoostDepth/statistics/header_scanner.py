@@ -0,0 +1,281 @@
+"""
+Boost Header Include Scanner
+
+This module extracts header-to-header #include dependencies from a Boost tree
+for BoostDependencyAnalyzer.get_header_relation_by_header().
+
+- HeaderCache.scan() lists files once (os.walk order) and hashes and lexes them
+  on a process pool in chunks
+- Each file is memory-mapped; files without "#include" are skipped without copying,
+  and one multiline regex replaces the per-line re.search loop
+- Results are merged in listing order, so output is identical to a serial scan
+- HeaderCache keeps a per-file cache in SQLite (headers_dependencies.sqlite next
+  to this module): (Boost root, header) -> size, mtime, content hash, and content
+  hash -> includes. Headers whose size and mtime are unchanged are not read;
+  changed headers are hashed, and only content not seen before (under any root)
+  is lexed again
+- A headers_dependencies.json written by the original scanner can be imported
+  into the cache for a Boost tree that is not available locally
+
+Extraction rules (unchanged from the original line-by-line scanner):
+- /* ... */ comments are removed first
+- Lines starting with //, /* or `` are ignored
+- The first `#include <...>` or `#include "..."` on a line is taken; "//" in the
+  name is collapsed, and only names containing "boost/" and ".h" are kept
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SCANNER_VERSION = 1
+DEFAULT_CACHE_FILE = Path(__file__).parent / "headers_dependencies.sqlite"
+HEADER_EXTENSIONS = ('.hpp', '.h')
+_SQL_BATCH = 500
+
+_BLOCK_COMMENT = re.compile(rb"/\*.*?\*/", re.DOTALL)
+# First include of each line that does not start with //, /* or ``
+_INCLUDE_LINE = re.compile(rb'^(?!//|/\*|``)[^\n]*?#include[ \t\r\f\v]+[<"]([^\n]+?)[">]', re.MULTILINE)
+
+
+def list_headers(boost_root: Path) -> List[Tuple[str, str]]:
+    """
+    List header files under boost_root in os.walk order.
+
+    Returns:
+        (header key "boost/<relative path>", filesystem path) pairs
+    """
+    boost_root = Path(boost_root)
+    headers = []
+    for root, _, files in os.walk(boost_root):
+        for f in files:
+            if f.endswith(HEADER_EXTENSIONS):
+                path = Path(root) / f
+                headers.append(("boost/" + path.relative_to(boost_root).as_posix(), str(path)))
+    return headers
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scan_includes(path: str) -> List[str]:
+    """Boost headers included by one file, in order of appearance."""
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            return []
+    with data:
+        if data.find(b"#include") == -1:
+            return []
+        text = _BLOCK_COMMENT.sub(b"", data) if data.find(b"/*") != -1 else data
+        includes = []
+        for match in _INCLUDE_LINE.finditer(text):
+            name = match.group(1).decode('utf-8', errors='replace').replace("//", "/")
+            if "boost/" in name and ".h" in name:
+                includes.append(name)
+        return includes
+
+
+def _scan_chunk(paths: List[str]) -> List[List[str]]:
+    return [scan_includes(path) for path in paths]
+
+
+def _hash_chunk(paths: List[str]) -> List[str]:
+    return [file_sha256(path) for path in paths]
+
+
+def _map_chunks(func: Callable[[List[str]], List[Any]], paths: List[str],
+                workers: Optional[int], chunk_size: int) -> List[Any]:
+    """Apply a chunk function to paths, in parallel when workers > 1; results in input order."""
+    workers = workers or os.cpu_count() or 1
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [result for chunk in pool.map(func, chunks) for result in chunk]
+    return [result for chunk in chunks for result in func(chunk)]
+
+
+class HeaderCache:
+    """
+    Per-file include cache in SQLite.
+
+    Tables:
+    - files: (root, header) -> position in listing order, size, mtime_ns, sha256
+    - contents: sha256 -> includes (newline-separated)
+
+    Rows of files belong to one resolved Boost root, so switching between Boost
+    releases keeps each release's entries; contents are shared between roots.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        conn = self.conn
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'scanner_version'").fetchone()
+        if row is None or row[0] != str(SCANNER_VERSION):
+            # Extraction rules changed: cached includes are stale
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS contents;")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('scanner_version', ?)",
+                         (str(SCANNER_VERSION),))
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                root TEXT NOT NULL,
+                header TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                PRIMARY KEY (root, header)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS contents (
+                sha256 TEXT PRIMARY KEY,
+                includes TEXT NOT NULL
+            ) WITHOUT ROWID;
+        """)
+        conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'HeaderCache':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def root_key(boost_root: Path) -> str:
+        return str(Path(boost_root).resolve())
+
+    def _lookup_includes(self, hashes: List[str]) -> Dict[str, List[str]]:
+        """Cached includes of the given content hashes."""
+        found: Dict[str, List[str]] = {}
+        for i in range(0, len(hashes), _SQL_BATCH):
+            batch = hashes[i:i + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for sha, includes in self.conn.execute(
+                    f"SELECT sha256, includes FROM contents WHERE sha256 IN ({placeholders})", batch):
+                found[sha] = includes.split("\n") if includes else []
+        return found
+
+    def load(self, boost_root: Path) -> Dict[str, Dict[str, int]]:
+        """Header dependencies last scanned under boost_root, without touching the tree."""
+        header_deps: Dict[str, Dict[str, int]] = {}
+        rows = self.conn.execute(
+            "SELECT f.header, c.includes FROM files f JOIN contents c ON c.sha256 = f.sha256 "
+            "WHERE f.root = ? ORDER BY f.position", (self.root_key(boost_root),))
+        for header, includes in rows:
+            header_deps[header] = dict.fromkeys(includes.split("\n"), 1) if includes else {}
+        return header_deps
+
+    def import_header_deps(self, boost_root: Path, header_deps: Dict[str, Dict[str, int]]) -> None:
+        """
+        Store header dependencies scanned elsewhere (e.g. headers_dependencies.json) for boost_root.
+
+        Imported rows have no size or mtime, so a later scan of a real tree at
+        that root hashes every header and replaces them.
+        """
+        root = self.root_key(boost_root)
+        contents: Dict[str, str] = {}
+        files = []
+        for i, (header, includes) in enumerate(header_deps.items()):
+            text = "\n".join(includes)
+            sha = "import:" + hashlib.sha256(text.encode('utf-8')).hexdigest()
+            contents[sha] = text
+            files.append((root, header, i, -1, -1, sha))
+        conn = self.conn
+        with conn:
+            conn.execute("DELETE FROM files WHERE root = ?", (root,))
+            conn.executemany("INSERT OR REPLACE INTO contents (sha256, includes) VALUES (?, ?)",
+                             contents.items())
+            conn.executemany(
+                "INSERT INTO files (root, header, position, size, mtime_ns, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+                files)
+            conn.execute("DELETE FROM contents WHERE sha256 NOT IN (SELECT sha256 FROM files)")
+
+    def scan(self, boost_root: Path, workers: Optional[int] = None, chunk_size: int = 256,
+             force: bool = False) -> Dict[str, Dict[str, int]]:
+        """
+        Scan boost_root, re-lexing only headers whose content is not cached.
+
+        Args:
+            boost_root: Boost header directory
+            workers: Worker processes (None = one per CPU, 1 = serial)
+            chunk_size: Files per task
+            force: Ignore cached entries and re-lex every header
+
+        Returns:
+            header key -> {included header: 1}, in listing order
+        """
+        root = self.root_key(boost_root)
+        headers = list_headers(boost_root)
+        cached = {
+            header: (size, mtime_ns, sha)
+            for header, size, mtime_ns, sha in self.conn.execute(
+                "SELECT header, size, mtime_ns, sha256 FROM files WHERE root = ?", (root,))
+        }
+
+        # 1. Unchanged size and mtime: reuse the stored hash; otherwise hash the file
+        stats = [os.stat(path) for _, path in headers]
+        hashes: List[Optional[str]] = []
+        changed: List[int] = []
+        for i, ((key, _), stat) in enumerate(zip(headers, stats)):
+            entry = None if force else cached.get(key)
+            if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+                hashes.append(entry[2])
+            else:
+                hashes.append(None)
+                changed.append(i)
+        for i, sha in zip(changed, _map_chunks(_hash_chunk, [headers[i][1] for i in changed],
+                                               workers, chunk_size)):
+            hashes[i] = sha
+
+        # 2. Lex content not seen before
+        unique_hashes = list(dict.fromkeys(hashes))
+        known = {} if force else self._lookup_includes(unique_hashes)
+        to_lex: Dict[str, str] = {}
+        for (_, path), sha in zip(headers, hashes):
+            if sha not in known and sha not in to_lex:
+                to_lex[sha] = path
+        lexed = _map_chunks(_scan_chunk, list(to_lex.values()), workers, chunk_size)
+        new_contents = dict(zip(to_lex, lexed))
+        known.update(new_contents)
+        print(f"Header cache: {len(headers) - len(changed)} unchanged, {len(changed)} hashed, "
+              f"{len(to_lex)} lexed")
+
+        # 3. Store entries of this root and drop headers that no longer exist
+        conn = self.conn
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO contents (sha256, includes) VALUES (?, ?)",
+                             [(sha, "\n".join(includes)) for sha, includes in new_contents.items()])
+            conn.executemany(
+                "INSERT OR REPLACE INTO files (root, header, position, size, mtime_ns, sha256) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(root, key, i, stat.st_size, stat.st_mtime_ns, sha)
+                 for i, ((key, _), stat, sha) in enumerate(zip(headers, stats, hashes))])
+            current = {key for key, _ in headers}
+            stale = [(root, header) for header in cached if header not in current]
+            conn.executemany("DELETE FROM files WHERE root = ? AND header = ?", stale)
+            if stale or new_contents:
+                conn.execute("DELETE FROM contents WHERE sha256 NOT IN (SELECT sha256 FROM files)")
+
+        header_deps: Dict[str, Dict[str, int]] = {}
+        for (key, _), sha in zip(headers, hashes):
+            header_deps[key] = dict.fromkeys(known[sha], 1)
+        return header_deps
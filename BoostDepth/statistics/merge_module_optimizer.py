@@ -9,6 +9,9 @@ import argparse
 from typing import Dict, List, Tuple
 from pathlib import Path
 
+from merge_scoring import HAVE_NUMPY, IncidenceScorer, iter_combination_batches
+from merge_search import MergeSearch
+
 
 class MergeModuleOptimizer:
     """
@@ -41,6 +44,8 @@ class MergeModuleOptimizer:
         self.selected_nodes: List[str] = []
         self.candidate_modules: List[str] = []
         self.current_merge_count: int = merge_count
+        self.search_stats: Dict[str, int] = {}
+        self.scorer: IncidenceScorer = None
     
     def _count_shared_relations(self, 
                                 relation_dict: Dict[str, Dict[str, int]], 
@@ -231,13 +236,22 @@ class MergeModuleOptimizer:
             
             self.selected_nodes.pop()
     
-    def calculate_all_module_damages(self, merge_count_range: Tuple[int, int] = None, candidate_count: int = 30) -> Dict[Tuple[str, ...], Dict[str, int]]:
+    def calculate_all_module_damages(self, merge_count_range: Tuple[int, int] = None, candidate_count: int = 30,
+                                     top_n: int = 10, exhaustive: bool = False) -> Dict[Tuple[str, ...], Dict[str, int]]:
         """
-        Calculate merge damages for all combinations of modules across multiple merge counts.
+        Calculate merge damages for the best combinations of modules across multiple merge counts.
+        
+        By default a branch-and-bound search (merge_search.py) keeps only the top_n
+        combinations by edge reduction for each merge count, which is all that
+        get_best_module_merges() reports; with exhaustive=True every combination is
+        enumerated and stored.
         
         Args:
             merge_count_range: Tuple of (min_merge_count, max_merge_count). 
                              If None, uses self.merge_count only.
+            candidate_count: Number of candidate modules (most dependents first)
+            top_n: Combinations kept per merge count by the search
+            exhaustive: Enumerate every combination instead of searching
         
         Returns:
             Dictionary mapping module tuples to their damage metrics
@@ -245,40 +259,89 @@ class MergeModuleOptimizer:
         self.module_merge_damages = {}
         self.candidate_modules = []
         self.selected_nodes = []
+        self.search_stats = {"nodes": 0, "pruned": 0, "evaluated": 0}
         
-        # Select top 20 modules by Reverse_level_1 count (most dependents)
+        # Select top modules by Reverse_level_1 count (most dependents)
         modules_with_reverse = []
         for module in self.module_relation.keys():
             reverse_count = self.module_relation_count[module]["Reverse_level_1"]
             if reverse_count > 0:
                 modules_with_reverse.append((module, reverse_count))
         
-        # Sort by reverse count (descending) and take top 20
+        # Sort by reverse count (descending) and take top candidates
         modules_with_reverse.sort(key=lambda x: x[1], reverse=True)
         self.candidate_modules = [module for module, _ in modules_with_reverse[:candidate_count]]
         
         print(f"Selected top {candidate_count} candidate modules for merging (by Reverse_level_1 count)")
         print(f"Top candidates: {', '.join(self.candidate_modules[:5])}...")
         
-        # Calculate damages for each merge count in range
         if merge_count_range:
             min_count, max_count = merge_count_range
             print(f"\nCalculating merge strategies for merge counts {min_count} to {max_count}...")
-            
-            for count in range(min_count, max_count + 1):
-                self.current_merge_count = count
-                self.selected_nodes = []
-                print(f"  Processing merge count {count}...")
-                self.calculate_merge_damage(depth=1, last_index=-1)
-            
-            print(f"\nTotal strategies found: {len(self.module_merge_damages)}")
         else:
             # Single merge count (backward compatibility)
-            self.current_merge_count = self.merge_count
-            self.calculate_merge_damage(depth=1, last_index=-1)
+            min_count = max_count = self.merge_count
+        
+        # Batch scoring with NumPy incidence matrices when available (same metrics, merge_scoring.py)
+        self.scorer = (IncidenceScorer(self.module_relation, self.module_relation_count, self.candidate_modules)
+                       if HAVE_NUMPY else None)
+        search = None if exhaustive else MergeSearch(self.module_relation, self.candidate_modules)
+        for count in range(min_count, max_count + 1):
+            self.current_merge_count = count
+            self.selected_nodes = []
+            if merge_count_range:
+                print(f"  Processing merge count {count}...")
+            if search is None:
+                before = len(self.module_merge_damages)
+                if self.scorer is not None:
+                    self._store_damages(iter_combination_batches(len(self.candidate_modules), count))
+                else:
+                    self.calculate_merge_damage(depth=1, last_index=-1)
+                self.search_stats["evaluated"] += len(self.module_merge_damages) - before
+                continue
+            # Stored in enumeration order so get_best_module_merges() breaks ties like the exhaustive search
+            found = sorted([self.candidate_modules.index(m) for m in modules]
+                           for _, modules in search.search(count, top_n))
+            if self.scorer is not None:
+                self._store_damages([found] if found else [])
+            else:
+                for indices in found:
+                    modules = [self.candidate_modules[i] for i in indices]
+                    self.module_merge_damages[tuple(sorted(modules))] = self.calculate_merge_damage_for_modules(modules)
+        if search is not None:
+            self.search_stats = dict(search.stats)
+        
+        if merge_count_range:
+            print(f"\nTotal strategies found: {len(self.module_merge_damages)} "
+                  f"({self.search_stats['evaluated']} evaluated, {self.search_stats['pruned']} branches pruned)")
         
         return self.module_merge_damages
     
+    def _store_damages(self, batches) -> None:
+        """Score batches of candidate index combinations with the incidence scorer and store them."""
+        candidates = self.candidate_modules
+        for batch in batches:
+            for indices, damage in zip(batch, self.scorer.damages(batch)):
+                self.module_merge_damages[tuple(sorted(candidates[i] for i in indices))] = damage
+    
+    def _edge_reductions(self, module_groups: List[Tuple[str, ...]]) -> List[int]:
+        """edge_reduction of each group, in one batch per merge count when the scorer covers the groups."""
+        reductions = [None] * len(module_groups)
+        if self.scorer is not None:
+            by_count: Dict[int, List[int]] = {}
+            for position, modules in enumerate(module_groups):
+                if all(m in self.scorer.index for m in modules):
+                    by_count.setdefault(len(modules), []).append(position)
+            for positions in by_count.values():
+                batch = [self.scorer.indices(module_groups[p]) for p in positions]
+                values = self.scorer.edge_metric_arrays(batch)['edge_reduction'].tolist()
+                for position, value in zip(positions, values):
+                    reductions[position] = value
+        return [
+            value if value is not None else self._calculate_edge_metrics(modules)['edge_reduction']
+            for modules, value in zip(module_groups, reductions)
+        ]
+    
     def get_best_module_merges(self, top_n: int = 10) -> List[Tuple[Tuple[str, ...], Dict[str, int]]]:
         """
         Get the best module merge candidates sorted by edge reduction.
@@ -293,10 +356,11 @@ class MergeModuleOptimizer:
             self.calculate_all_module_damages()
         
         # Sort by edge reduction (higher reduction = better)
-        sorted_merges = sorted(
-            self.module_merge_damages.items(),
-            key=lambda x: -self._calculate_edge_metrics(x[0])['edge_reduction']
-        )
+        items = list(self.module_merge_damages.items())
+        reductions = self._edge_reductions([modules for modules, _ in items])
+        sorted_merges = [
+            item for _, item in sorted(zip(reductions, items), key=lambda x: -x[0])
+        ]
         # sorted_merges = sorted(
         #     self.module_merge_damages.items(),
         #     key=lambda x: -x[1]['total_damage']
@@ -434,6 +498,8 @@ class MergeModuleOptimizer:
         
         return {
             "total_module_combinations": len(self.module_merge_damages),
+            "combinations_evaluated": self.search_stats.get("evaluated", len(self.module_merge_damages)),
+            "branches_pruned": self.search_stats.get("pruned", 0),
             "modules_analyzed": len(self.module_relation),
         }
 
@@ -448,6 +514,8 @@ def main():
         --max-merge: Maximum merge count (default: 5)
         --top-n: Number of top recommendations to display (default: 10)
         --output: Output markdown file path
+        --candidate-count: Number of candidate modules (default: 40)
+        --exhaustive: Enumerate every combination instead of the branch-and-bound search
     """
     parser = argparse.ArgumentParser(
         description="Find optimal merge candidates for Boost modules across multiple merge counts"
@@ -488,6 +556,11 @@ def main():
         default=40,
         help="Number of candidate modules to consider for merging (default: 40)"
     )
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Enumerate every combination instead of the branch-and-bound search (slow for large counts)"
+    )
     
     args = parser.parse_args()
     
@@ -514,7 +587,9 @@ def main():
     
     # Calculate damages across all merge counts
     print("Calculating module merge damages across all merge counts...")
-    optimizer.calculate_all_module_damages(merge_count_range=(args.min_merge, args.max_merge), candidate_count=args.candidate_count)
+    optimizer.calculate_all_module_damages(merge_count_range=(args.min_merge, args.max_merge),
+                                           candidate_count=args.candidate_count,
+                                           top_n=args.top_n, exhaustive=args.exhaustive)
     
     # Print statistics
     stats = optimizer.get_merge_statistics()
@@ -523,7 +598,8 @@ def main():
     print("=" * 80)
     print(f"  Modules analyzed: {stats['modules_analyzed']}")
     print(f"  Merge count range: {args.min_merge} to {args.max_merge}")
-    print(f"  Total merge strategies evaluated: {stats['total_module_combinations']}")
+    print(f"  Total merge strategies evaluated: {stats['combinations_evaluated']}")
+    print(f"  Search branches pruned: {stats['branches_pruned']}")
     print("=" * 80)
     print()
     
@@ -0,0 +1,245 @@
+"""
+Vectorized Merge Scoring
+
+This module computes MergeModuleOptimizer's merge damage and edge metrics for
+whole batches of module combinations with NumPy, instead of building dicts and
+sets of targets for every combination.
+
+Encoding (rows = candidate modules, columns = every related module and every
+candidate):
+- primary[i, t]: module_relation[candidate i][t] == 1
+- reverse[i, t]: module_relation[candidate i][t] == -1
+- related[i, t]: t is a key of module_relation[candidate i] (any value)
+
+A batch of combinations is an integer array of shape (batch, merge_count).
+Summing the selected rows gives, per combination and target, how many merged
+modules have the relation; shared / unique / unshared counts are column counts
+of that sum, and the merged edge set is the OR of the related rows without the
+merged modules' own columns.
+
+Run this module directly to benchmark it against the per-combination Python
+code for merge counts 2-5:
+
+    python merge_scoring.py --candidate-count 30 --max-merge 5
+"""
+
+import argparse
+import time
+from itertools import combinations
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: MergeModuleOptimizer falls back to per-combination scoring
+    np = None
+
+HAVE_NUMPY = np is not None
+DEFAULT_BATCH_SIZE = 8192
+
+
+class IncidenceScorer:
+    """Merge damage and edge metrics of candidate module combinations, computed in batches."""
+
+    def __init__(self,
+                 module_relation: Dict[str, Dict[str, int]],
+                 module_relation_count: Dict[str, Dict[str, int]],
+                 candidates: Sequence[str]):
+        """
+        Args:
+            module_relation: Module-to-module relations from BoostDependencyAnalyzer
+            module_relation_count: Relation counts for modules
+            candidates: Modules that combinations are drawn from (row order)
+        """
+        if np is None:
+            raise ImportError("IncidenceScorer requires numpy (pip install numpy)")
+        self.candidates = list(candidates)
+        self.index = {name: i for i, name in enumerate(self.candidates)}
+
+        # Candidate i is column i, so combinations index rows and columns alike
+        columns: Dict[str, int] = {name: i for i, name in enumerate(self.candidates)}
+        for name in self.candidates:
+            for target in module_relation.get(name, {}):
+                columns.setdefault(target, len(columns))
+
+        shape = (len(self.candidates), len(columns))
+        self.primary = np.zeros(shape, dtype=bool)
+        self.reverse = np.zeros(shape, dtype=bool)
+        self.related = np.zeros(shape, dtype=bool)
+        for i, name in enumerate(self.candidates):
+            for target, value in module_relation.get(name, {}).items():
+                column = columns[target]
+                self.related[i, column] = True
+                if value == 1:
+                    self.primary[i, column] = True
+                elif value == -1:
+                    self.reverse[i, column] = True
+
+        counts = [module_relation_count.get(name, {}) for name in self.candidates]
+        self.primary_level_1 = np.array([c.get("Primary_level_1", 0) for c in counts], dtype=np.int64)
+        self.reverse_level_1 = np.array([c.get("Reverse_level_1", 0) for c in counts], dtype=np.int64)
+        self.edge_counts = np.array([len(module_relation.get(name, {})) for name in self.candidates], dtype=np.int64)
+
+    def indices(self, modules: Iterable[str]) -> List[int]:
+        """Row indices of candidate modules."""
+        return [self.index[name] for name in modules]
+
+    def damage_arrays(self, combos: Any) -> Dict[str, Any]:
+        """
+        calculate_merge_damage_for_modules() metrics for a batch.
+
+        Args:
+            combos: Integer array (batch, merge_count) of candidate indices
+
+        Returns:
+            Metric name -> array of shape (batch,)
+        """
+        combos = np.asarray(combos, dtype=np.intp)
+        primary_hits = self.primary[combos].sum(axis=1)
+        reverse_hits = self.reverse[combos].sum(axis=1)
+
+        shared_primary = (primary_hits >= 2).sum(axis=1)
+        shared_reverse = (reverse_hits >= 2).sum(axis=1)
+        unique_primary = (primary_hits > 0).sum(axis=1)
+        unique_reverse = (reverse_hits > 0).sum(axis=1)
+        unshared_primary = unique_primary - shared_primary
+        unshared_reverse = unique_reverse - shared_reverse
+        primary_damage = unshared_primary / (shared_primary + 1)
+        reverse_damage = unshared_reverse / (shared_reverse + 1)
+
+        return {
+            "primary_damage": primary_damage,
+            "reverse_damage": reverse_damage,
+            "total_damage": primary_damage + reverse_damage,
+            "shared_primary": shared_primary,
+            "shared_reverse": shared_reverse,
+            "unique_primary": unique_primary,
+            "unique_reverse": unique_reverse,
+            "unshared_primary": unshared_primary,
+            "unshared_reverse": unshared_reverse,
+            "redundant_primary": self.primary_level_1[combos].sum(axis=1) - unique_primary,
+            "redundant_reverse": self.reverse_level_1[combos].sum(axis=1) - unique_reverse,
+        }
+
+    def edge_metric_arrays(self, combos: Any) -> Dict[str, Any]:
+        """
+        _calculate_edge_metrics() for a batch.
+
+        Args:
+            combos: Integer array (batch, merge_count) of candidate indices
+
+        Returns:
+            Metric name -> array of shape (batch,)
+        """
+        combos = np.asarray(combos, dtype=np.intp)
+        original_edges = self.edge_counts[combos].sum(axis=1)
+        # Relations from one merged module to another (candidate i is column i)
+        internal = self.related[combos[:, :, None], combos[:, None, :]].sum(axis=(1, 2))
+        merged = self.related[combos].any(axis=1)
+        merged[np.arange(len(combos))[:, None], combos] = False
+        merged_edges = merged.sum(axis=1)
+        return {
+            "original_edges": original_edges,
+            "internal_edges": internal // 2,
+            "merged_edges": merged_edges,
+            "edge_reduction": original_edges - merged_edges,
+        }
+
+    @staticmethod
+    def _to_dicts(arrays: Dict[str, Any]) -> List[Dict[str, Any]]:
+        columns = {name: values.tolist() for name, values in arrays.items()}
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    def damages(self, combos: Any) -> List[Dict[str, Any]]:
+        """Damage dicts for a batch, equal to calculate_merge_damage_for_modules()."""
+        return self._to_dicts(self.damage_arrays(combos))
+
+    def edge_metrics(self, combos: Any) -> List[Dict[str, int]]:
+        """Edge metric dicts for a batch, equal to _calculate_edge_metrics()."""
+        return self._to_dicts(self.edge_metric_arrays(combos))
+
+
+def iter_combination_batches(candidate_count: int, merge_count: int,
+                             batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+    """Index arrays (batch, merge_count) of all combinations, in itertools.combinations order."""
+    batch: List[Tuple[int, ...]] = []
+    for combo in combinations(range(candidate_count), merge_count):
+        batch.append(combo)
+        if len(batch) == batch_size:
+            yield np.array(batch, dtype=np.intp)
+            batch = []
+    if batch:
+        yield np.array(batch, dtype=np.intp)
+
+
+# ===== Benchmark against per-combination scoring =====
+
+def benchmark(csv_path: str = None, candidate_count: int = 30,
+              merge_counts: Iterable[int] = range(2, 6)) -> List[Dict[str, Any]]:
+    """
+    Time per-combination and vectorized scoring of every combination, and check they agree.
+
+    Returns:
+        One row per merge count: combinations, python_s, numpy_s, speedup, identical
+    """
+    import contextlib
+    import io
+
+    from boost_dependency_analyzer import BoostDependencyAnalyzer
+    from merge_module_optimizer import MergeModuleOptimizer
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = BoostDependencyAnalyzer(csv_file_path=csv_path)
+        analyzer.read_csv()
+        module_counts = analyzer.count_negative_relations_by_module()
+    optimizer = MergeModuleOptimizer(module_relation=analyzer.module_relation, module_relation_count=module_counts)
+    ranked = sorted((m for m in analyzer.module_relation if module_counts[m]["Reverse_level_1"] > 0),
+                    key=lambda m: module_counts[m]["Reverse_level_1"], reverse=True)
+    candidates = ranked[:candidate_count]
+    scorer = IncidenceScorer(analyzer.module_relation, module_counts, candidates)
+
+    results = []
+    for merge_count in merge_counts:
+        start = time.perf_counter()
+        python_rows = [
+            (optimizer.calculate_merge_damage_for_modules(list(combo)), optimizer._calculate_edge_metrics(combo))
+            for combo in combinations(candidates, merge_count)
+        ]
+        python_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        numpy_rows = []
+        for batch in iter_combination_batches(len(candidates), merge_count):
+            numpy_rows.extend(zip(scorer.damages(batch), scorer.edge_metrics(batch)))
+        numpy_s = time.perf_counter() - start
+
+        results.append({
+            "merge_count": merge_count,
+            "combinations": len(python_rows),
+            "python_s": python_s,
+            "numpy_s": numpy_s,
+            "speedup": python_s / numpy_s if numpy_s else float("inf"),
+            "identical": python_rows == numpy_rows,
+        })
+    return results
+
+
+def main():
+    """Benchmark vectorized merge scoring for merge counts 2-5."""
+    parser = argparse.ArgumentParser(description="Benchmark vectorized merge-damage scoring")
+    parser.add_argument("--csv", type=str, default=None,
+                        help="Path to boost_modules_dependencies.csv (default: parent directory)")
+    parser.add_argument("--candidate-count", type=int, default=30,
+                        help="Number of candidate modules (default: 30)")
+    parser.add_argument("--min-merge", type=int, default=2, help="Smallest merge count (default: 2)")
+    parser.add_argument("--max-merge", type=int, default=5, help="Largest merge count (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'merge':>5} {'combinations':>13} {'python (s)':>11} {'numpy (s)':>10} {'speedup':>8}  identical")
+    for row in benchmark(args.csv, args.candidate_count, range(args.min_merge, args.max_merge + 1)):
+        print(f"{row['merge_count']:>5} {row['combinations']:>13,} {row['python_s']:>11.3f} "
+              f"{row['numpy_s']:>10.3f} {row['speedup']:>7.1f}x  {row['identical']}")
+
+
+if __name__ == "__main__":
+    main()
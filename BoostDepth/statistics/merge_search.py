@@ -0,0 +1,133 @@
+"""
+Branch-and-Bound Merge Search
+
+This module finds the module groups with the highest edge reduction for
+MergeModuleOptimizer without enumerating every combination of candidates.
+
+For a group S of modules with relation sets R_m:
+    edge_reduction(S) = sum(|R_m| for m in S) - |union(R_m) - S|
+
+Search:
+- Combinations are visited depth-first in the same order as the exhaustive
+  enumeration (lexicographic by candidate index)
+- Only the top_n groups are kept, in a min-heap; ties keep the group
+  enumerated first, exactly like the stable sort of the exhaustive search
+- A node (partial group P, m modules still to add) is pruned when an upper
+  bound on edge_reduction of every completion cannot beat the heap minimum
+
+Bound: adding q to a group S raises edge_reduction by
+    |R_q & (union(R_S) | S | {q})| + [q in union(R_S)]
+which is at most min(|R_q|, |R_q & (union(R_P) | P | {q})| + sum of the m - 1
+largest |R_q & (R_q' | {q'})| over other candidates q') + 1. The bound of a node
+is edge_reduction(P) plus the m largest per-candidate bounds.
+
+Relation sets are integer bitsets over all module names.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+
+def _popcount(bits: int) -> int:
+    try:
+        return bits.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(bits).count('1')
+
+
+class MergeSearch:
+    """Top-N module groups by edge reduction among a list of candidates."""
+
+    def __init__(self, relations: Dict[str, Iterable[str]], candidates: List[str]):
+        """
+        Args:
+            relations: module -> related modules (keys of module_relation[module])
+            candidates: Modules that may be merged, in enumeration order
+        """
+        universe: Dict[str, int] = {}
+        for name in list(candidates) + [t for targets in relations.values() for t in targets]:
+            universe.setdefault(name, len(universe))
+
+        self.candidates = list(candidates)
+        self.bits = [1 << universe[name] for name in self.candidates]
+        self.related = [sum(1 << universe[t] for t in set(relations.get(name, ()))) for name in self.candidates]
+        self.sizes = [_popcount(r) for r in self.related]
+
+        count = len(self.candidates)
+        everything = 0
+        for related in self.related:
+            everything |= related
+        # Candidates that some candidate relates to: only those can leave the merged target set
+        self.targeted = [1 if everything & bit else 0 for bit in self.bits]
+        # pair_overlaps[q]: |R_q & (R_q' | {q'})| for every other candidate q', largest first, as prefix sums
+        self.pair_prefix: List[List[int]] = []
+        for q in range(count):
+            overlaps = sorted(
+                (_popcount(self.related[q] & (self.related[o] | self.bits[o])) for o in range(count) if o != q),
+                reverse=True,
+            )
+            prefix = [0]
+            for value in overlaps:
+                prefix.append(prefix[-1] + value)
+            self.pair_prefix.append(prefix)
+
+        self.stats = {"nodes": 0, "pruned": 0, "evaluated": 0}
+
+    def search(self, merge_count: int, top_n: int) -> List[Tuple[int, Tuple[str, ...]]]:
+        """
+        Best groups of merge_count candidates.
+
+        Args:
+            merge_count: Modules per group
+            top_n: Groups to keep
+
+        Returns:
+            (edge_reduction, modules in candidate order), best first; ties in enumeration order
+        """
+        count = len(self.candidates)
+        if merge_count < 1 or top_n < 1 or merge_count > count:
+            return []
+        related, bits, sizes = self.related, self.bits, self.sizes
+        targeted, pair_prefix = self.targeted, self.pair_prefix
+        stats = self.stats
+        heap: List[Tuple[int, int, Tuple[int, ...]]] = []  # (reduction, -sequence, indices)
+        sequence = 0
+        chosen: List[int] = []
+
+        def visit(last: int, union: int, members: int, size_sum: int) -> None:
+            nonlocal sequence
+            stats["nodes"] += 1
+            reduction = size_sum - _popcount(union & ~members)
+            remaining = merge_count - len(chosen)
+            if remaining == 0:
+                stats["evaluated"] += 1
+                sequence += 1
+                entry = (reduction, -sequence, tuple(chosen))
+                if len(heap) < top_n:
+                    heapq.heappush(heap, entry)
+                elif reduction > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+                return
+            start = last + 1
+            if count - start < remaining:
+                return
+            if len(heap) >= top_n:
+                covered = union | members
+                gains = sorted(
+                    (min(sizes[q], _popcount(related[q] & (covered | bits[q])) + pair_prefix[q][remaining - 1])
+                     + (1 if (union & bits[q]) else targeted[q])
+                     for q in range(start, count)),
+                    reverse=True,
+                )
+                # A completion ranks only if it beats the minimum (equal ones were enumerated later)
+                if reduction + sum(gains[:remaining]) <= heap[0][0]:
+                    stats["pruned"] += 1
+                    return
+            for q in range(start, count - remaining + 1):
+                chosen.append(q)
+                visit(q, union | related[q], members | bits[q], size_sum + sizes[q])
+                chosen.pop()
+
+        visit(-1, 0, 0, 0)
+        ranked = sorted(heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [(reduction, tuple(self.candidates[i] for i in indices)) for reduction, _, indices in ranked]
@@ -0,0 +1,167 @@
+"""
+Reachability Index
+
+This module precomputes transitive reachability for a directed graph once, so
+transitive relation counts for every node come from one pass and "does A reach
+B" queries are O(1).
+
+Construction:
+1. Strongly connected components (iterative Tarjan)
+2. The components are visited in reverse topological order (Tarjan emits them
+   that way); each component's reach set is the OR of its successors' members
+   and reach sets, stored as a Python integer bitset over node indices
+"""
+
+from typing import Any, Dict, Iterable, List
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure of a directed graph as per-component bitsets.
+
+    reachable(a) is the set of nodes reachable from a by a path of length >= 1,
+    so a node is in its own set only if it lies on a cycle.
+    """
+
+    def __init__(self, successors: Dict[str, Iterable[str]]):
+        """
+        Args:
+            successors: node -> nodes it has an edge to (targets need not be keys)
+        """
+        nodes: List[str] = list(successors)
+        index: Dict[str, int] = {node: i for i, node in enumerate(nodes)}
+        for targets in successors.values():
+            for target in targets:
+                if target not in index:
+                    index[target] = len(nodes)
+                    nodes.append(target)
+        adjacency: List[List[int]] = [[] for _ in nodes]
+        for node, targets in successors.items():
+            adjacency[index[node]] = [index[target] for target in targets]
+
+        self.nodes = nodes
+        self.index = index
+        self.component = self._strongly_connected_components(adjacency)
+
+        # Tarjan numbers components in reverse topological order: successors first
+        component_count = max(self.component, default=-1) + 1
+        members = [0] * component_count
+        sizes = [0] * component_count
+        for node_id, comp in enumerate(self.component):
+            members[comp] |= 1 << node_id
+            sizes[comp] += 1
+        cyclic = [size > 1 for size in sizes]
+        component_successors: List[set] = [set() for _ in range(component_count)]
+        for node_id, targets in enumerate(adjacency):
+            comp = self.component[node_id]
+            for target in targets:
+                target_comp = self.component[target]
+                if target_comp == comp:
+                    cyclic[comp] = True  # Self-loop or edge inside a cycle
+                else:
+                    component_successors[comp].add(target_comp)
+
+        reach = [0] * component_count
+        for comp in range(component_count):
+            bits = members[comp] if cyclic[comp] else 0
+            for successor in component_successors[comp]:
+                bits |= members[successor] | reach[successor]
+            reach[comp] = bits
+        self._reach = reach
+        self._counts = [_popcount(bits) for bits in reach]
+
+    @classmethod
+    def from_relation(cls, relation_dict: Dict[str, Dict[str, int]], target_value: int) -> 'ReachabilityIndex':
+        """
+        Index the edges of a relation dictionary that carry target_value.
+
+        Args:
+            relation_dict: node -> {related node: relation value}, e.g. module_relation or header_deps
+            target_value: Relation value to follow (1 or -1)
+        """
+        return cls({
+            node: [other for other, value in related.items() if value == target_value]
+            for node, related in relation_dict.items()
+        })
+
+    @staticmethod
+    def _strongly_connected_components(adjacency: List[List[int]]) -> List[int]:
+        """Iterative Tarjan. Returns component id per node, in reverse topological order of components."""
+        node_count = len(adjacency)
+        order = [-1] * node_count
+        low = [0] * node_count
+        component = [-1] * node_count
+        on_stack = [False] * node_count
+        stack: List[int] = []
+        counter = 0
+        component_count = 0
+
+        for root in range(node_count):
+            if order[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, edge_index = work[-1]
+                if edge_index == 0:
+                    order[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                targets = adjacency[node]
+                while edge_index < len(targets):
+                    target = targets[edge_index]
+                    edge_index += 1
+                    if order[target] == -1:
+                        work[-1] = (node, edge_index)
+                        work.append((target, 0))
+                        break
+                    if on_stack[target]:
+                        low[node] = min(low[node], order[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == order[node]:
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component[member] = component_count
+                            if member == node:
+                                break
+                        component_count += 1
+                    continue
+        return component
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True if a path of length >= 1 leads from source to target."""
+        source_id = self.index.get(source)
+        target_id = self.index.get(target)
+        if source_id is None or target_id is None:
+            return False
+        return bool((self._reach[self.component[source_id]] >> target_id) & 1)
+
+    def reachable_count(self, source: str) -> int:
+        """Number of nodes reachable from source."""
+        source_id = self.index.get(source)
+        return 0 if source_id is None else self._counts[self.component[source_id]]
+
+    def reachable(self, source: str) -> List[Any]:
+        """Nodes reachable from source, in index order."""
+        source_id = self.index.get(source)
+        if source_id is None:
+            return []
+        bits = self._reach[self.component[source_id]]
+        result = []
+        while bits:
+            low_bit = bits & -bits
+            result.append(self.nodes[low_bit.bit_length() - 1])
+            bits ^= low_bit
+        return result
+
+
+def _popcount(bits: int) -> int:
+    try:
+        return bits.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(bits).count('1')
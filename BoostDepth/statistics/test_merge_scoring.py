@@ -0,0 +1,59 @@
+"""
+IncidenceScorer must produce exactly the per-combination metrics of
+MergeModuleOptimizer.calculate_merge_damage_for_modules() and
+_calculate_edge_metrics().
+
+Run from BoostDepth/statistics:
+
+    python -m pytest test_merge_scoring.py
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from merge_module_optimizer import MergeModuleOptimizer
+from merge_scoring import IncidenceScorer, iter_combination_batches
+
+
+def random_graph(rng, module_count, density):
+    """module_relation and module_relation_count dicts over m0..m<module_count - 1>."""
+    modules = [f"m{i}" for i in range(module_count)]
+    relations = {}
+    for module in modules:
+        targets = [t for t in modules if t != module and rng.random() < density]
+        relations[module] = {t: rng.choice((1, -1, 0)) for t in targets}
+    counts = {
+        module: {"Primary_level_1": rng.randint(0, 20), "Reverse_level_1": rng.randint(0, 20)}
+        for module in modules
+    }
+    return relations, counts
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batches_match_per_combination_functions(seed):
+    rng = random.Random(seed)
+    relations, counts = random_graph(rng, rng.randint(6, 14), rng.choice((0.0, 0.1, 0.3, 0.6)))
+    candidates = rng.sample(sorted(relations), rng.randint(4, min(8, len(relations))))
+    optimizer = MergeModuleOptimizer(module_relation=relations, module_relation_count=counts)
+    scorer = IncidenceScorer(relations, counts, candidates)
+
+    for merge_count in range(2, min(5, len(candidates)) + 1):
+        combos = list(combinations(candidates, merge_count))
+        damages, edge_metrics = [], []
+        # A small batch size exercises batch boundaries
+        for batch in iter_combination_batches(len(candidates), merge_count, batch_size=7):
+            damages.extend(scorer.damages(batch))
+            edge_metrics.extend(scorer.edge_metrics(batch))
+
+        assert damages == [optimizer.calculate_merge_damage_for_modules(list(combo)) for combo in combos]
+        assert edge_metrics == [optimizer._calculate_edge_metrics(combo) for combo in combos]
+
+
+def test_batches_follow_combinations_order():
+    batches = list(iter_combination_batches(5, 3, batch_size=4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [tuple(row) for batch in batches for row in batch.tolist()] == list(combinations(range(5), 3))
@@ -0,0 +1,65 @@
+"""
+MergeSearch must return exactly what the exhaustive search reports: the top_n
+combinations by edge reduction, ties kept in itertools.combinations order.
+
+Run from BoostDepth/statistics:
+
+    python -m pytest test_merge_search.py
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from merge_module_optimizer import MergeModuleOptimizer
+from merge_search import MergeSearch
+
+
+def random_relations(rng, module_count, density):
+    """module_relation-style dict over m0..m<module_count - 1> with values 1 / -1 / 0."""
+    modules = [f"m{i}" for i in range(module_count)]
+    relations = {}
+    for module in modules:
+        targets = [t for t in modules if t != module and rng.random() < density]
+        relations[module] = {t: rng.choice((1, -1, 0)) for t in targets}
+    return relations
+
+
+def exhaustive_top(relations, candidates, merge_count, top_n):
+    """Per-combination edge reduction of every combination; stable sort keeps enumeration order on ties."""
+    optimizer = MergeModuleOptimizer(module_relation=relations)
+    scored = [
+        (optimizer._calculate_edge_metrics(combo)['edge_reduction'], combo)
+        for combo in combinations(candidates, merge_count)
+    ]
+    scored.sort(key=lambda entry: entry[0], reverse=True)
+    return scored[:top_n]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_search_matches_exhaustive(seed):
+    rng = random.Random(seed)
+    # Sparse graphs produce many equal reductions, so ties at the top_n cut are common
+    density = rng.choice((0.0, 0.05, 0.15, 0.3, 0.6))
+    relations = random_relations(rng, rng.randint(6, 14), density)
+    candidates = rng.sample(sorted(relations), rng.randint(3, min(9, len(relations))))
+    search = MergeSearch({m: relations[m].keys() for m in relations}, candidates)
+
+    for merge_count in range(1, len(candidates) + 1):
+        for top_n in (1, 3, 10):
+            assert search.search(merge_count, top_n) == exhaustive_top(relations, candidates, merge_count, top_n)
+
+
+def test_all_ties_keep_enumeration_order():
+    relations = {f"m{i}": {} for i in range(6)}
+    candidates = ["m3", "m0", "m5", "m1"]
+    search = MergeSearch(relations, candidates)
+    assert search.search(2, 4) == [(0, combo) for combo in list(combinations(candidates, 2))[:4]]
+
+
+def test_out_of_range_requests_are_empty():
+    search = MergeSearch({"a": {"b": 1}, "b": {}}, ["a", "b"])
+    assert search.search(0, 5) == []
+    assert search.search(3, 5) == []
+    assert search.search(2, 0) == []
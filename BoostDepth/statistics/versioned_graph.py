@@ -0,0 +1,473 @@
+"""
+Versioned Boost Dependency Graph Store
+
+This module keeps the dependency graphs of many Boost releases in one SQLite
+file (boost_dependency_versions.sqlite), delta-encoded between consecutive
+releases, so a release's graph or the changes between two releases can be read
+without loading every release.
+
+Edges are (kind, source, target):
+- "module": source module depends on target module (Primary rows of the boostdep
+  CSV, and Reverse rows turned around)
+- "header": source header includes target header (boostdep CSV header columns,
+  or a header scan of the Boost tree)
+
+Storage:
+- versions: one row per release, ordered by (major, minor, patch)
+- edges: every distinct edge, interned once
+- changes: per release, edges added (+1) and removed (-1) since the previous release
+- keyframe_edges: the full edge set of every KEYFRAME_INTERVAL-th release, so
+  edges_at() replays about KEYFRAME_INTERVAL - 1 deltas (more only after
+  releases were inserted between existing ones)
+
+Releases may be ingested in any order; ingesting a release between two others
+re-encodes the following release's delta.
+
+Usage:
+    python versioned_graph.py ingest-csv 1.89.0 ../boost_modules_dependencies.csv
+    python versioned_graph.py ingest-headers 1.90.0 /path/to/boost_1_90_0/boost
+    python versioned_graph.py list
+    python versioned_graph.py diff 1.88.0 1.89.0 --kind module
+    python versioned_graph.py export-library-dependency path/to/boost_usage.db
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+STORE_VERSION = 1
+KEYFRAME_INTERVAL = 8
+MODULE = "module"
+HEADER = "header"
+EDGE_KINDS = (MODULE, HEADER)
+DEFAULT_STORE = Path(__file__).parent / "boost_dependency_versions.sqlite"
+
+Edge = Tuple[str, str, str]  # (kind, source, target)
+
+_VERSION_PATTERN = re.compile(r"(\d+)[._](\d+)(?:[._](\d+))?")
+
+
+def parse_version(version: str) -> Tuple[int, int, int]:
+    """(major, minor, patch) of "1.89.0", "boost-1.89.0", "boost_1_89_0" or "1.89"."""
+    match = _VERSION_PATTERN.search(version)
+    if match is None:
+        raise ValueError(f"Not a Boost version: {version}")
+    return int(match.group(1)), int(match.group(2)), int(match.group(3) or 0)
+
+
+def normalize_version(version: str) -> str:
+    """Dotted form of a Boost version, e.g. "boost_1_89_0" -> "1.89.0"."""
+    return "%d.%d.%d" % parse_version(version)
+
+
+def csv_edges(csv_path: Path) -> Iterator[Edge]:
+    """Module and header edges of a boostdep CSV export (read through the shared graph cache)."""
+    from dependency_graph import load_dependency_graph
+
+    graph = load_dependency_graph(str(csv_path))
+    for module_a, module_b, operation in graph.iter_module_edges():
+        if operation == "Primary":
+            yield MODULE, module_a, module_b
+        else:
+            yield MODULE, module_b, module_a
+    for from_header, header in graph.iter_header_edges():
+        yield HEADER, from_header, header
+
+
+def header_scan_edges(boost_root: Path, workers: Optional[int] = None) -> Iterator[Edge]:
+    """Header include edges of a Boost tree (through the per-file header cache)."""
+    from header_scanner import DEFAULT_CACHE_FILE, HeaderCache
+
+    with HeaderCache(DEFAULT_CACHE_FILE) as cache:
+        header_deps = cache.scan(Path(boost_root), workers=workers)
+    for header, includes in header_deps.items():
+        for included in includes:
+            yield HEADER, header, included
+
+
+class VersionedGraphStore:
+    """Delta-encoded dependency graphs of several Boost releases."""
+
+    def __init__(self, db_path: Path = DEFAULT_STORE, keyframe_interval: int = KEYFRAME_INTERVAL):
+        """
+        Args:
+            db_path: SQLite file of the store (created if missing)
+            keyframe_interval: Store a full edge set every this many releases
+        """
+        self.db_path = Path(db_path)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        conn = self.conn
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS versions (
+                id INTEGER PRIMARY KEY,
+                version TEXT NOT NULL UNIQUE,
+                major INTEGER NOT NULL,
+                minor INTEGER NOT NULL,
+                patch INTEGER NOT NULL,
+                keyframe INTEGER NOT NULL,
+                source TEXT
+            );
+            CREATE TABLE IF NOT EXISTS edges (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                UNIQUE (kind, source, target)
+            );
+            CREATE TABLE IF NOT EXISTS changes (
+                version_id INTEGER NOT NULL,
+                edge_id INTEGER NOT NULL,
+                change INTEGER NOT NULL,
+                PRIMARY KEY (version_id, edge_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS keyframe_edges (
+                version_id INTEGER NOT NULL,
+                edge_id INTEGER NOT NULL,
+                PRIMARY KEY (version_id, edge_id)
+            ) WITHOUT ROWID;
+        """)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'store_version'").fetchone()
+        if row is None:
+            conn.execute("INSERT INTO meta (key, value) VALUES ('store_version', ?)", (str(STORE_VERSION),))
+        elif row[0] != str(STORE_VERSION):
+            raise ValueError(f"{self.db_path} has store version {row[0]}, expected {STORE_VERSION}")
+        conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'VersionedGraphStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ----- versions -----
+
+    def _ordered(self) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT id, version, keyframe, source FROM versions ORDER BY major, minor, patch")
+        return [{"id": vid, "version": version, "keyframe": bool(keyframe), "source": source}
+                for vid, version, keyframe, source in rows]
+
+    def versions(self) -> List[str]:
+        """Stored releases, oldest first."""
+        return [row["version"] for row in self._ordered()]
+
+    def _position(self, ordered: List[Dict[str, Any]], version: str) -> int:
+        version = normalize_version(version)
+        for position, row in enumerate(ordered):
+            if row["version"] == version:
+                return position
+        raise KeyError(f"Version {version} is not in {self.db_path}")
+
+    # ----- reconstruction -----
+
+    def _edge_ids_at(self, ordered: List[Dict[str, Any]], position: int) -> Set[int]:
+        """Edge ids of the release at position: nearest keyframe plus the deltas after it."""
+        start = position
+        while not ordered[start]["keyframe"]:
+            start -= 1
+        edge_ids = {edge_id for (edge_id,) in self.conn.execute(
+            "SELECT edge_id FROM keyframe_edges WHERE version_id = ?", (ordered[start]["id"],))}
+        for row in ordered[start + 1:position + 1]:
+            self._apply_changes(edge_ids, row["id"])
+        return edge_ids
+
+    def _apply_changes(self, edge_ids: Set[int], version_id: int) -> None:
+        for edge_id, change in self.conn.execute(
+                "SELECT edge_id, change FROM changes WHERE version_id = ?", (version_id,)):
+            if change > 0:
+                edge_ids.add(edge_id)
+            else:
+                edge_ids.discard(edge_id)
+
+    def _resolve(self, edge_ids: Iterable[int], kind: str) -> Set[Tuple[str, str]]:
+        """(source, target) pairs of the given edge ids that have the given kind."""
+        edge_ids = edge_ids if isinstance(edge_ids, (set, frozenset, dict)) else set(edge_ids)
+        return {(source, target) for edge_id, source, target in self.conn.execute(
+            "SELECT id, source, target FROM edges WHERE kind = ?", (kind,)) if edge_id in edge_ids}
+
+    def edges_at(self, version: str, kind: str = MODULE) -> Set[Tuple[str, str]]:
+        """
+        Graph of one release.
+
+        Args:
+            version: Boost release, e.g. "1.89.0"
+            kind: "module" or "header"
+
+        Returns:
+            Set of (source, target) edges
+        """
+        ordered = self._ordered()
+        return self._resolve(self._edge_ids_at(ordered, self._position(ordered, version)), kind)
+
+    def module_dependencies(self, version: str) -> DefaultDict[str, Set[str]]:
+        """module -> modules it depends on, in one release (the forward_deps of make-dependency.py)."""
+        dependencies: DefaultDict[str, Set[str]] = defaultdict(set)
+        for source, target in self.edges_at(version, MODULE):
+            dependencies[source].add(target)
+        return dependencies
+
+    def iter_graphs(self, kind: str = MODULE) -> Iterator[Tuple[str, Set[Tuple[str, str]]]]:
+        """
+        (release, edges) for every release, oldest first.
+
+        Deltas are applied to one running edge set, so only one release is held
+        in memory at a time.
+        """
+        ordered = self._ordered()
+        names = {edge_id: (source, target) for edge_id, source, target in self.conn.execute(
+            "SELECT id, source, target FROM edges WHERE kind = ?", (kind,))}
+        edge_ids: Set[int] = set()
+        for row in ordered:
+            self._apply_changes(edge_ids, row["id"])
+            yield row["version"], {names[edge_id] for edge_id in edge_ids if edge_id in names}
+
+    def diff(self, old: str, new: str, kind: str = MODULE) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Edges added and removed between two releases, by composing the deltas between them.
+
+        Args:
+            old: Baseline release
+            new: Compared release (may be older than old)
+            kind: "module" or "header"
+
+        Returns:
+            (added, removed) sorted lists of (source, target)
+        """
+        ordered = self._ordered()
+        old_position, new_position = self._position(ordered, old), self._position(ordered, new)
+        forward = new_position >= old_position
+        low, high = sorted((old_position, new_position))
+
+        net: Dict[int, int] = {}
+        for row in ordered[low + 1:high + 1]:
+            for edge_id, change in self.conn.execute(
+                    "SELECT edge_id, change FROM changes WHERE version_id = ?", (row["id"],)):
+                if net.get(edge_id) == -change:
+                    del net[edge_id]  # Added and removed again (or vice versa)
+                else:
+                    net[edge_id] = change
+        if not forward:
+            net = {edge_id: -change for edge_id, change in net.items()}
+
+        added = self._resolve({edge_id for edge_id, change in net.items() if change > 0}, kind)
+        removed = self._resolve({edge_id for edge_id, change in net.items() if change < 0}, kind)
+        return sorted(added), sorted(removed)
+
+    # ----- ingestion -----
+
+    def _intern(self, edges: Iterable[Edge]) -> Set[int]:
+        """Ids of edges, adding unseen edges to the edges table."""
+        conn = self.conn
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS incoming (kind TEXT, source TEXT, target TEXT)")
+        conn.execute("DELETE FROM incoming")
+        conn.executemany("INSERT INTO incoming (kind, source, target) VALUES (?, ?, ?)", edges)
+        conn.execute("INSERT OR IGNORE INTO edges (kind, source, target) SELECT kind, source, target FROM incoming")
+        edge_ids = {edge_id for (edge_id,) in conn.execute(
+            "SELECT e.id FROM incoming i JOIN edges e "
+            "ON e.kind = i.kind AND e.source = i.source AND e.target = i.target")}
+        conn.execute("DELETE FROM incoming")
+        return edge_ids
+
+    def _write_changes(self, version_id: int, edge_ids: Set[int], previous: Set[int]) -> None:
+        self.conn.execute("DELETE FROM changes WHERE version_id = ?", (version_id,))
+        self.conn.executemany(
+            "INSERT INTO changes (version_id, edge_id, change) VALUES (?, ?, ?)",
+            [(version_id, edge_id, 1) for edge_id in edge_ids - previous]
+            + [(version_id, edge_id, -1) for edge_id in previous - edge_ids])
+
+    def ingest(self, version: str, edges: Iterable[Edge], kinds: Iterable[str] = EDGE_KINDS,
+               source: Optional[str] = None) -> Dict[str, int]:
+        """
+        Store the edges of one release, replacing its edges of the given kinds.
+
+        Edges of other kinds already stored for the release are kept, so a CSV
+        and a header scan of the same release can be combined.
+
+        Args:
+            version: Boost release, e.g. "1.89.0"
+            edges: (kind, source, target) edges
+            kinds: Edge kinds the edges replace
+            source: Description of where the edges came from
+
+        Returns:
+            {"edges", "added", "removed"} counts relative to the previous release
+        """
+        version = normalize_version(version)
+        major, minor, patch = parse_version(version)
+        kinds = set(kinds)
+        conn = self.conn
+        with conn:
+            ordered = self._ordered()
+            existing = next((i for i, row in enumerate(ordered) if row["version"] == version), None)
+            if existing is not None:
+                position = existing
+                version_id = ordered[existing]["id"]
+                current = self._edge_ids_at(ordered, existing)
+                successor_position = existing + 1
+            else:
+                position = sum(1 for row in ordered
+                               if parse_version(row["version"]) < (major, minor, patch))
+                version_id = conn.execute(
+                    "INSERT INTO versions (version, major, minor, patch, keyframe, source) VALUES (?, ?, ?, ?, 0, ?)",
+                    (version, major, minor, patch, source)).lastrowid
+                current = set()
+                successor_position = position
+
+            # The following release is re-encoded against this one: read it before anything changes
+            successor = ordered[successor_position] if successor_position < len(ordered) else None
+            successor_edges = self._edge_ids_at(ordered, successor_position) if successor is not None else None
+            previous = self._edge_ids_at(ordered, position - 1) if position > 0 else set()
+
+            kept = set()
+            if current:
+                kind_of = dict(conn.execute("SELECT id, kind FROM edges"))
+                kept = {edge_id for edge_id in current if kind_of.get(edge_id) not in kinds}
+            edge_ids = kept | self._intern(edges)
+
+            # Keyframe if no keyframe among the previous keyframe_interval - 1 releases
+            recent = ordered[max(0, position - self.keyframe_interval + 1):position]
+            keyframe = position == 0 or not any(row["keyframe"] for row in recent)
+            conn.execute("UPDATE versions SET keyframe = ?, source = COALESCE(?, source) WHERE id = ?",
+                         (int(keyframe), source, version_id))
+            conn.execute("DELETE FROM keyframe_edges WHERE version_id = ?", (version_id,))
+            if keyframe:
+                conn.executemany("INSERT INTO keyframe_edges (version_id, edge_id) VALUES (?, ?)",
+                                 [(version_id, edge_id) for edge_id in edge_ids])
+            self._write_changes(version_id, edge_ids, previous)
+            if successor is not None:
+                self._write_changes(successor["id"], successor_edges, edge_ids)
+        return {"edges": len(edge_ids), "added": len(edge_ids - previous), "removed": len(previous - edge_ids)}
+
+    def ingest_csv(self, version: str, csv_path: Path) -> Dict[str, int]:
+        """Store the module and header edges of a boostdep CSV export as one release."""
+        return self.ingest(version, csv_edges(csv_path), EDGE_KINDS, source=str(csv_path))
+
+    def ingest_header_scan(self, version: str, boost_root: Path, workers: Optional[int] = None) -> Dict[str, int]:
+        """Store the header include edges of a Boost tree as one release (module edges are kept)."""
+        return self.ingest(version, header_scan_edges(boost_root, workers), (HEADER,), source=str(boost_root))
+
+    # ----- dashboard export -----
+
+    def export_library_dependency(self, usage_db: Path) -> Dict[str, int]:
+        """
+        Write module edges into the library_dependency table of boost_usage.db.
+
+        Releases are matched to boost_version by (major, minor, patch) and modules to
+        boost_library by name ("numeric~conversion" also matches "numeric/conversion"
+        and "numeric_conversion"); the rows of every matched release are replaced.
+
+        Returns:
+            {"versions", "rows", "unmatched_modules"} counts
+        """
+        conn = sqlite3.connect(str(usage_db))
+        try:
+            library_ids = {name: library_id for library_id, name in conn.execute("SELECT id, name FROM boost_library")}
+            version_ids = {(major, minor, patch): version_id for version_id, major, minor, patch in conn.execute(
+                "SELECT id, major, minor, patch FROM boost_version")}
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS library_dependency (
+                    id INTEGER PRIMARY KEY,
+                    main_library_id INTEGER NOT NULL,
+                    dependency_library_id INTEGER NOT NULL,
+                    version_id INTEGER NOT NULL
+                )
+            """)
+
+            def library_id(module: str) -> Optional[int]:
+                for name in (module, module.replace("~", "/"), module.replace("~", "_")):
+                    if name in library_ids:
+                        return library_ids[name]
+                return None
+
+            unmatched: Set[str] = set()
+            stats = {"versions": 0, "rows": 0}
+            with conn:
+                for version, edges in self.iter_graphs(MODULE):
+                    version_id = version_ids.get(parse_version(version))
+                    if version_id is None:
+                        continue
+                    rows = set()
+                    for module, dependency in edges:
+                        main_id, dependency_id = library_id(module), library_id(dependency)
+                        if main_id is None or dependency_id is None:
+                            unmatched.update(m for m, i in ((module, main_id), (dependency, dependency_id)) if i is None)
+                            continue
+                        rows.add((main_id, dependency_id, version_id))
+                    conn.execute("DELETE FROM library_dependency WHERE version_id = ?", (version_id,))
+                    conn.executemany(
+                        "INSERT INTO library_dependency (main_library_id, dependency_library_id, version_id) "
+                        "VALUES (?, ?, ?)", sorted(rows))
+                    stats["versions"] += 1
+                    stats["rows"] += len(rows)
+        finally:
+            conn.close()
+        stats["unmatched_modules"] = len(unmatched)
+        return stats
+
+
+def main() -> None:
+    """Ingest releases into the store, list them, diff them or export them to the dashboard database."""
+    parser = argparse.ArgumentParser(description='Versioned Boost dependency graph store')
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE, help='Store file')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    csv_parser = subparsers.add_parser('ingest-csv', help='Ingest a boostdep CSV export')
+    csv_parser.add_argument('version')
+    csv_parser.add_argument('csv', type=Path)
+    headers_parser = subparsers.add_parser('ingest-headers', help='Ingest a header scan of a Boost tree')
+    headers_parser.add_argument('version')
+    headers_parser.add_argument('boost_root', type=Path, help='Boost header directory (containing the library folders)')
+    headers_parser.add_argument('--workers', type=int, default=None)
+    subparsers.add_parser('list', help='List stored releases')
+    diff_parser = subparsers.add_parser('diff', help='Print edges added/removed between two releases')
+    diff_parser.add_argument('old')
+    diff_parser.add_argument('new')
+    diff_parser.add_argument('--kind', choices=EDGE_KINDS, default=MODULE)
+    export_parser = subparsers.add_parser('export-library-dependency',
+                                          help='Write module edges to library_dependency in boost_usage.db')
+    export_parser.add_argument('usage_db', type=Path)
+    args = parser.parse_args()
+
+    with VersionedGraphStore(args.store) as store:
+        if args.command == 'ingest-csv':
+            stats = store.ingest_csv(args.version, args.csv)
+            print(f"Stored {normalize_version(args.version)}: {stats['edges']} edges "
+                  f"(+{stats['added']} / -{stats['removed']} vs previous release)")
+        elif args.command == 'ingest-headers':
+            stats = store.ingest_header_scan(args.version, args.boost_root, args.workers)
+            print(f"Stored {normalize_version(args.version)}: {stats['edges']} edges "
+                  f"(+{stats['added']} / -{stats['removed']} vs previous release)")
+        elif args.command == 'list':
+            for row in store._ordered():
+                marker = "keyframe" if row["keyframe"] else "delta"
+                print(f"{row['version']:<10} {marker:<9} {row['source'] or ''}")
+        elif args.command == 'diff':
+            try:
+                added, removed = store.diff(args.old, args.new, args.kind)
+            except KeyError as e:
+                print(f"Error: {e.args[0]}", file=sys.stderr)
+                sys.exit(1)
+            for source, target in added:
+                print(f"+ {source} -> {target}")
+            for source, target in removed:
+                print(f"- {source} -> {target}")
+            print(f"{len(added)} added, {len(removed)} removed")
+        elif args.command == 'export-library-dependency':
+            stats = store.export_library_dependency(args.usage_db)
+            print(f"Wrote {stats['rows']} library_dependency rows for {stats['versions']} releases "
+                  f"({stats['unmatched_modules']} modules without a boost_library entry)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ import sqlite3
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -165,20 +165,81 @@ def collect_usage_data():
     }
 
 
+def migrate_usage_file_paths(conn: sqlite3.Connection) -> bool:
+    """
+    Move boost_usage.file_path into the source_file table.
+
+    Older databases store the full path text on every usage row. This rebuilds
+    boost_usage with a source_file_id column and reclaims the space. Returns
+    True if a migration was performed.
+    """
+    usage_columns = {row[1] for row in conn.execute("PRAGMA table_info(boost_usage)")}
+    if "file_path" not in usage_columns:
+        return False
+
+    print("Migrating boost_usage.file_path into source_file...")
+    conn.executescript(
+        """
+        BEGIN;
+
+        CREATE TABLE IF NOT EXISTS source_file (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            repository_id INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            UNIQUE (repository_id, path),
+            FOREIGN KEY (repository_id) REFERENCES repository(id)
+        );
+
+        INSERT OR IGNORE INTO source_file (repository_id, path)
+        SELECT DISTINCT repository_id, file_path FROM boost_usage ORDER BY repository_id, file_path;
+
+        CREATE TABLE boost_usage_migrated (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            repository_id INTEGER NOT NULL,
+            source_file_id INTEGER NOT NULL,
+            header_id INTEGER NOT NULL,
+            last_commit_ts TEXT,
+            excepted_ts TEXT,
+            FOREIGN KEY (repository_id) REFERENCES repository(id),
+            FOREIGN KEY (source_file_id) REFERENCES source_file(id),
+            FOREIGN KEY (header_id) REFERENCES boost_header(id)
+        );
+
+        INSERT INTO boost_usage_migrated (id, repository_id, source_file_id, header_id, last_commit_ts, excepted_ts)
+        SELECT bu.id, bu.repository_id, sf.id, bu.header_id, bu.last_commit_ts, bu.excepted_ts
+        FROM boost_usage bu
+        JOIN source_file sf ON sf.repository_id = bu.repository_id AND sf.path = bu.file_path;
+
+        DROP TABLE boost_usage;
+        ALTER TABLE boost_usage_migrated RENAME TO boost_usage;
+
+        COMMIT;
+        """
+    )
+    conn.execute("VACUUM")
+    file_count = conn.execute("SELECT COUNT(*) FROM source_file").fetchone()[0]
+    print(f"Migrated boost_usage to {file_count:,} interned source files.")
+    return True
+
+
 def build_database(data):
     """
     Build the boost_usage table by referencing existing boost_library and boost_header tables.
     
     This function does NOT modify boost_library or boost_header tables. It only:
-    1. Creates repository and boost_usage tables if they don't exist
+    1. Creates repository, source_file and boost_usage tables if they don't exist
     2. Inserts repository records
-    3. Inserts boost_usage records by matching headers via full_header_name
+    3. Interns file paths into source_file (one row per repository/path)
+    4. Inserts boost_usage records by matching headers via full_header_name
     """
     usage_records = data["usage_records"]
     repo_info = data["repo_info"]
 
     conn = sqlite3.connect(DB_PATH)
     conn.execute("PRAGMA foreign_keys = ON;")
+
+    # Databases built before source_file existed store the path on every usage row
+    migrate_usage_file_paths(conn)
     
     # Create tables if they don't exist (but don't populate boost_library/boost_header)
     conn.executescript(
@@ -204,21 +265,45 @@ def build_database(data):
             boost_version TEXT
         );
 
+        CREATE TABLE IF NOT EXISTS source_file (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            repository_id INTEGER NOT NULL,
+            path TEXT NOT NULL,
+            UNIQUE (repository_id, path),
+            FOREIGN KEY (repository_id) REFERENCES repository(id)
+        );
+
         CREATE TABLE IF NOT EXISTS boost_usage (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             repository_id INTEGER NOT NULL,
-            file_path TEXT NOT NULL,
+            source_file_id INTEGER NOT NULL,
             header_id INTEGER NOT NULL,
             last_commit_ts TEXT,
             excepted_ts TEXT,
             FOREIGN KEY (repository_id) REFERENCES repository(id),
+            FOREIGN KEY (source_file_id) REFERENCES source_file(id),
             FOREIGN KEY (header_id) REFERENCES boost_header(id)
         );
+
+        CREATE INDEX IF NOT EXISTS idx_boost_usage_source_file ON boost_usage(source_file_id);
+
+        -- Compatibility view exposing the pre-normalization boost_usage columns
+        CREATE VIEW IF NOT EXISTS boost_usage_with_path AS
+        SELECT
+            bu.id,
+            bu.repository_id,
+            sf.path AS file_path,
+            bu.header_id,
+            bu.last_commit_ts,
+            bu.excepted_ts
+        FROM boost_usage bu
+        JOIN source_file sf ON sf.id = bu.source_file_id;
         """
     )
 
     repo_ids: Dict[str, int] = {}
     header_id_cache: Dict[str, Optional[int]] = {}  # Cache for full_header_name -> header_id lookups
+    source_file_ids: Dict[Tuple[int, str], int] = {}  # Intern map for (repository_id, path) -> source_file.id
 
     with conn:
         # Check if boost_header table has data
@@ -261,6 +346,10 @@ def build_database(data):
                 if header_name not in header_id_cache:
                     header_id_cache[header_name] = header_id
 
+        # Preload already interned file paths
+        for source_file_id, repository_id, path in conn.execute("SELECT id, repository_id, path FROM source_file"):
+            source_file_ids[(repository_id, path)] = source_file_id
+
         # Insert usage records
         usage_rows = []
         unmatched_headers = set()
@@ -278,10 +367,19 @@ def build_database(data):
                 unmatched_headers.add(header)
                 continue
             
+            file_key = (repo_id, record["file_path"])
+            source_file_id = source_file_ids.get(file_key)
+            if source_file_id is None:
+                source_file_id = conn.execute(
+                    "INSERT INTO source_file (repository_id, path) VALUES (?, ?)",
+                    file_key,
+                ).lastrowid
+                source_file_ids[file_key] = source_file_id
+
             usage_rows.append(
                 (
                     repo_id,
-                    record["file_path"],
+                    source_file_id,
                     header_id,
                     isoformat(record["last_commit_ts"]),
                     None,  # excepted_ts - placeholder for future use
@@ -296,13 +394,13 @@ def build_database(data):
                 print(f"  ... and {len(unmatched_headers) - 10} more")
         
         conn.executemany(
-            "INSERT INTO boost_usage (repository_id, file_path, header_id, last_commit_ts, excepted_ts) "
+            "INSERT INTO boost_usage (repository_id, source_file_id, header_id, last_commit_ts, excepted_ts) "
             "VALUES (?, ?, ?, ?, ?)",
             usage_rows,
         )
 
     conn.close()
-    print(f"Inserted {len(usage_rows):,} usage records into database.")
+    print(f"Inserted {len(usage_rows):,} usage records ({len(source_file_ids):,} distinct files) into database.")
     return len(usage_rows)
 
 
@@ -554,7 +652,10 @@ def appendics() -> list(str):
         "- **`boost_library`**: Unique Boost libraries",
         "- **`boost_header`**: Headers mapped to their parent library",
         "- **`repository`**: GitHub repositories with `affect_from_boost` flag (1 if using system Boost, 0 if vendored) and detected `boost_version`",
-        "- **`boost_usage`**: Individual usage records linking repositories to headers with file paths and commit timestamps",
+        "- **`source_file`**: Source file paths, stored once per repository and path",
+        "- **`boost_usage`**: Individual usage records linking repositories, source files (`source_file_id`) and headers, with commit timestamps",
+        "",
+        "The **`boost_usage_with_path`** view joins `boost_usage` with `source_file` and exposes each record's `file_path`.",
         "",
     ]
     
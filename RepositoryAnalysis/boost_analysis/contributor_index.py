@@ -0,0 +1,196 @@
+"""
+Mapping between Boost libraries and the contributor database.
+
+contributor_data (DB_PATH_1) is keyed by repository name and a short version
+string ("1.84"), while boost_usage.db is keyed by library id/name and full
+version strings ("1.84.0"). This module owns that mapping:
+
+    library name  -> repository name   (library_repository, REPOSITORY_ALIASES)
+    boost version -> contributor key   (contributor_version_key)
+
+ContributorIndex loads commit counts for every library with two grouped
+queries restricted by repo IN (...) and serves per-library contributor lists and
+commits-by-version from memory, instead of two queries per library with a
+LIKE '%1.%' scan:
+
+- per-contributor counts, for the latest version key only
+- per-version counts (GROUP BY repo, version)
+
+Both are answered from CONTRIBUTOR_INDEX on (repo, version, email_address) when
+it exists. The contributor database belongs to another tool, so the dashboard
+build never changes its schema; create the index once with
+
+    python contributor_index.py --create-index
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Libraries whose contributor_data repository has a different name
+REPOSITORY_ALIASES: Dict[str, str] = {
+    "tribool": "logic",
+}
+
+# Version keys containing this marker are release versions (was: version LIKE '%1.%')
+RELEASE_VERSION_MARKER = "1."
+
+CONTRIBUTOR_INDEX = "idx_contributor_data_repo_version_email"
+
+
+def library_repository(library_name: str) -> str:
+    """Repository name of a library in contributor_data."""
+    return REPOSITORY_ALIASES.get(library_name, library_name)
+
+
+def contributor_version_key(version: Optional[str]) -> Optional[str]:
+    """contributor_data version key of a boost_version string ("1.84.0" -> "1.84")."""
+    return version.replace(".0", "") if version else None
+
+
+class ContributorIndex:
+    """Per-library contributor and commit counts, materialized from two grouped contributor_data queries."""
+
+    def __init__(
+        self,
+        contributor_rows: Iterable[Any],
+        version_rows: Iterable[Any],
+        library_names: Iterable[str],
+        latest_version: Optional[str],
+    ):
+        """
+        Args:
+            contributor_rows: (repo, email_address, identity_name, commit_count) rows of the
+                latest version key, one per repository and contributor
+            version_rows: (repo, version, commit_count) rows, one per repository and version
+            library_names: Libraries to serve
+            latest_version: boost_version string whose contributors are listed
+        """
+        self.latest_key = contributor_version_key(latest_version)
+        self.repository_by_library: Dict[str, str] = {
+            name: library_repository(name) for name in library_names
+        }
+
+        contributors: Dict[str, List[Dict[str, Any]]] = {}
+        for row in contributor_rows:
+            contributors.setdefault(row["repo"], []).append({
+                "email_address": row["email_address"],
+                "identity_name": row["identity_name"],
+                "commit_count": row["commit_count"],
+            })
+        for repo_contributors in contributors.values():
+            repo_contributors.sort(key=lambda c: (-c["commit_count"], _null_first(c["email_address"])))
+
+        commits: Dict[str, Dict[str, int]] = {}
+        for row in version_rows:
+            version = row["version"]
+            if version is not None and RELEASE_VERSION_MARKER in version:
+                commits.setdefault(row["repo"], {})[version] = row["commit_count"]
+
+        self._contributors = contributors
+        self._commits_by_version = {
+            repo: dict(sorted(by_version.items())) for repo, by_version in commits.items()
+        }
+
+    @staticmethod
+    def has_index(db1: Any) -> bool:
+        """True if CONTRIBUTOR_INDEX exists in the contributor database."""
+        return bool(db1.fetchall(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (CONTRIBUTOR_INDEX,)
+        ))
+
+    @classmethod
+    def from_db(cls, db1: Any, library_names: List[str], latest_version: Optional[str]) -> "ContributorIndex":
+        """Load counts for library_names through a contributor DB connector exposing fetchall()."""
+        latest_key = contributor_version_key(latest_version)
+        if latest_key is None:
+            return cls([], [], library_names, latest_version)
+        repositories = tuple(sorted({library_repository(name) for name in library_names}))
+        if not repositories:
+            return cls([], [], library_names, latest_version)
+
+        if not cls.has_index(db1):
+            print(f"Warning: {CONTRIBUTOR_INDEX} is missing, contributor queries will scan contributor_data "
+                  "(create it with: python contributor_index.py --create-index)")
+        placeholders = ", ".join("?" for _ in repositories)
+        contributor_rows = db1.fetchall(f"""
+            SELECT
+                repo,
+                email_address,
+                identity_name,
+                count(*) as commit_count
+            FROM contributor_data
+            WHERE repo IN ({placeholders}) AND version = ?
+            GROUP BY repo, email_address
+        """, repositories + (latest_key,))
+        version_rows = db1.fetchall(f"""
+            SELECT
+                repo,
+                version,
+                count(*) as commit_count
+            FROM contributor_data
+            WHERE repo IN ({placeholders})
+            GROUP BY repo, version
+        """, repositories)
+        return cls(contributor_rows, version_rows, library_names, latest_version)
+
+    def contributors(self, library_name: str) -> List[Dict[str, Any]]:
+        """Contributors of the latest version, most commits first."""
+        if self.latest_key is None:
+            return []
+        return [dict(c) for c in self._contributors.get(self._repository(library_name), [])]
+
+    def commits_by_version(self, library_name: str) -> Dict[str, int]:
+        """Commit count per release version key, in version-string order."""
+        if self.latest_key is None:
+            return {}
+        return dict(self._commits_by_version.get(self._repository(library_name), {}))
+
+    def _repository(self, library_name: str) -> str:
+        repo = self.repository_by_library.get(library_name)
+        return repo if repo is not None else library_repository(library_name)
+
+
+def _null_first(value: Optional[str]) -> Tuple[int, str]:
+    """Sort key matching SQLite's ORDER BY (NULL before any text)."""
+    return (0, "") if value is None else (1, value)
+
+
+def create_index(db_path: Path) -> None:
+    """Create CONTRIBUTOR_INDEX on contributor_data (one-off migration of the contributor database)."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {CONTRIBUTOR_INDEX} "
+            "ON contributor_data(repo, version, email_address)"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def main():
+    """Create the contributor_data index used by ContributorIndex.from_db()."""
+    parser = argparse.ArgumentParser(description="Maintain the contributor database index used by the dashboard")
+    parser.add_argument("--create-index", action="store_true",
+                        help=f"Create {CONTRIBUTOR_INDEX} on contributor_data(repo, version, email_address)")
+    parser.add_argument("--db", type=Path, default=None,
+                        help="Contributor database (default: DB_PATH_1 from config.py)")
+    args = parser.parse_args()
+    if not args.create_index:
+        parser.print_help()
+        return
+
+    db_path = args.db
+    if db_path is None:
+        from config import DB_PATH_1
+        db_path = DB_PATH_1
+    create_index(db_path)
+    print(f"Created {CONTRIBUTOR_INDEX} in {db_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,75 @@ This script generates:
 2. {library_name}.html - Individual library pages with detailed information
 
 The script is organized into two main modules:
-1. collect_dashboard_data() - Collects all data from database and saves to dashboard_data.json
-2. generate_dashboard_html() - Reads dashboard_data.json and generates HTML files
+1. collect_dashboard_data() - Collects all data from database and saves it to data/index.json
+   plus one JSON shard per library in data/libraries/
+2. generate_dashboard_html() - Reads the data shards on demand and regenerates the HTML files
+   whose inputs changed since the last build (tracked in build_manifest.json)
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import html
 import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
+from itertools import islice
+from pathlib import Path
+from typing import Optional, Dict, Iterable, Iterator, List, Any, Tuple
 
 from dateutil import parser as date_parser
 
 from config import DB_PATH, DB_PATH_1, DASHBOARD_DIR
+from contributor_index import ContributorIndex
+from dashboard_profiler import DEFAULT_SLOW_QUERY_MS, BuildProfiler
+from dashboard_snapshots import record_snapshot
+from dependency_closure import DependencyClosureIndex
+from version_index import VersionIndex
 
 
 # Create libraries subdirectory
 LIBRARIES_DIR = DASHBOARD_DIR / "libraries"
 LIBRARIES_DIR.mkdir(exist_ok=True, parents=True)
 
-# Dashboard data JSON file
+# Collected dashboard data: data/index.json plus one shard per library in data/libraries/
+DASHBOARD_DATA_DIR = DASHBOARD_DIR / "data"
+DATA_INDEX_FILE = DASHBOARD_DATA_DIR / "index.json"
+DATA_LIBRARIES_DIR = DASHBOARD_DATA_DIR / "libraries"
+# Dated metric snapshots and the change since the previous one (see dashboard_snapshots.py)
+DATA_SNAPSHOTS_DIR = DASHBOARD_DATA_DIR / "snapshots"
+DATA_TRENDS_FILE = DASHBOARD_DATA_DIR / "trends.json"
+
+# Monolithic data file written by earlier versions; converted to shards on first use
 DASHBOARD_DATA_FILE = DASHBOARD_DIR / "dashboard_data.json"
 
+# Build manifest: input hashes of the generated pages, used to skip unchanged pages
+BUILD_MANIFEST_FILE = DASHBOARD_DIR / "build_manifest.json"
+BUILD_MANIFEST_VERSION = 1
+
+INDEX_PAGE = "index.html"
+
+# Tables longer than this many rows show the first page inline and load the rest
+# from row fragments in fragments/<library>/ (0 = never paginate)
+DEFAULT_TABLE_PAGE_ROWS = 500
+FRAGMENTS_DIR = DASHBOARD_DIR / "fragments"
+
+_TBODY_OPEN = """
+                    <tbody>
+"""
+_TBODY_CLOSE = """
+                    </tbody>
+"""
+
+# Profiler of the current build (set by main() with --profile)
+PROFILE_DIR = DASHBOARD_DIR / "profile"
+_profiler: Optional[BuildProfiler] = None
+
 
 def version_sort_key(version: str) -> tuple:
     """Convert version string to tuple for sorting."""
@@ -52,8 +99,97 @@ def _parse_any_datetime(raw: str) -> Optional[datetime]:
         return None
 
 
-def create_index_html_from_data(data: Dict[str, Any]) -> None:
-    """Create index.html from pre-collected data."""
+def _span(name: str):
+    """Time a build phase when profiling is enabled (no-op otherwise)."""
+    return _profiler.span(name) if _profiler is not None else nullcontext()
+
+
+def _library_page(library_name: str) -> str:
+    """Path of a library page relative to DASHBOARD_DIR."""
+    return f"libraries/{library_name}.html"
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write content to a temporary file next to path, then rename it into place."""
+    _write_chunks_atomic(path, (content,))
+
+
+def _write_chunks_atomic(path: Path, chunks: Iterable[str]) -> int:
+    """
+    Stream chunks to a temporary file next to path, then rename it into place.
+
+    Returns:
+        Number of characters written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    written = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return written
+
+
+class _FragmentWriter:
+    """
+    Writes the overflow rows of a library page's long tables to fragment files.
+
+    Fragments live in fragments/<library>/<table>-<n>.html and hold page_rows <tr>
+    rows each; the page's "Show more" button appends them client-side. Creating the
+    writer clears the library's previous fragments.
+    """
+
+    def __init__(self, library_name: str, page_rows: int):
+        self.library_name = library_name
+        self.page_rows = page_rows
+        self.directory = FRAGMENTS_DIR / library_name
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+
+    def paginates(self, row_count: int) -> bool:
+        return self.page_rows > 0 and row_count > self.page_rows
+
+    def write_remaining(self, table: str, rows: Iterator[str]) -> List[str]:
+        """Write the rows left in the iterator, page_rows per fragment. Returns hrefs relative to the page."""
+        hrefs = []
+        while True:
+            first = next(rows, None)
+            if first is None:
+                return hrefs
+            name = f"{table}-{len(hrefs) + 1}.html"
+            _write_chunks_atomic(self.directory / name, _chain_first(first, islice(rows, self.page_rows - 1)))
+            hrefs.append(f"../fragments/{self.library_name}/{name}")
+
+
+def _chain_first(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
+
+
+def _show_more_button(target: str, hrefs: List[str], remaining_rows: int) -> str:
+    """Button that loads a paginated table's fragments (see BoostTables.loadMore in the shared script)."""
+    fragments = html.escape(json.dumps(hrefs), quote=True)
+    return (f'                <button class="show-more" data-target="{target}" data-fragments="{fragments}" '
+            f'onclick="BoostTables.loadMore(this)">Show more ({remaining_rows:,} more rows)</button>\n')
+
+
+def render_index_html(data: Dict[str, Any], assets: Optional[Dict[str, str]] = None) -> str:
+    """
+    Render index.html from pre-collected data and return the page content.
+
+    Args:
+        data: Dashboard data
+        assets: Shared asset hrefs from write_dashboard_assets() (computed here if omitted)
+    """
+    if assets is None:
+        assets = asset_hrefs()
+
     # Extract data
     repos_by_year = data.get("repos_by_year", [])
     repos_by_version = data.get("repos_by_version", [])
@@ -94,7 +230,8 @@ def create_index_html_from_data(data: Dict[str, Any]) -> None:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Boost Library Usage Dashboard</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>{_get_index_css()}</style>
+    <script src="{assets['charts_js']}"></script>
+    <link rel="stylesheet" href="{assets['index_css']}">
 </head>
 <body>
     <h1>📊 Boost Library Usage Dashboard</h1>
@@ -263,22 +400,82 @@ def create_index_html_from_data(data: Dict[str, Any]) -> None:
 </html>
 """
 
-    index_file = DASHBOARD_DIR / "index.html"
-    index_file.write_text(html_content, encoding="utf-8")
+    return html_content
+
+
+def create_index_html_from_data(data: Dict[str, Any], assets: Optional[Dict[str, str]] = None) -> None:
+    """Create index.html from pre-collected data."""
+    if assets is None:
+        assets = write_dashboard_assets()
+    index_file = DASHBOARD_DIR / INDEX_PAGE
+    _write_text_atomic(index_file, render_index_html(data, assets))
     print(f"Created {index_file}")
 
 
 # Legacy functions removed - use create_index_html_from_data() and create_library_html_from_data() instead
 
 
-def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> None:
-    """Create HTML file for a specific library from pre-collected data."""
-    libraries_data = data.get("libraries", {})
-    lib_data = libraries_data.get(library_name, {})
+def render_library_html(data: Dict[str, Any], library_name: str, assets: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Render the HTML page for a specific library.
+
+    Args:
+        data: Dashboard data, or a slice of it from _library_render_slice()
+        library_name: Key into data["libraries"]
+        assets: Shared asset hrefs from write_dashboard_assets() (computed here if omitted)
+
+    Returns:
+        Page content, or None if the library has no data
+    """
+    if not data.get("libraries", {}).get(library_name):
+        return None
+    return "".join(iter_library_html(data, library_name, assets))
 
-    if not lib_data:
-        print(f"Warning: No data found for library {library_name}")
-        return
+
+def write_library_page(
+    data: Dict[str, Any],
+    library_name: str,
+    assets: Optional[Dict[str, str]] = None,
+    page_rows: int = DEFAULT_TABLE_PAGE_ROWS,
+) -> bool:
+    """
+    Stream a library page straight to libraries/<library>.html.
+
+    Tables longer than page_rows rows keep only their first page inline; the remaining
+    rows go to fragment files loaded on demand, so page size stays bounded.
+
+    Returns:
+        False if the library has no data (nothing written)
+    """
+    if not data.get("libraries", {}).get(library_name):
+        return False
+    fragments = _FragmentWriter(library_name, page_rows)
+    _write_chunks_atomic(
+        DASHBOARD_DIR / _library_page(library_name),
+        iter_library_html(data, library_name, assets, fragments),
+    )
+    return True
+
+
+def iter_library_html(
+    data: Dict[str, Any],
+    library_name: str,
+    assets: Optional[Dict[str, str]] = None,
+    fragments: Optional[_FragmentWriter] = None,
+) -> Iterator[str]:
+    """
+    Yield the HTML of a library page in chunks, table rows one at a time.
+
+    Args:
+        data: Dashboard data, or a slice of it from _library_render_slice()
+        library_name: Key into data["libraries"]
+        assets: Shared asset hrefs from write_dashboard_assets() (computed here if omitted)
+        fragments: Paginate long tables into this writer's fragments (all rows inline if omitted)
+    """
+    lib_data = data.get("libraries", {}).get(library_name, {})
+
+    if assets is None:
+        assets = asset_hrefs()
 
     # Extract data
     dependents_table_data = lib_data.get("dependents_table_data", [])
@@ -304,7 +501,8 @@ def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> No
         # Fallback: get from dependents_by_version if not in data
         dep_versions = sorted(dependents_by_version.keys(), key=version_sort_key)
     else:
-        dep_versions = sorted(all_versions_list, key=version_sort_key)
+        # Stored in release order by VersionIndex
+        dep_versions = list(all_versions_list)
 
     first_level_counts = []
     all_deeper_counts = []
@@ -328,15 +526,21 @@ def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> No
     commit_versions = sorted(commits_by_version.keys())
     commit_counts = [commits_by_version[y] for y in commit_versions]
 
+    # Long tables: first page inline, the rest in fragments
+    dependents_row_count = (len(dependents_table_data) + 3) // 4
+    paginate_dependents = fragments is not None and fragments.paginates(dependents_row_count)
+    paginate_contributors = fragments is not None and fragments.paginates(len(contributors))
+
     # Generate HTML
-    html_content = f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{library_name} - Boost Library Dashboard</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>{_get_library_css()}</style>
+    <script src="../{assets['charts_js']}"></script>
+    <link rel="stylesheet" href="../{assets['library_css']}">
 </head>
 <body>
     <div class="back-link">
@@ -361,11 +565,21 @@ def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> No
                             <th colspan="4">Dependent Libraries (Latest Version: {latest_version_str})</th>
                         </tr>
                     </thead>
-                    <tbody>
-{_build_dependents_table_html(dependents_table_data)}
+                    <tbody{' id="dependents-rows"' if paginate_dependents else ''}>
+"""
+    rows = _iter_dependents_rows(dependents_table_data)
+    if paginate_dependents:
+        yield from islice(rows, fragments.page_rows)
+        dependents_fragments = fragments.write_remaining("dependents", rows)
+    else:
+        yield from rows
+    yield """
                     </tbody>
                 </table>
-            </div>
+"""
+    if paginate_dependents:
+        yield _show_more_button("dependents-rows", dependents_fragments, dependents_row_count - fragments.page_rows)
+    yield """            </div>
             <div class="chart-container">
                 <canvas id="dependentsChart"></canvas>
             </div>
@@ -385,7 +599,11 @@ def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> No
                             <th>Usage Count</th>
                         </tr>
                     </thead>
-{_build_top_repos_table_html(top_repos)}
+"""
+    yield _TBODY_OPEN
+    yield from _iter_top_repos_rows(top_repos)
+    yield _TBODY_CLOSE
+    yield """
                 </table>
             </div>
             <div class="chart-container">
@@ -406,9 +624,21 @@ def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> No
                             <th>Commit Count</th>
                         </tr>
                     </thead>
-{_build_contributor_table_html(contributors)}
+"""
+    yield _TBODY_OPEN.replace("<tbody>", '<tbody id="contributors-rows">') if paginate_contributors else _TBODY_OPEN
+    rows = _iter_contributor_rows(contributors)
+    if paginate_contributors:
+        yield from islice(rows, fragments.page_rows)
+        contributor_fragments = fragments.write_remaining("contributors", rows)
+    else:
+        yield from rows
+    yield _TBODY_CLOSE
+    yield """
                 </table>
-            </div>
+"""
+    if paginate_contributors:
+        yield _show_more_button("contributors-rows", contributor_fragments, len(contributors) - fragments.page_rows)
+    yield f"""            </div>
             <div class="chart-container">
                 <canvas id="commitChart"></canvas>
             </div>
@@ -424,9 +654,20 @@ def create_library_html_from_data(data: Dict[str, Any], library_name: str) -> No
 </html>
 """
 
-    library_file = LIBRARIES_DIR / f"{library_name}.html"
-    library_file.write_text(html_content, encoding="utf-8")
-    print(f"Created {library_file}")
+
+def create_library_html_from_data(
+    data: Dict[str, Any],
+    library_name: str,
+    assets: Optional[Dict[str, str]] = None,
+    page_rows: int = DEFAULT_TABLE_PAGE_ROWS,
+) -> None:
+    """Create HTML file for a specific library from pre-collected data."""
+    if assets is None:
+        assets = write_dashboard_assets()
+    if not write_library_page(data, library_name, assets, page_rows):
+        print(f"Warning: No data found for library {library_name}")
+        return
+    print(f"Created {DASHBOARD_DIR / _library_page(library_name)}")
 
 
 def _rows_to_list(rows: List[Any]) -> List[Dict[str, Any]]:
@@ -436,38 +677,20 @@ def _rows_to_list(rows: List[Any]) -> List[Dict[str, Any]]:
 
 # ===== HTML Template Functions =====
 
+def _js_json(value: Any) -> str:
+    """Compact JSON for embedding in an inline <script> block."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+
+
+def _border_color(color: str) -> str:
+    """Opaque border variant of a translucent fill color."""
+    return color.replace("0.6", "1")
+
+
 def _build_chart_js(chart_id: str, labels: List[str], data: List[int], label: str, color: str = "rgba(54, 162, 235, 0.6)") -> str:
-    """Build Chart.js JavaScript code for a bar chart."""
-    labels_json = json.dumps(labels)
-    data_json = json.dumps(data)
-    return f"""
-        new Chart(document.getElementById('{chart_id}'), {{
-            type: 'bar',
-            data: {{
-                labels: {labels_json},
-                datasets: [{{
-                    label: '{label}',
-                    data: {data_json},
-                    backgroundColor: '{color}',
-                    borderColor: '{color.replace("0.6", "1")}',
-                    borderWidth: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        display: true
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true
-                    }}
-                }}
-            }}
-        }});
-    """
+    """Build a BoostCharts.bar() call for a bar chart."""
+    spec = {"labels": labels, "data": data, "label": label, "color": color, "borderColor": _border_color(color)}
+    return f"BoostCharts.bar({_js_json(chart_id)},{_js_json(spec)});"
 
 
 def _build_dual_chart_js(
@@ -478,199 +701,36 @@ def _build_dual_chart_js(
     bar_label: str,
     line_label: str,
     bar_color: str = "rgba(54, 162, 235, 0.6)",
-    line_color: str = "rgba(255, 99, 132, 0.8)"
+    line_color: str = "rgba(255, 99, 132, 0.8)",
+    rotate: bool = False
 ) -> str:
-    """Build Chart.js JavaScript code for a dual chart (bar + line for cumulative)."""
-    labels_json = json.dumps(labels)
-    bar_data_json = json.dumps(bar_data)
-    line_data_json = json.dumps(line_data)
-    return f"""
-        new Chart(document.getElementById('{chart_id}'), {{
-            type: 'bar',
-            data: {{
-                labels: {labels_json},
-                datasets: [{{
-                    label: '{bar_label}',
-                    type: 'bar',
-                    data: {bar_data_json},
-                    backgroundColor: '{bar_color}',
-                    borderColor: '{bar_color.replace("0.6", "1")}',
-                    borderWidth: 2,
-                    borderRadius: 4,
-                    order: 2
-                }}, {{
-                    label: '{line_label}',
-                    type: 'line',
-                    data: {line_data_json},
-                    borderColor: '{line_color}',
-                    backgroundColor: 'transparent',
-                    borderWidth: 3,
-                    pointRadius: 5,
-                    pointHoverRadius: 7,
-                    pointBackgroundColor: '{line_color}',
-                    pointBorderColor: '#fff',
-                    pointBorderWidth: 2,
-                    fill: false,
-                    tension: 0.3,
-                    yAxisID: 'y1',
-                    order: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                interaction: {{
-                    mode: 'index',
-                    intersect: false
-                }},
-                plugins: {{
-                    legend: {{
-                        display: true,
-                        position: 'top',
-                        labels: {{
-                            usePointStyle: true,
-                            padding: 15,
-                            font: {{
-                                size: 13,
-                                weight: '500'
-                            }}
-                        }}
-                    }},
-                    tooltip: {{
-                        backgroundColor: 'rgba(0, 0, 0, 0.8)',
-                        padding: 12,
-                        titleFont: {{
-                            size: 14,
-                            weight: 'bold'
-                        }},
-                        bodyFont: {{
-                            size: 13
-                        }},
-                        borderColor: 'rgba(255, 255, 255, 0.1)',
-                        borderWidth: 1,
-                        displayColors: true,
-                        callbacks: {{
-                            label: function(context) {{
-                                let label = context.dataset.label || '';
-                                if (label) {{
-                                    label += ': ';
-                                }}
-                                if (context.parsed.y !== null) {{
-                                    label += context.parsed.y.toLocaleString();
-                                }}
-                                return label;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'left',
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: '{bar_label}',
-                            font: {{
-                                size: 12,
-                                weight: '600'
-                            }},
-                            color: '{bar_color.replace("0.6", "1")}'
-                        }},
-                        ticks: {{
-                            callback: function(value) {{
-                                return value.toLocaleString();
-                            }},
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            color: 'rgba(0, 0, 0, 0.05)'
-                        }}
-                    }},
-                    y1: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'right',
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: '{line_label}',
-                            font: {{
-                                size: 12,
-                                weight: '600'
-                            }},
-                            color: '{line_color}'
-                        }},
-                        ticks: {{
-                            callback: function(value) {{
-                                return value.toLocaleString();
-                            }},
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            drawOnChartArea: false
-                        }}
-                    }},
-                    x: {{
-                        ticks: {{
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            color: 'rgba(0, 0, 0, 0.05)'
-                        }}
-                    }}
-                }}
-            }}
-        }});
-    """
+    """Build a BoostCharts.dual() call for a dual chart (bar + line for cumulative)."""
+    spec = {
+        "labels": labels,
+        "barData": bar_data,
+        "lineData": line_data,
+        "barLabel": bar_label,
+        "lineLabel": line_label,
+        "barColor": bar_color,
+        "barBorderColor": _border_color(bar_color),
+        "lineColor": line_color,
+    }
+    if rotate:
+        spec["rotate"] = True
+    return f"BoostCharts.dual({_js_json(chart_id)},{_js_json(spec)});"
 
 
 def _build_chart_js_with_rotation(chart_id: str, labels: List[str], data: List[int], label: str, color: str = "rgba(75, 192, 192, 0.6)") -> str:
-    """Build Chart.js JavaScript code for a bar chart with rotated x-axis labels."""
-    labels_json = json.dumps(labels)
-    data_json = json.dumps(data)
-    return f"""
-        new Chart(document.getElementById('{chart_id}'), {{
-            type: 'bar',
-            data: {{
-                labels: {labels_json},
-                datasets: [{{
-                    label: '{label}',
-                    data: {data_json},
-                    backgroundColor: '{color}',
-                    borderColor: '{color.replace("0.6", "1")}',
-                    borderWidth: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        display: true
-                    }}
-                }},
-                scales: {{
-                    x: {{
-                        ticks: {{
-                            autoSkip: true,
-                            maxRotation: 90,
-                            minRotation: 45
-                        }}
-                    }},
-                    y: {{
-                        beginAtZero: true
-                    }}
-                }}
-            }}
-        }});
-    """
+    """Build a BoostCharts.bar() call for a bar chart with rotated x-axis labels."""
+    spec = {
+        "labels": labels,
+        "data": data,
+        "label": label,
+        "color": color,
+        "borderColor": _border_color(color),
+        "rotate": True,
+    }
+    return f"BoostCharts.bar({_js_json(chart_id)},{_js_json(spec)});"
 
 
 def _build_dual_chart_js_with_rotation(
@@ -683,192 +743,38 @@ def _build_dual_chart_js_with_rotation(
     bar_color: str = "rgba(75, 192, 192, 0.6)",
     line_color: str = "rgba(255, 159, 64, 0.8)"
 ) -> str:
-    """Build Chart.js JavaScript code for a dual chart (bar + line for cumulative) with rotated x-axis labels."""
-    labels_json = json.dumps(labels)
-    bar_data_json = json.dumps(bar_data)
-    line_data_json = json.dumps(line_data)
-    return f"""
-        new Chart(document.getElementById('{chart_id}'), {{
-            type: 'bar',
-            data: {{
-                labels: {labels_json},
-                datasets: [{{
-                    label: '{bar_label}',
-                    type: 'bar',
-                    data: {bar_data_json},
-                    backgroundColor: '{bar_color}',
-                    borderColor: '{bar_color.replace("0.6", "1")}',
-                    borderWidth: 2,
-                    borderRadius: 4,
-                    order: 2
-                }}, {{
-                    label: '{line_label}',
-                    type: 'line',
-                    data: {line_data_json},
-                    borderColor: '{line_color}',
-                    backgroundColor: 'transparent',
-                    borderWidth: 3,
-                    pointRadius: 5,
-                    pointHoverRadius: 7,
-                    pointBackgroundColor: '{line_color}',
-                    pointBorderColor: '#fff',
-                    pointBorderWidth: 2,
-                    fill: false,
-                    tension: 0.3,
-                    yAxisID: 'y1',
-                    order: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                interaction: {{
-                    mode: 'index',
-                    intersect: false
-                }},
-                plugins: {{
-                    legend: {{
-                        display: true,
-                        position: 'top',
-                        labels: {{
-                            usePointStyle: true,
-                            padding: 15,
-                            font: {{
-                                size: 13,
-                                weight: '500'
-                            }}
-                        }}
-                    }},
-                    tooltip: {{
-                        backgroundColor: 'rgba(0, 0, 0, 0.8)',
-                        padding: 12,
-                        titleFont: {{
-                            size: 14,
-                            weight: 'bold'
-                        }},
-                        bodyFont: {{
-                            size: 13
-                        }},
-                        borderColor: 'rgba(255, 255, 255, 0.1)',
-                        borderWidth: 1,
-                        displayColors: true,
-                        callbacks: {{
-                            label: function(context) {{
-                                let label = context.dataset.label || '';
-                                if (label) {{
-                                    label += ': ';
-                                }}
-                                if (context.parsed.y !== null) {{
-                                    label += context.parsed.y.toLocaleString();
-                                }}
-                                return label;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'left',
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: '{bar_label}',
-                            font: {{
-                                size: 12,
-                                weight: '600'
-                            }},
-                            color: '{bar_color.replace("0.6", "1")}'
-                        }},
-                        ticks: {{
-                            callback: function(value) {{
-                                return value.toLocaleString();
-                            }},
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            color: 'rgba(0, 0, 0, 0.05)'
-                        }}
-                    }},
-                    y1: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'right',
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: '{line_label}',
-                            font: {{
-                                size: 12,
-                                weight: '600'
-                            }},
-                            color: '{line_color}'
-                        }},
-                        ticks: {{
-                            callback: function(value) {{
-                                return value.toLocaleString();
-                            }},
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            drawOnChartArea: false
-                        }}
-                    }},
-                    x: {{
-                        ticks: {{
-                            autoSkip: true,
-                            maxRotation: 90,
-                            minRotation: 45,
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            color: 'rgba(0, 0, 0, 0.05)'
-                        }}
-                    }}
-                }}
-            }}
-        }});
-    """
+    """Build a BoostCharts.dual() call for a dual chart with rotated x-axis labels."""
+    return _build_dual_chart_js(
+        chart_id, labels, bar_data, line_data, bar_label, line_label, bar_color, line_color, rotate=True
+    )
 
 
-def _build_library_table_html(libraries: List[Dict[str, Any]], link_prefix: str = "libraries/") -> str:
-    """Build HTML table for library list."""
-    html = """
-                    <tbody>
-"""
+def _iter_library_rows(libraries: Iterable[Dict[str, Any]], link_prefix: str = "libraries/") -> Iterator[str]:
+    """Yield the <tr> markup of a library list table, one row at a time."""
     for lib in libraries:
         lib_name = lib.get("library_name", lib.get("name", ""))
         usage_count = lib.get("usage_count", 0)
-        html += f"""
+        yield f"""
                         <tr>
                             <td><a href="{link_prefix}{lib_name}.html">{lib_name}</a></td>
                             <td>{usage_count:,}</td>
                         </tr>
 """
-    html += """
-                    </tbody>
-"""
-    return html
 
 
-def _build_repo_table_html(repos: List[Dict[str, Any]]) -> str:
-    """Build HTML table for repository list."""
-    html = """
-                    <tbody>
-"""
+def _build_library_table_html(libraries: List[Dict[str, Any]], link_prefix: str = "libraries/") -> str:
+    """Build HTML table for library list."""
+    return _TBODY_OPEN + "".join(_iter_library_rows(libraries, link_prefix)) + _TBODY_CLOSE
+
+
+def _iter_repo_rows(repos: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the <tr> markup of a repository list table, one row at a time."""
     for repo in repos:
         repo_name = repo.get("repo_name", "")
         stars = repo.get("stars", 0) or "N/A"
         usage_count = repo.get("usage_count", 0)
         created = repo.get("created_at", "")[:10] if repo.get("created_at") else "N/A"
-        html += f"""
+        yield f"""
                         <tr>
                             <td><a href="https://github.com/{repo_name}" target="_blank">{repo_name}</a></td>
                             <td>{stars if isinstance(stars, str) else f'{stars:,}'}</td>
@@ -876,19 +782,17 @@ def _build_repo_table_html(repos: List[Dict[str, Any]]) -> str:
                             <td>{created}</td>
                         </tr>
 """
-    html += """
-                    </tbody>
-"""
-    return html
 
 
-def _build_activity_table_html(libs: List[Dict[str, Any]]) -> str:
-    """Build HTML table for library activity metrics."""
-    html = """
-                    <tbody>
-"""
+def _build_repo_table_html(repos: List[Dict[str, Any]]) -> str:
+    """Build HTML table for repository list."""
+    return _TBODY_OPEN + "".join(_iter_repo_rows(repos)) + _TBODY_CLOSE
+
+
+def _iter_activity_rows(libs: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the <tr> markup of the library activity table, one row at a time."""
     for lib in libs:
-        html += f"""
+        yield f"""
                         <tr>
                             <td><a href="libraries/{lib['name']}.html">{lib['name']}</a></td>
                             <td>{lib['recent_usage']:,}</td>
@@ -899,28 +803,27 @@ def _build_activity_table_html(libs: List[Dict[str, Any]]) -> str:
                             <td>{lib['derivation_score']:.3f}</td>
                         </tr>
 """
-    html += """
-                    </tbody>
-"""
-    return html
 
 
-def _build_dependents_table_html(dependents: List[Dict[str, Any]]) -> str:
+def _build_activity_table_html(libs: List[Dict[str, Any]]) -> str:
+    """Build HTML table for library activity metrics."""
+    return _TBODY_OPEN + "".join(_iter_activity_rows(libs)) + _TBODY_CLOSE
+
+
+def _iter_dependents_rows(dependents: List[Any]) -> Iterator[str]:
     """
-    Build HTML table for dependents with depth-based coloring (4 columns per row).
+    Yield the <tr> markup of the dependents table with depth-based coloring (4 cells per row).
 
     Args:
         dependents: List of dicts with "name" and "depth" keys, or list of strings (for backward compatibility)
     """
     if not dependents:
-        return """
+        yield """
                 <tr>
                     <td colspan="4">No dependencies found</td>
                 </tr>
 """
-    # Handle backward compatibility: if list of strings, convert to dicts
-    if dependents and isinstance(dependents[0], str):
-        dependents = [{"name": dep, "depth": 1} for dep in dependents]
+        return
 
     # Depth color mapping: depth 1 = blue, depth 2 = green, depth 3+ = orange/red
     depth_colors = {
@@ -930,75 +833,82 @@ def _build_dependents_table_html(dependents: List[Dict[str, Any]]) -> str:
         4: "#ef4444",  # Red
     }
 
-    html = ""
     for i in range(0, len(dependents), 4):
-        chunk = dependents[i:i + 4]
+        chunk = list(dependents[i:i + 4])
         while len(chunk) < 4:
             chunk.append(None)
-        html += "<tr>"
+        cells = []
         for dep in chunk:
             if dep:
+                # Handle backward compatibility: plain strings are direct dependencies
                 depth = dep.get("depth", 1) if isinstance(dep, dict) else 1
                 name = dep.get("name", dep) if isinstance(dep, dict) else str(dep)
                 color = depth_colors.get(depth, depth_colors.get(4, "#6b7280"))
-                html += f'<td style="background-color: {color}20; border-left: 3px solid {color};"><a href="{name}.html" style="color: {color}; font-weight: {"bold" if depth == 1 else "normal"};">{name}</a> <span style="color: {color}; font-size: 0.85em; opacity: 0.7;">(d{depth})</span></td>'
+                cells.append(f'<td style="background-color: {color}20; border-left: 3px solid {color};"><a href="{name}.html" style="color: {color}; font-weight: {"bold" if depth == 1 else "normal"};">{name}</a> <span style="color: {color}; font-size: 0.85em; opacity: 0.7;">(d{depth})</span></td>')
             else:
-                html += "<td></td>"
-        html += "</tr>\n"
-    return html
+                cells.append("<td></td>")
+        yield "<tr>" + "".join(cells) + "</tr>\n"
 
 
-def _build_contributor_table_html(contributors: List[Dict[str, Any]]) -> str:
-    """Build HTML table for contributors."""
-    html = """
-                    <tbody>
-"""
-    if contributors:
-        for contrib in contributors:
-            name = contrib.get('identity_name', contrib.get('email_address', 'N/A'))
-            count = contrib.get('commit_count', 0)
-            html += f"""
+def _build_dependents_table_html(dependents: List[Dict[str, Any]]) -> str:
+    """
+    Build HTML table for dependents with depth-based coloring (4 columns per row).
+
+    Args:
+        dependents: List of dicts with "name" and "depth" keys, or list of strings (for backward compatibility)
+    """
+    return "".join(_iter_dependents_rows(dependents))
+
+
+def _iter_contributor_rows(contributors: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the <tr> markup of the contributor table, one row at a time."""
+    empty = True
+    for contrib in contributors:
+        empty = False
+        name = contrib.get('identity_name', contrib.get('email_address', 'N/A'))
+        count = contrib.get('commit_count', 0)
+        yield f"""
                 <tr>
                     <td>{name}</td>
                     <td>{count:,}</td>
                 </tr>
 """
-    else:
-        html += """
+    if empty:
+        yield """
                 <tr>
                     <td colspan="2">No commit data available (boost_commit table not yet populated)</td>
                 </tr>
 """
-    html += """
-                    </tbody>
-"""
-    return html
 
 
-def _build_top_repos_table_html(repos: List[Dict[str, Any]]) -> str:
-    """Build HTML table for top repositories."""
-    html = """
-                    <tbody>
-"""
-    if repos:
-        for repo in repos:
-            html += f"""
+def _build_contributor_table_html(contributors: List[Dict[str, Any]]) -> str:
+    """Build HTML table for contributors."""
+    return _TBODY_OPEN + "".join(_iter_contributor_rows(contributors)) + _TBODY_CLOSE
+
+
+def _iter_top_repos_rows(repos: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the <tr> markup of the top repositories table, one row at a time."""
+    empty = True
+    for repo in repos:
+        empty = False
+        yield f"""
                 <tr>
                     <td><a href="https://github.com/{repo['repo_name']}" target="_blank">{repo['repo_name']}</a></td>
                     <td>{repo['stars']:,}</td>
                     <td>{repo['usage_count']:,}</td>
                 </tr>
 """
-    else:
-        html += """
+    if empty:
+        yield """
                 <tr>
                     <td colspan="3">No repositories found</td>
                 </tr>
 """
-    html += """
-                    </tbody>
-"""
-    return html
+
+
+def _build_top_repos_table_html(repos: List[Dict[str, Any]]) -> str:
+    """Build HTML table for top repositories."""
+    return _TBODY_OPEN + "".join(_iter_top_repos_rows(repos)) + _TBODY_CLOSE
 
 
 def _build_dependents_chart_js(
@@ -1007,119 +917,9 @@ def _build_dependents_chart_js(
     first_level_data: List[int],
     all_deeper_data: List[int]
 ) -> str:
-    """Build Chart.js JavaScript code for dependents chart with two datasets per version."""
-    versions_json = json.dumps(versions)
-    first_level_json = json.dumps(first_level_data)
-    all_deeper_json = json.dumps(all_deeper_data)
-
-    return f"""
-        new Chart(document.getElementById('{chart_id}'), {{
-            type: 'bar',
-            data: {{
-                labels: {versions_json},
-                datasets: [{{
-                    label: 'First-Level Dependencies',
-                    data: {first_level_json},
-                    backgroundColor: 'rgba(59, 130, 246, 0.7)',
-                    borderColor: 'rgba(59, 130, 246, 1)',
-                    borderWidth: 2,
-                    borderRadius: 4
-                }}, {{
-                    label: 'All Deeper Dependencies',
-                    data: {all_deeper_json},
-                    backgroundColor: 'rgba(16, 185, 129, 0.7)',
-                    borderColor: 'rgba(16, 185, 129, 1)',
-                    borderWidth: 2,
-                    borderRadius: 4
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                interaction: {{
-                    mode: 'index',
-                    intersect: false
-                }},
-                plugins: {{
-                    legend: {{
-                        display: true,
-                        position: 'top',
-                        labels: {{
-                            usePointStyle: true,
-                            padding: 15,
-                            font: {{
-                                size: 13,
-                                weight: '500'
-                            }}
-                        }}
-                    }},
-                    tooltip: {{
-                        backgroundColor: 'rgba(0, 0, 0, 0.8)',
-                        padding: 12,
-                        titleFont: {{
-                            size: 14,
-                            weight: 'bold'
-                        }},
-                        bodyFont: {{
-                            size: 13
-                        }},
-                        borderColor: 'rgba(255, 255, 255, 0.1)',
-                        borderWidth: 1,
-                        displayColors: true,
-                        callbacks: {{
-                            label: function(context) {{
-                                let label = context.dataset.label || '';
-                                if (label) {{
-                                    label += ': ';
-                                }}
-                                if (context.parsed.y !== null) {{
-                                    label += context.parsed.y.toLocaleString();
-                                }}
-                                return label;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    x: {{
-                        ticks: {{
-                            autoSkip: true,
-                            maxRotation: 90,
-                            minRotation: 45,
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            color: 'rgba(0, 0, 0, 0.05)'
-                        }}
-                    }},
-                    y: {{
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: 'Dependency Count',
-                            font: {{
-                                size: 12,
-                                weight: '600'
-                            }}
-                        }},
-                        ticks: {{
-                            callback: function(value) {{
-                                return value.toLocaleString();
-                            }},
-                            font: {{
-                                size: 11
-                            }}
-                        }},
-                        grid: {{
-                            color: 'rgba(0, 0, 0, 0.05)'
-                        }}
-                    }}
-                }}
-            }}
-        }});
-    """
+    """Build a BoostCharts.dependents() call for the dependents chart with two datasets per version."""
+    spec = {"labels": versions, "firstLevel": first_level_data, "allDeeper": all_deeper_data}
+    return f"BoostCharts.dependents({_js_json(chart_id)},{_js_json(spec)});"
 
 
 def _get_index_css() -> str:
@@ -1432,6 +1232,16 @@ def _get_library_css() -> str:
         .depth-3, .depth-4, .depth-5 {
             background-color: #fef3c7;
         }
+        .show-more {
+            margin-top: 10px;
+            padding: 8px 16px;
+            border: 1px solid #667eea;
+            border-radius: 6px;
+            background: #fff;
+            color: #667eea;
+            font-weight: 600;
+            cursor: pointer;
+        }
         @media (max-width: 1200px) {
             .panel-row {
                 grid-template-columns: 1fr;
@@ -1449,6 +1259,273 @@ def _get_library_css() -> str:
     """
 
 
+# ===== Shared assets =====
+
+ASSETS_DIR = DASHBOARD_DIR / "assets"
+
+
+def _get_charts_js() -> str:
+    """Return the BoostCharts factory shared by all pages (bar, dual bar/line and dependents charts)."""
+    return """(function () {
+    'use strict';
+
+    function tooltipLabel(context) {
+        let label = context.dataset.label || '';
+        if (label) {
+            label += ': ';
+        }
+        if (context.parsed.y !== null) {
+            label += context.parsed.y.toLocaleString();
+        }
+        return label;
+    }
+
+    function tickLabel(value) {
+        return value.toLocaleString();
+    }
+
+    function legend() {
+        return {
+            display: true,
+            position: 'top',
+            labels: { usePointStyle: true, padding: 15, font: { size: 13, weight: '500' } }
+        };
+    }
+
+    function tooltip() {
+        return {
+            backgroundColor: 'rgba(0, 0, 0, 0.8)',
+            padding: 12,
+            titleFont: { size: 14, weight: 'bold' },
+            bodyFont: { size: 13 },
+            borderColor: 'rgba(255, 255, 255, 0.1)',
+            borderWidth: 1,
+            displayColors: true,
+            callbacks: { label: tooltipLabel }
+        };
+    }
+
+    function axisTitle(text, color) {
+        const title = { display: true, text: text, font: { size: 12, weight: '600' } };
+        if (color) {
+            title.color = color;
+        }
+        return title;
+    }
+
+    function xAxis(rotate) {
+        const ticks = rotate ? { autoSkip: true, maxRotation: 90, minRotation: 45 } : {};
+        ticks.font = { size: 11 };
+        return { ticks: ticks, grid: { color: 'rgba(0, 0, 0, 0.05)' } };
+    }
+
+    // Simple bar chart: {labels, data, label, color, borderColor, rotate}
+    function bar(chartId, spec) {
+        const scales = { y: { beginAtZero: true } };
+        if (spec.rotate) {
+            scales.x = { ticks: { autoSkip: true, maxRotation: 90, minRotation: 45 } };
+        }
+        return new Chart(document.getElementById(chartId), {
+            type: 'bar',
+            data: {
+                labels: spec.labels,
+                datasets: [{
+                    label: spec.label,
+                    data: spec.data,
+                    backgroundColor: spec.color,
+                    borderColor: spec.borderColor,
+                    borderWidth: 1
+                }]
+            },
+            options: {
+                responsive: true,
+                plugins: { legend: { display: true } },
+                scales: scales
+            }
+        });
+    }
+
+    // Bar + cumulative line on a second axis:
+    // {labels, barData, lineData, barLabel, lineLabel, barColor, barBorderColor, lineColor, rotate}
+    function dual(chartId, spec) {
+        return new Chart(document.getElementById(chartId), {
+            type: 'bar',
+            data: {
+                labels: spec.labels,
+                datasets: [{
+                    label: spec.barLabel,
+                    type: 'bar',
+                    data: spec.barData,
+                    backgroundColor: spec.barColor,
+                    borderColor: spec.barBorderColor,
+                    borderWidth: 2,
+                    borderRadius: 4,
+                    order: 2
+                }, {
+                    label: spec.lineLabel,
+                    type: 'line',
+                    data: spec.lineData,
+                    borderColor: spec.lineColor,
+                    backgroundColor: 'transparent',
+                    borderWidth: 3,
+                    pointRadius: 5,
+                    pointHoverRadius: 7,
+                    pointBackgroundColor: spec.lineColor,
+                    pointBorderColor: '#fff',
+                    pointBorderWidth: 2,
+                    fill: false,
+                    tension: 0.3,
+                    yAxisID: 'y1',
+                    order: 1
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                interaction: { mode: 'index', intersect: false },
+                plugins: { legend: legend(), tooltip: tooltip() },
+                scales: {
+                    y: {
+                        type: 'linear',
+                        display: true,
+                        position: 'left',
+                        beginAtZero: true,
+                        title: axisTitle(spec.barLabel, spec.barBorderColor),
+                        ticks: { callback: tickLabel, font: { size: 11 } },
+                        grid: { color: 'rgba(0, 0, 0, 0.05)' }
+                    },
+                    y1: {
+                        type: 'linear',
+                        display: true,
+                        position: 'right',
+                        beginAtZero: true,
+                        title: axisTitle(spec.lineLabel, spec.lineColor),
+                        ticks: { callback: tickLabel, font: { size: 11 } },
+                        grid: { drawOnChartArea: false }
+                    },
+                    x: xAxis(spec.rotate)
+                }
+            }
+        });
+    }
+
+    // First-level vs. all transitive dependents per version: {labels, firstLevel, allDeeper}
+    function dependents(chartId, spec) {
+        return new Chart(document.getElementById(chartId), {
+            type: 'bar',
+            data: {
+                labels: spec.labels,
+                datasets: [{
+                    label: 'First-Level Dependencies',
+                    data: spec.firstLevel,
+                    backgroundColor: 'rgba(59, 130, 246, 0.7)',
+                    borderColor: 'rgba(59, 130, 246, 1)',
+                    borderWidth: 2,
+                    borderRadius: 4
+                }, {
+                    label: 'All Deeper Dependencies',
+                    data: spec.allDeeper,
+                    backgroundColor: 'rgba(16, 185, 129, 0.7)',
+                    borderColor: 'rgba(16, 185, 129, 1)',
+                    borderWidth: 2,
+                    borderRadius: 4
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                interaction: { mode: 'index', intersect: false },
+                plugins: { legend: legend(), tooltip: tooltip() },
+                scales: {
+                    x: xAxis(true),
+                    y: {
+                        beginAtZero: true,
+                        title: axisTitle('Dependency Count'),
+                        ticks: { callback: tickLabel, font: { size: 11 } },
+                        grid: { color: 'rgba(0, 0, 0, 0.05)' }
+                    }
+                }
+            }
+        });
+    }
+
+    window.BoostCharts = { bar: bar, dual: dual, dependents: dependents };
+
+    // "Show more" button of a paginated table: appends the next row fragment to the
+    // tbody named by data-target; data-fragments is a JSON list of fragment URLs
+    function loadMore(button) {
+        const fragments = JSON.parse(button.dataset.fragments);
+        const next = Number(button.dataset.next || 0);
+        button.disabled = true;
+        fetch(fragments[next])
+            .then(function (response) { return response.text(); })
+            .then(function (rows) {
+                document.getElementById(button.dataset.target).insertAdjacentHTML('beforeend', rows);
+                button.dataset.next = next + 1;
+                button.disabled = false;
+                if (next + 1 >= fragments.length) {
+                    button.remove();
+                }
+            });
+    }
+
+    window.BoostTables = { loadMore: loadMore };
+})();
+"""
+
+
+def _dashboard_assets() -> Dict[str, Tuple[str, str]]:
+    """
+    Shared stylesheet and script assets, keyed by role.
+
+    Returns:
+        Dict mapping "index_css" / "library_css" / "charts_js" to (href, content), where
+        href is relative to DASHBOARD_DIR and contains a content fingerprint, so the files
+        can be cached indefinitely and a changed asset always gets a new URL.
+    """
+    sources = {
+        "index_css": ("index", "css", _get_index_css()),
+        "library_css": ("library", "css", _get_library_css()),
+        "charts_js": ("charts", "js", _get_charts_js()),
+    }
+    assets = {}
+    for key, (stem, ext, content) in sources.items():
+        fingerprint = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+        assets[key] = (f"assets/{stem}.{fingerprint}.{ext}", content)
+    return assets
+
+
+def asset_hrefs() -> Dict[str, str]:
+    """Fingerprinted hrefs of the shared assets, relative to DASHBOARD_DIR."""
+    return {key: href for key, (href, _) in _dashboard_assets().items()}
+
+
+def write_dashboard_assets() -> Dict[str, str]:
+    """Write shared assets that are not on disk yet and return their hrefs."""
+    hrefs = {}
+    for key, (href, content) in _dashboard_assets().items():
+        asset_file = DASHBOARD_DIR / href
+        if not asset_file.exists():
+            _write_text_atomic(asset_file, content)
+            print(f"Created {asset_file}")
+        hrefs[key] = href
+    return hrefs
+
+
+def _remove_stale_assets(current_hrefs: Dict[str, str]) -> List[str]:
+    """Delete fingerprinted assets no longer referenced by the current templates."""
+    if not ASSETS_DIR.exists():
+        return []
+    current = set(current_hrefs.values())
+    removed = []
+    for asset_file in sorted(ASSETS_DIR.iterdir()):
+        href = asset_file.relative_to(DASHBOARD_DIR).as_posix()
+        if asset_file.is_file() and href not in current:
+            asset_file.unlink()
+            removed.append(href)
+    return removed
+
+
 # ===== Data Collection Functions =====
 
 def _collect_index_data(db: Any, db1: Any) -> Dict[str, Any]:
@@ -1593,10 +1670,14 @@ def _collect_index_data(db: Any, db1: Any) -> Dict[str, Any]:
     return data
 
 
-def _collect_dependents_data(db: Any) -> Dict[int, Dict[str, Any]]:
+def _collect_dependents_data(db: Any, versions: Optional[VersionIndex] = None) -> Dict[int, Dict[str, Any]]:
     """
     Collect dependents data for all libraries with transitive dependencies and depth tracking.
 
+    Args:
+        db: Connector for boost_usage.db
+        versions: Shared boost_version ordering (loaded here if omitted)
+
     Returns:
         Dict mapping library_id to {
             "table_data": List[Dict with name, depth] for latest version with dependents,
@@ -1617,85 +1698,16 @@ def _collect_dependents_data(db: Any) -> Dict[int, Dict[str, Any]]:
     libraries = db.fetchall("SELECT id, name FROM boost_library ORDER BY name")
     library_id_to_name = {row["id"]: row["name"] for row in libraries}
 
-    versions = db.fetchall("SELECT id, version, major, minor, patch FROM boost_version ORDER BY major DESC, minor DESC, patch DESC")
-    version_id_to_version = {row["id"]: row["version"] for row in versions}
-    version_id_to_info = {row["id"]: row for row in versions}
+    if versions is None:
+        versions = VersionIndex.from_db(db)
 
-    # Build dependency graph: library_id -> version_id -> list of direct dependency library_ids
-    dependency_graph = {}
-    for row in dependencies:
-        main_lib_id = row["main_library_id"]
-        dep_lib_id = row["dependency_library_id"]
-        version_id = row["version_id"]
+    # Shortest-depth closures for every (library, version), computed once per distinct graph
+    closure_index = DependencyClosureIndex.from_rows(dependencies)
 
-        if main_lib_id not in dependency_graph:
-            dependency_graph[main_lib_id] = {}
-        if version_id not in dependency_graph[main_lib_id]:
-            dependency_graph[main_lib_id][version_id] = []
-        dependency_graph[main_lib_id][version_id].append(dep_lib_id)
-
-    def find_all_transitive_deps(main_lib_id: int, version_id: int, graph: Dict) -> Dict[int, int]:
-        """
-        Find all transitive dependencies with depth tracking using BFS.
-        Returns: Dict mapping dependency_library_id to depth (1 = direct, 2+ = transitive)
-        Excludes the main library itself from dependencies.
-        """
-        if main_lib_id not in graph or version_id not in graph[main_lib_id]:
-            return {}
-
-        all_deps = {}  # dep_lib_id -> depth
-        # Filter out self-dependencies from initial queue
-        initial_deps = [dep_id for dep_id in graph[main_lib_id][version_id] if dep_id != main_lib_id]
-        queue = [(dep_id, 1) for dep_id in initial_deps]  # (lib_id, depth)
-        visited = set()
-        visited.add(main_lib_id)  # Exclude main library from visited set
-
-        while queue:
-            current_lib_id, depth = queue.pop(0)
-
-            if current_lib_id in visited or current_lib_id == main_lib_id:
-                continue
-            visited.add(current_lib_id)
-
-            # Record this dependency with its depth
-            if current_lib_id not in all_deps or all_deps[current_lib_id] > depth:
-                all_deps[current_lib_id] = depth
-
-            # Add transitive dependencies (if this library also has dependencies in this version)
-            if current_lib_id in graph and version_id in graph[current_lib_id]:
-                for next_dep_id in graph[current_lib_id][version_id]:
-                    # Exclude self-dependencies and the main library
-                    if next_dep_id not in visited and next_dep_id != main_lib_id and next_dep_id != current_lib_id:
-                        queue.append((next_dep_id, depth + 1))
-
-        return all_deps
-
-    # Find the latest version from boost_version table
-    latest_version_id = sorted(version_id_to_version.keys(),
-                               key=lambda vid: (version_id_to_info[vid]["major"],
-                                               version_id_to_info[vid]["minor"],
-                                               version_id_to_info[vid]["patch"]),
-                               reverse=True)[0]
-    latest_version_str = version_id_to_version[latest_version_id]
-    latest_version_info = version_id_to_info[latest_version_id]
-
-    # Get all versions from 1.66.0 to latest version for chart x-axis
-    all_versions_for_chart = []
-    for vid in sorted(version_id_to_version.keys(),
-                     key=lambda vid: (version_id_to_info[vid]["major"],
-                                     version_id_to_info[vid]["minor"],
-                                     version_id_to_info[vid]["patch"])):
-        version_str = version_id_to_version[vid]
-        major = version_id_to_info[vid]["major"]
-        minor = version_id_to_info[vid]["minor"]
-        patch = version_id_to_info[vid]["patch"]
-        # Include versions from 1.66.0 to latest version (inclusive)
-        if major == 1 and minor >= 66:
-            # Compare with latest version
-            if (major < latest_version_info["major"] or
-                (major == latest_version_info["major"] and minor < latest_version_info["minor"]) or
-                (major == latest_version_info["major"] and minor == latest_version_info["minor"] and patch <= latest_version_info["patch"])):
-                all_versions_for_chart.append(version_str)
+    # Latest version from boost_version table, and versions 1.66.0 to latest for the chart x-axis
+    latest_version_id = versions.latest_id
+    chart_version_ids = versions.chart_version_ids
+    all_versions_for_chart = versions.chart_versions
 
     total_dependents_by_library: Dict[int, Dict[str, Any]] = {}
 
@@ -1710,17 +1722,10 @@ def _collect_dependents_data(db: Any) -> Dict[int, Dict[str, Any]]:
                 "all_deeper": 0
             }
 
-        # Process each version for chart data
-        for version_id in sorted(version_id_to_version.keys(),
-                                 key=lambda vid: (version_id_to_info[vid]["major"],
-                                                 version_id_to_info[vid]["minor"],
-                                                 version_id_to_info[vid]["patch"])):
-            version_str = version_id_to_version[version_id]
-            # Only process versions in the range 1.66.0 to latest version
-            if version_str not in all_versions_for_chart:
-                continue
-
-            all_deps = find_all_transitive_deps(library_id, version_id, dependency_graph)
+        # Process each version in the range 1.66.0 to latest version for chart data
+        for version_id in chart_version_ids:
+            version_str = versions.version_by_id[version_id]
+            all_deps = closure_index.transitive_deps(library_id, version_id)
 
             # Separate first-level and deeper dependencies (exclude self)
             first_level = [lib_id for lib_id, depth in all_deps.items() if depth == 1 and lib_id != library_id]
@@ -1733,7 +1738,7 @@ def _collect_dependents_data(db: Any) -> Dict[int, Dict[str, Any]]:
             }
 
         # Build table data for latest version (always use latest version for all libraries)
-        all_deps = find_all_transitive_deps(library_id, latest_version_id, dependency_graph)
+        all_deps = closure_index.transitive_deps(library_id, latest_version_id)
         # Filter out self-dependencies and sort by depth, then name
         for dep_lib_id, depth in sorted(all_deps.items(), key=lambda x: (x[1], library_id_to_name.get(x[0], ""))):
             # Double-check: exclude self-dependencies
@@ -1753,205 +1758,277 @@ def _collect_dependents_data(db: Any) -> Dict[int, Dict[str, Any]]:
     return total_dependents_by_library
 
 
-def _collect_library_data(
-    db: Any, db1: Any,
-    lib_id: int,
-    library_name: str,
+def _collect_all_library_data(
+    db: Any,
+    libraries: List[Any],
     latest_version_id: Optional[int],
-    latest_version_str: Optional[str],
     table_exists: bool,
-) -> Dict[str, Any]:
-    """Collect data for a single library."""
-    lib_data: Dict[str, Any] = {}
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect boost_usage.db data for every library at once.
 
-    # Panel 1: Internal dependents
-    dependents_table_data = []
-    dependents_by_version = {}
+    Each query runs once over all libraries (window functions / GROUP BY library_id)
+    and the rows are partitioned by library in Python. Contribution data (Panel 3)
+    comes from ContributorIndex and is merged in by collect_dashboard_data().
+    """
+    library_ids = {row["id"]: row["name"] for row in libraries}
+    libraries_data: Dict[str, Dict[str, Any]] = {
+        name: {
+            "dependents_table_data": [],
+            "dependents_by_version": {},
+            "top_repos": [],
+            "usage_by_year": {},
+        }
+        for name in library_ids.values()
+    }
 
+    # Panel 1: Internal dependents
     if latest_version_id and table_exists:
-        dependencies = db.fetchall("""
+        for row in db.fetchall("""
             SELECT
-                bl.name as dep_library_name,
-                ld.version_id
+                ld.main_library_id,
+                bl.name as dep_library_name
             FROM library_dependency ld
             JOIN boost_library bl ON ld.dependency_library_id = bl.id
-            WHERE ld.main_library_id = ? AND ld.version_id = ?
-            ORDER BY bl.name
-        """, (lib_id, latest_version_id))
-
-        # Create table data with depth 1 (direct dependencies only in fallback)
-        dependents_table_data = [{"name": row["dep_library_name"], "depth": 1} for row in dependencies]
-
-        dep_by_version_rows = db.fetchall("""
+            WHERE ld.version_id = ?
+            ORDER BY ld.main_library_id, bl.name
+        """, (latest_version_id,)):
+            if row["main_library_id"] in library_ids:
+                libraries_data[library_ids[row["main_library_id"]]]["dependents_table_data"].append(
+                    {"name": row["dep_library_name"], "depth": 1}
+                )
+
+        for row in db.fetchall("""
             SELECT
+                ld.main_library_id,
                 bv.version,
                 COUNT(DISTINCT ld.dependency_library_id) as dep_count
             FROM library_dependency ld
             JOIN boost_version bv ON ld.version_id = bv.id
-            WHERE ld.main_library_id = ?
-            GROUP BY bv.version
-            ORDER BY bv.major, bv.minor, bv.patch
-        """, (lib_id,))
-
-        for row in dep_by_version_rows:
-            version = row["version"]
-            dep_count = row["dep_count"]
-            if version:
-                # Use new format: first_level and all_deeper (fallback: all are first-level)
-                dependents_by_version[version] = {
-                    "first_level": int(dep_count or 0),
+            GROUP BY ld.main_library_id, bv.version
+            ORDER BY ld.main_library_id, bv.major, bv.minor, bv.patch
+        """):
+            if row["main_library_id"] in library_ids and row["version"]:
+                libraries_data[library_ids[row["main_library_id"]]]["dependents_by_version"][row["version"]] = {
+                    "first_level": int(row["dep_count"] or 0),
                     "all_deeper": 0
                 }
 
-    lib_data["dependents_table_data"] = dependents_table_data
-    lib_data["dependents_by_version"] = dependents_by_version
-
-
     # Panel 2: External dependents
-    lib_data["top_repos"] = _rows_to_list(db.fetchall("""
-        SELECT
-            r.repo_name,
-            r.stars,
-            COUNT(bu.id) as usage_count
-        FROM repository r
-        JOIN boost_usage bu ON r.id = bu.repository_id
-        JOIN boost_header bh ON bu.header_id = bh.id
-        WHERE bh.library_id = ?
-            AND bu.excepted_ts IS NULL
-            AND r.stars IS NOT NULL AND r.stars >= 10
-        GROUP BY r.id
-        ORDER BY r.stars DESC
-        LIMIT 10
-    """, (lib_id,)))
-
-    usage_by_year_rows = db.fetchall("""
+    for row in db.fetchall("""
+        SELECT library_id, repo_name, stars, usage_count
+        FROM (
+            SELECT
+                bh.library_id,
+                r.repo_name,
+                r.stars,
+                COUNT(bu.id) as usage_count,
+                ROW_NUMBER() OVER (
+                    PARTITION BY bh.library_id
+                    ORDER BY r.stars DESC, r.id
+                ) as rank
+            FROM repository r
+            JOIN boost_usage bu ON r.id = bu.repository_id
+            JOIN boost_header bh ON bu.header_id = bh.id
+            WHERE bu.excepted_ts IS NULL
+                AND r.stars IS NOT NULL AND r.stars >= 10
+            GROUP BY bh.library_id, r.id
+        )
+        WHERE rank <= 10
+        ORDER BY library_id, rank
+    """):
+        if row["library_id"] in library_ids:
+            libraries_data[library_ids[row["library_id"]]]["top_repos"].append({
+                "repo_name": row["repo_name"],
+                "stars": row["stars"],
+                "usage_count": row["usage_count"],
+            })
+
+    for row in db.fetchall("""
         SELECT
+            bh.library_id,
             SUBSTR(bu.last_commit_ts, 1, 4) as year,
             COUNT(bu.id) as usage_count
         FROM boost_usage bu
         JOIN boost_header bh ON bu.header_id = bh.id
         JOIN repository r ON r.id = bu.repository_id
-        WHERE bh.library_id = ?
-            AND bu.excepted_ts IS NULL
+        WHERE bu.excepted_ts IS NULL
             AND bu.last_commit_ts IS NOT NULL
             AND LENGTH(bu.last_commit_ts) >= 4
             AND r.stars IS NOT NULL
             AND r.stars >= 10
-        GROUP BY year
+        GROUP BY bh.library_id, year
         HAVING year >= '2000' AND year <= ?
-        ORDER BY year
-    """, (lib_id, str(datetime.now().year)))
-    lib_data["usage_by_year"] = {
-        row["year"]: row["usage_count"]
-        for row in usage_by_year_rows
-    }
+        ORDER BY bh.library_id, year
+    """, (str(datetime.now().year),)):
+        if row["library_id"] in library_ids:
+            libraries_data[library_ids[row["library_id"]]]["usage_by_year"][row["year"]] = row["usage_count"]
 
-    # Panel 3: Contribution
-    nick_name = "logic" if library_name == "tribool" else library_name
-    version_for_query = latest_version_str.replace(".0", "") if latest_version_str else None
-    contributors = []
-    commits_by_version = {}
+    return libraries_data
 
-    if version_for_query:
-        contributors = db1.fetchall("""
-            SELECT
-                email_address,
-                identity_name,
-                count(*) as commit_count
-            FROM contributor_data
-            WHERE repo = ?
-            AND version = ?
-            GROUP BY email_address
-            ORDER BY commit_count DESC
-        """, (nick_name, version_for_query))
-
-        commits_by_version_rows = db1.fetchall("""
-            SELECT
-                version,
-                count(*) as commit_count
-            FROM contributor_data
-            WHERE repo = ?
-            AND version LIKE '%1.%'
-            GROUP BY version
-            ORDER BY version
-        """, (nick_name,))
-        commits_by_version = {
-            row["version"]: row["commit_count"]
-            for row in commits_by_version_rows
-        }
 
-    lib_data["contributors"] = _rows_to_list(contributors)
-    lib_data["commits_by_version"] = commits_by_version
+# ===== Sharded dashboard data =====
+
+# Top-level keys read by render_library_html besides its own library entry
+LIBRARY_SHARED_KEYS = ("latest_version_str", "versions_info", "all_versions_for_chart")
+
+
+def _library_shard(library_name: str) -> str:
+    """Path of a library data shard relative to DASHBOARD_DATA_DIR."""
+    return f"libraries/{library_name}.json"
+
+
+def write_dashboard_data(dashboard_data: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Save collected dashboard data as an index manifest plus one compact JSON shard per library.
+
+    data/index.json holds every top-level key except "libraries", which is replaced by
+    {library_name: {"shard": path, "sha256": hash}} (shard is None for libraries without
+    data). Shards whose content did not change are not rewritten, and shards of libraries
+    that disappeared are removed, so a partial refresh only touches the affected files.
+
+    Returns:
+        Counts of written, unchanged and removed shards
+    """
+    previous = DashboardDataStore(DASHBOARD_DATA_DIR).library_manifest() if DATA_INDEX_FILE.exists() else {}
+
+    library_manifest: Dict[str, Dict[str, Optional[str]]] = {}
+    written = 0
+    for library_name, lib_data in dashboard_data.get("libraries", {}).items():
+        if not lib_data:
+            library_manifest[library_name] = {"shard": None, "sha256": None}
+            continue
+        shard = _library_shard(library_name)
+        content = json.dumps(lib_data, separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        shard_file = DASHBOARD_DATA_DIR / shard
+        if previous.get(library_name, {}).get("sha256") != digest or not shard_file.exists():
+            _write_text_atomic(shard_file, content)
+            written += 1
+        library_manifest[library_name] = {"shard": shard, "sha256": digest}
+
+    expected_shards = {entry["shard"] for entry in library_manifest.values() if entry["shard"]}
+    removed = 0
+    if DATA_LIBRARIES_DIR.exists():
+        for shard_file in sorted(DATA_LIBRARIES_DIR.rglob("*.json")):
+            if shard_file.relative_to(DASHBOARD_DATA_DIR).as_posix() not in expected_shards:
+                shard_file.unlink()
+                removed += 1
+
+    index = {key: value for key, value in dashboard_data.items() if key != "libraries"}
+    index["libraries"] = library_manifest
+    _write_text_atomic(DATA_INDEX_FILE, json.dumps(index, indent=2, ensure_ascii=False))
+
+    return {"written": written, "unchanged": len(expected_shards) - written, "removed": removed}
+
+
+class DashboardDataStore:
+    """
+    Read access to the sharded dashboard data written by write_dashboard_data().
+
+    Only data/index.json is loaded up front; library shards are read on demand, so
+    memory use does not grow with the number of libraries.
+    """
+
+    def __init__(self, data_dir: Optional[Path] = None):
+        self.data_dir = Path(data_dir) if data_dir is not None else DASHBOARD_DATA_DIR
+        with open(self.data_dir / "index.json", "r", encoding="utf-8") as f:
+            self._index = json.load(f)
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        """Top-level dashboard data (everything index.html is rendered from)."""
+        return {key: value for key, value in self._index.items() if key != "libraries"}
+
+    def library_manifest(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """{library_name: {"shard": path or None, "sha256": hash or None}} in library order."""
+        return self._index.get("libraries", {})
+
+    def library_names(self) -> List[str]:
+        return list(self.library_manifest())
+
+    def shard_path(self, library_name: str) -> Optional[Path]:
+        """Absolute path of a library's shard, or None if the library has no data."""
+        shard = self.library_manifest().get(library_name, {}).get("shard")
+        return self.data_dir / shard if shard else None
+
+    def load_library(self, library_name: str) -> Dict[str, Any]:
+        """Load one library's data ({} if it has none)."""
+        shard_path = self.shard_path(library_name)
+        if shard_path is None:
+            return {}
+        with open(shard_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def shared(self) -> Dict[str, Any]:
+        """Top-level keys library pages read besides their own shard."""
+        return {key: self._index[key] for key in LIBRARY_SHARED_KEYS if key in self._index}
 
-    return lib_data
+
+def _convert_legacy_dashboard_data() -> None:
+    """Shard a dashboard_data.json written by earlier versions of this script."""
+    print(f"Converting {DASHBOARD_DATA_FILE} to sharded data in {DASHBOARD_DATA_DIR}...")
+    with open(DASHBOARD_DATA_FILE, "r", encoding="utf-8") as f:
+        write_dashboard_data(json.load(f))
 
 
 def collect_dashboard_data() -> None:
     """
     Collect all data needed for dashboard generation from databases.
-    Saves the data to dashboard_data.json.
+    Saves the data to data/index.json and per-library shards (see write_dashboard_data),
+    plus a dated metrics snapshot and data/trends.json (see dashboard_snapshots.py).
     """
     print("Collecting dashboard data from databases...")
     from sqlite_connector import SQLiteConnector
 
     with SQLiteConnector(DB_PATH) as db, SQLiteConnector(DB_PATH_1) as db1:
+        if _profiler is not None:
+            db = _profiler.profile_connector(db, "db")
+            db1 = _profiler.profile_connector(db1, "db1")
+
         # Collect index data
-        dashboard_data = _collect_index_data(db, db1)
+        with _span("index_data"):
+            dashboard_data = _collect_index_data(db, db1)
+
+        # One canonical version ordering shared by every collector
+        with _span("versions"):
+            versions = VersionIndex.from_db(db)
+        latest_version_id = versions.latest_id
+        latest_version_str = versions.latest_version
+
+        # Versions from 1.66.0 to latest version for chart x-axis, in release order
+        dashboard_data["all_versions_for_chart"] = versions.chart_versions
+
+        # Build version info mapping for library pages
+        dashboard_data["versions_info"] = dict(versions.version_by_id)
 
         # Collect internal dependents data (transitive dependencies with depth)
         table_exists = db.table_exists("library_dependency")
         internal_dependents_data = {}
         if table_exists:
-            internal_dependents_data = _collect_dependents_data(db)
+            with _span("dependents"):
+                internal_dependents_data = _collect_dependents_data(db, versions)
 
         # Collect library data
         libraries = db.fetchall("SELECT id, name FROM boost_library ORDER BY name")
 
-        latest_version_rows = db.fetchall("""
-            SELECT id, version FROM boost_version
-            ORDER BY major DESC, minor DESC, patch DESC
-            LIMIT 2
-        """)
-        latest_version_id = latest_version_rows[0]["id"] if latest_version_rows else None
-        latest_version_str = latest_version_rows[0]["version"] if latest_version_rows else None
-
-        # Get all versions from 1.66.0 to latest version for chart x-axis
-        all_versions_db = db.fetchall("SELECT version, major, minor, patch FROM boost_version ORDER BY major DESC, minor DESC, patch DESC")
-        latest_version_row = all_versions_db[0] if all_versions_db else None
-
-        all_versions_for_chart = []
-        if latest_version_row:
-            latest_major = latest_version_row["major"]
-            latest_minor = latest_version_row["minor"]
-            latest_patch = latest_version_row["patch"]
-
-            for row in db.fetchall("SELECT version, major, minor, patch FROM boost_version"):
-                version_str = row["version"]
-                major = row["major"]
-                minor = row["minor"]
-                patch = row["patch"]
-                # Include versions from 1.66.0 to latest version (inclusive)
-                if major == 1 and minor >= 66:
-                    # Compare with latest version
-                    if (major < latest_major or
-                        (major == latest_major and minor < latest_minor) or
-                        (major == latest_major and minor == latest_minor and patch <= latest_patch)):
-                        all_versions_for_chart.append(version_str)
-
-        dashboard_data["all_versions_for_chart"] = sorted(all_versions_for_chart, key=version_sort_key)
+        with _span("library_data"):
+            library_payloads = _collect_all_library_data(db, libraries, latest_version_id, table_exists)
 
-        # Build version info mapping for library pages
-        all_versions = db.fetchall("SELECT id, version FROM boost_version")
-        versions_info = {row["id"]: row["version"] for row in all_versions}
-        dashboard_data["versions_info"] = versions_info
+        # Contribution data for every library from one contributor_data query
+        with _span("contributors"):
+            contributions = ContributorIndex.from_db(
+                db1, [lib_row["name"] for lib_row in libraries], latest_version_str
+            )
 
+        # Merge in library name order so the JSON is identical regardless of worker count
         libraries_data: Dict[str, Dict[str, Any]] = {}
         for lib_row in libraries:
             lib_id = lib_row["id"]
             library_name = lib_row["name"]
-            lib_data = _collect_library_data(
-                db, db1, lib_id, library_name, latest_version_id, latest_version_str, table_exists
-            )
+            lib_data = library_payloads[library_name]
+            lib_data["contributors"] = contributions.contributors(library_name)
+            lib_data["commits_by_version"] = contributions.commits_by_version(library_name)
 
             # Override with transitive dependency data if available
             if table_exists and lib_id in internal_dependents_data:
@@ -1966,43 +2043,324 @@ def collect_dashboard_data() -> None:
         dashboard_data["latest_version_id"] = latest_version_id
         dashboard_data["latest_version_str"] = latest_version_str
 
-        # Save to JSON
-        with open(DASHBOARD_DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+        # Save as index manifest + per-library shards
+        with _span("write_shards"):
+            shard_counts = write_dashboard_data(dashboard_data)
 
-        print(f"Dashboard data collected and saved to {DASHBOARD_DATA_FILE}")
+        print(f"Dashboard data collected and saved to {DASHBOARD_DATA_DIR}")
         print(f"  - Index data: {len(dashboard_data.get('all_libraries', []))} libraries")
-        print(f"  - Library data: {len(libraries_data)} libraries")
+        print(f"  - Library data: {len(libraries_data)} libraries "
+              f"({shard_counts['written']} shards written, {shard_counts['unchanged']} unchanged, "
+              f"{shard_counts['removed']} removed)")
+
+        # Keep a dated snapshot of the aggregates and diff it against the previous one
+        with _span("snapshot"):
+            record_snapshot(dashboard_data, DATA_SNAPSHOTS_DIR, DATA_TRENDS_FILE)
+
+
+# ===== Incremental HTML generation =====
+
+def _hash_json(value: Any) -> str:
+    """Stable SHA-256 of a JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _template_fingerprint(page_rows: int) -> str:
+    """
+    Hash of everything that shapes page output besides the data: this module's source
+    (templates, chart and table builders), the fingerprinted shared assets and the
+    table page size. Any change rebuilds all pages.
+    """
+    digest = hashlib.sha256()
+    digest.update(Path(__file__).read_bytes())
+    digest.update(json.dumps(asset_hrefs(), sort_keys=True).encode("utf-8"))
+    digest.update(f"page_rows={page_rows}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _page_input_hashes(store: DashboardDataStore) -> Dict[str, str]:
+    """
+    Hash the data each page is rendered from, without loading any library shard.
+
+    index.html depends on the index data; a library page depends on its shard (via the
+    shard hash recorded in the manifest) plus the shared version keys it reads.
+    """
+    hashes = {INDEX_PAGE: _hash_json(store.index)}
+    shared_hash = _hash_json(store.shared())
+    for library_name, entry in store.library_manifest().items():
+        if entry.get("sha256"):
+            hashes[_library_page(library_name)] = _hash_json({"shared": shared_hash, "library": entry["sha256"]})
+    return hashes
+
+
+def _load_build_manifest(template: str) -> Dict[str, str]:
+    """Return the page hashes of the previous build, or {} if it used other templates."""
+    if not BUILD_MANIFEST_FILE.exists():
+        return {}
+    try:
+        with open(BUILD_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != BUILD_MANIFEST_VERSION or manifest.get("template") != template:
+        return {}
+    return manifest.get("pages", {})
+
+
+def _remove_orphaned_pages(expected_pages: set) -> List[str]:
+    """Delete library pages (and their table fragments) whose library is no longer in the data."""
+    removed = []
+    for page_path in sorted(LIBRARIES_DIR.rglob("*.html")):
+        rel_path = page_path.relative_to(DASHBOARD_DIR).as_posix()
+        if rel_path not in expected_pages:
+            page_path.unlink()
+            removed.append(rel_path)
+    if FRAGMENTS_DIR.exists():
+        for fragment_dir in sorted(FRAGMENTS_DIR.iterdir()):
+            if fragment_dir.is_dir() and _library_page(fragment_dir.name) not in expected_pages:
+                shutil.rmtree(fragment_dir)
+    return removed
+
+
+# Set by _init_render_worker in each rendering worker process
+_worker_assets: Optional[Dict[str, str]] = None
+_worker_shared: Dict[str, Any] = {}
+_worker_page_rows: int = DEFAULT_TABLE_PAGE_ROWS
+
+
+def _library_render_slice(shared: Dict[str, Any], library_name: str, lib_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of dashboard data that one library page is rendered from."""
+    render_slice = dict(shared)
+    render_slice["libraries"] = {library_name: lib_data}
+    return render_slice
+
+
+def _init_render_worker(assets: Dict[str, str], shared: Dict[str, Any], page_rows: int) -> None:
+    """Receive the shared asset hrefs, version keys and table page size once per rendering worker."""
+    global _worker_assets, _worker_shared, _worker_page_rows
+    _worker_assets = assets
+    _worker_shared = shared
+    _worker_page_rows = page_rows
+
+
+def _render_library_job(job: Tuple[str, Optional[str]]) -> Tuple[str, bool, float]:
+    """
+    Worker entry point: load one library shard, stream its page to disk and drop the data.
+
+    Returns:
+        (library_name, whether a page was written, seconds spent loading and rendering)
+    """
+    library_name, shard_path = job
+    start = time.perf_counter()
+    lib_data = {}
+    if shard_path:
+        with open(shard_path, "r", encoding="utf-8") as f:
+            lib_data = json.load(f)
+    render_slice = _library_render_slice(_worker_shared, library_name, lib_data)
+    written = write_library_page(render_slice, library_name, _worker_assets, _worker_page_rows)
+    return library_name, written, time.perf_counter() - start
+
+
+def _report_rendered_library(library_name: str, written: bool, seconds: float) -> Tuple[str, float]:
+    """Report one rendered library page and return (library_name, render seconds)."""
+    if written:
+        print(f"Created {DASHBOARD_DIR / _library_page(library_name)}")
+    else:
+        print(f"Warning: No data found for library {library_name}")
+    return library_name, seconds
+
+
+def render_library_pages(
+    store: DashboardDataStore,
+    library_names: List[str],
+    workers: int = 1,
+    assets: Optional[Dict[str, str]] = None,
+    page_rows: int = DEFAULT_TABLE_PAGE_ROWS,
+) -> Dict[str, Any]:
+    """
+    Render and write the given library pages.
+
+    Shared assets are written once and referenced by every page. Each job loads only its
+    own library shard and streams the page to disk row by row (see write_library_page),
+    so memory stays flat regardless of the number of libraries or table sizes. With
+    workers > 1 pages are rendered on a process pool; every page is produced by the
+    same code, so output is identical to the serial path.
+
+    Returns:
+        Timing summary: pages, workers, render_seconds (summed over pages),
+        wall_seconds, slowest_page and slowest_seconds
+    """
+    if assets is None:
+        assets = write_dashboard_assets()
+    shared = store.shared()
+    jobs = []
+    for name in library_names:
+        shard_path = store.shard_path(name)
+        jobs.append((name, str(shard_path) if shard_path else None))
+    workers = max(1, min(workers, len(jobs)))
+
+    start = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker, initargs=(assets, shared, page_rows)
+        ) as pool:
+            results = pool.map(_render_library_job, jobs, chunksize=4)
+            rendered = [_report_rendered_library(*result) for result in results]
+    else:
+        _init_render_worker(assets, shared, page_rows)
+        rendered = [_report_rendered_library(*_render_library_job(job)) for job in jobs]
+    wall_seconds = time.perf_counter() - start
+
+    if _profiler is not None:
+        for library_name, seconds in rendered:
+            _profiler.record_page(_library_page(library_name), seconds)
+
+    slowest_page, slowest_seconds = max(rendered, key=lambda r: r[1], default=(None, 0.0))
+    return {
+        "pages": len(rendered),
+        "workers": workers,
+        "render_seconds": sum(seconds for _, seconds in rendered),
+        "wall_seconds": wall_seconds,
+        "slowest_page": slowest_page,
+        "slowest_seconds": slowest_seconds,
+    }
 
 
-def generate_dashboard_html() -> None:
+def generate_dashboard_html(force: bool = False, workers: int = 1, page_rows: int = DEFAULT_TABLE_PAGE_ROWS) -> None:
     """
-    Read dashboard_data.json and generate all HTML files.
+    Read the sharded dashboard data and generate the HTML files whose inputs changed.
+
+    Each page's input hash is compared with build_manifest.json from the previous run;
+    unchanged pages that still exist on disk are left untouched, so their mtimes (and
+    CDN caches) survive. Pages are written atomically and library pages no longer
+    present in the data are removed. Shared CSS/JS is written to fingerprinted files
+    under assets/; superseded asset files are removed once the pages are rewritten.
+
+    Args:
+        force: Regenerate every page regardless of the manifest
+        workers: Processes used to render library pages (see render_library_pages)
+        page_rows: Rows shown inline per table before paginating into fragments (0 = never)
     """
     print("Generating HTML files from dashboard data...")
 
-    # Load data from JSON
-    with open(DASHBOARD_DATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if not DATA_INDEX_FILE.exists() and DASHBOARD_DATA_FILE.exists():
+        _convert_legacy_dashboard_data()
 
-    # Generate index.html
-    print("Creating index.html...")
-    create_index_html_from_data(data)
+    # Only the index is loaded here; library shards are read as their pages are rendered
+    with _span("load_index"):
+        store = DashboardDataStore(DASHBOARD_DATA_DIR)
 
-    # Generate library HTML files
-    libraries_data = data.get("libraries", {})
-    print(f"Creating HTML files for {len(libraries_data)} libraries...")
+    with _span("hash_inputs"):
+        template = _template_fingerprint(page_rows)
+        previous_pages = {} if force else _load_build_manifest(template)
+        page_hashes = _page_input_hashes(store)
+
+    with _span("assets"):
+        assets = write_dashboard_assets()
 
-    for library_name in libraries_data:
-        create_library_html_from_data(data, library_name)
+    def is_stale(page: str) -> bool:
+        return previous_pages.get(page) != page_hashes[page] or not (DASHBOARD_DIR / page).exists()
 
+    # Generate index.html
+    if is_stale(INDEX_PAGE):
+        print("Creating index.html...")
+        start = time.perf_counter()
+        create_index_html_from_data(store.index, assets)
+        if _profiler is not None:
+            _profiler.record_page(INDEX_PAGE, time.perf_counter() - start)
+    else:
+        print("index.html is up to date")
+
+    # Generate library HTML files
+    library_names = store.library_names()
+    print(f"Checking HTML files for {len(library_names)} libraries...")
+
+    stale_libraries = []
+    for library_name in library_names:
+        page = _library_page(library_name)
+        if page not in page_hashes:
+            print(f"Warning: No data found for library {library_name}")
+        elif is_stale(page):
+            stale_libraries.append(library_name)
+
+    with _span("library_pages"):
+        timings = render_library_pages(store, stale_libraries, workers=workers, assets=assets, page_rows=page_rows)
+    regenerated = timings["pages"]
+
+    removed = _remove_orphaned_pages(set(page_hashes))
+    for rel_path in removed + _remove_stale_assets(assets):
+        print(f"Removed {DASHBOARD_DIR / rel_path}")
+
+    manifest = {
+        "version": BUILD_MANIFEST_VERSION,
+        "template": template,
+        "pages": page_hashes,
+    }
+    _write_text_atomic(BUILD_MANIFEST_FILE, json.dumps(manifest, indent=2, sort_keys=True))
+
+    library_pages = len(page_hashes) - 1
+    print(f"  - Library pages: {regenerated} regenerated, {library_pages - regenerated} unchanged, "
+          f"{len(removed)} removed")
+    if regenerated:
+        print(f"  - Rendering: {timings['wall_seconds']:.2f}s wall on {timings['workers']} worker(s), "
+              f"{timings['render_seconds']:.2f}s total render, "
+              f"slowest {timings['slowest_page']} ({timings['slowest_seconds'] * 1000:.1f} ms)")
     print("Dashboard generation complete!")
 
 
 def main():
     """Main entry point: collect data and generate HTML."""
-    collect_dashboard_data()
-    generate_dashboard_html()
+    parser = argparse.ArgumentParser(description="Create the Boost library usage dashboard")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to render library pages (default: 1, 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every HTML page even if its inputs are unchanged since the last build",
+    )
+    parser.add_argument(
+        "--table-page-rows",
+        type=int,
+        default=DEFAULT_TABLE_PAGE_ROWS,
+        help="Rows shown inline per library table; longer tables load the rest from fragments "
+             f"(default: {DEFAULT_TABLE_PAGE_ROWS}, 0 = never paginate)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Time every query, phase and page; write report.txt and trace.folded to {PROFILE_DIR}",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="With --profile, also record the EXPLAIN QUERY PLAN of every distinct query",
+    )
+    parser.add_argument(
+        "--slow-ms",
+        type=float,
+        default=DEFAULT_SLOW_QUERY_MS,
+        help=f"With --profile, flag queries taking at least this long (default: {DEFAULT_SLOW_QUERY_MS:g} ms)",
+    )
+    args = parser.parse_args()
+
+    global _profiler
+    if args.profile:
+        _profiler = BuildProfiler(explain=args.explain, slow_query_ms=args.slow_ms)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    with _span("collect"):
+        collect_dashboard_data()
+    with _span("generate"):
+        generate_dashboard_html(force=args.force, workers=workers, page_rows=args.table_page_rows)
+
+    if _profiler is not None:
+        report_file, trace_file = _profiler.write_reports(PROFILE_DIR)
+        print(f"Profile written to {report_file} (flamegraph trace: {trace_file})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,227 @@
+"""
+Build profiler for create_dashboard.py.
+
+BuildProfiler records a tree of timed spans (collection phases, queries,
+page renders). Database connectors wrapped with profile_connector() time
+every fetchall() call and count the rows it returns; with explain=True the
+SQLite query plan of each distinct statement is captured as well.
+
+write_reports() produces two files:
+
+    profile/report.txt     phases, queries sorted by total time (slow ones
+                           flagged, with SQL text and plan), slowest pages
+    profile/trace.folded   folded stacks ("a;b;c <microseconds>"), usable with
+                           flamegraph.pl, speedscope or inferno
+
+Enable it with `python create_dashboard.py --profile [--explain] [--slow-ms N]`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+
+
+class _Span:
+    """A node in the span tree; seconds is wall time including children."""
+
+    __slots__ = ("name", "seconds", "children")
+
+    def __init__(self, name: str, seconds: float = 0.0):
+        self.name = name
+        self.seconds = seconds
+        self.children: List[_Span] = []
+
+    def self_seconds(self) -> float:
+        return max(0.0, self.seconds - sum(child.seconds for child in self.children))
+
+
+class _QueryStats:
+    """Aggregated timings for one distinct SQL statement issued from one source function."""
+
+    __slots__ = ("query_id", "sql", "source", "calls", "rows", "seconds", "max_seconds", "plan")
+
+    def __init__(self, query_id: str, sql: str, source: str):
+        self.query_id = query_id
+        self.sql = sql
+        self.source = source
+        self.calls = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.plan: Optional[List[str]] = None
+
+
+def _normalize_sql(sql: str) -> str:
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+class BuildProfiler:
+    """Collects span and query timings for one dashboard build."""
+
+    def __init__(self, explain: bool = False, slow_query_ms: float = DEFAULT_SLOW_QUERY_MS):
+        self.explain = explain
+        self.slow_query_ms = slow_query_ms
+        self.root = _Span("dashboard")
+        self._stack: List[_Span] = [self.root]
+        self._started = time.perf_counter()
+        self.queries: Dict[Tuple[str, str, str], _QueryStats] = {}
+        self.pages: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a child of the current span."""
+        node = _Span(name)
+        self._stack[-1].children.append(node)
+        self._stack.append(node)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            node.seconds = time.perf_counter() - start
+            self._stack.pop()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add an already-measured span (e.g. timed in a worker process) under the current span."""
+        self._stack[-1].children.append(_Span(name, seconds))
+
+    def record_page(self, page: str, seconds: float) -> None:
+        """Record the render time of one page."""
+        self.pages.append((page, seconds))
+        self.record(f"page:{page}", seconds)
+
+    def _query_stats(self, label: str, sql: str, source: str) -> _QueryStats:
+        normalized = _normalize_sql(sql)
+        key = (label, normalized, source)
+        stats = self.queries.get(key)
+        if stats is None:
+            digest = hashlib.sha1(f"{source}\0{normalized}".encode("utf-8")).hexdigest()[:8]
+            query_id = f"{label}-{digest}"
+            stats = self.queries[key] = _QueryStats(query_id, normalized, source)
+        return stats
+
+    def profile_connector(self, db: Any, label: str) -> "_ProfiledConnector":
+        """Wrap a connector exposing fetchall() so every call is timed."""
+        return _ProfiledConnector(db, label, self)
+
+    # ----- reports -----
+
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self._started
+
+    def folded_stacks(self) -> List[str]:
+        """Folded stack lines ("frame;frame;frame microseconds") of span self times."""
+        lines: List[str] = []
+
+        def walk(node: _Span, prefix: str) -> None:
+            path = f"{prefix};{node.name}" if prefix else node.name
+            micros = int(round(node.self_seconds() * 1_000_000))
+            if micros:
+                lines.append(f"{path} {micros}")
+            for child in node.children:
+                walk(child, path)
+
+        self.root.seconds = self.total_seconds()
+        walk(self.root, "")
+        return lines
+
+    def report_lines(self) -> List[str]:
+        """Human-readable report: phases, queries by total time, slow queries, slowest pages."""
+        total = self.total_seconds()
+        lines = [f"Dashboard build profile: {total:.3f}s total", ""]
+
+        lines.append("Phases (wall time, self time excludes nested spans):")
+
+        def walk(node: _Span, depth: int) -> None:
+            for child in node.children:
+                if child.name.startswith(("sql:", "page:")):
+                    continue
+                lines.append(f"  {'  ' * depth}{child.name:<{40 - 2 * depth}} "
+                             f"{child.seconds * 1000:10.1f} ms  (self {child.self_seconds() * 1000:.1f} ms)")
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+
+        queries = sorted(self.queries.values(), key=lambda q: q.seconds, reverse=True)
+        query_total = sum(q.seconds for q in queries)
+        lines += ["", f"Queries: {sum(q.calls for q in queries)} calls, {len(queries)} distinct, "
+                      f"{query_total * 1000:.1f} ms total ({query_total / total * 100 if total else 0:.0f}% of build)"]
+        lines.append(f"  {'total ms':>10} {'calls':>6} {'rows':>9} {'max ms':>9}  query id / caller")
+        for q in queries:
+            flag = "  SLOW" if q.max_seconds * 1000 >= self.slow_query_ms else ""
+            lines.append(f"  {q.seconds * 1000:10.1f} {q.calls:6d} {q.rows:9d} {q.max_seconds * 1000:9.1f}  "
+                         f"{q.query_id} ({q.source}){flag}")
+
+        slow = [q for q in queries if q.max_seconds * 1000 >= self.slow_query_ms]
+        lines += ["", f"Slow queries (any call >= {self.slow_query_ms:g} ms): {len(slow)}"]
+        for q in slow:
+            lines += ["", f"[{q.query_id}] {q.source}: {q.calls} calls, max {q.max_seconds * 1000:.1f} ms",
+                      f"  {q.sql}"]
+            for plan_line in q.plan or []:
+                lines.append(f"    plan: {plan_line}")
+
+        if self.explain:
+            lines += ["", "Query plans:"]
+            for q in queries:
+                lines += ["", f"[{q.query_id}] {q.sql}"]
+                for plan_line in q.plan or ["(no plan)"]:
+                    lines.append(f"    {plan_line}")
+
+        if self.pages:
+            page_total = sum(seconds for _, seconds in self.pages)
+            lines += ["", f"Pages: {len(self.pages)} rendered, {page_total * 1000:.1f} ms total render time",
+                      "  Slowest:"]
+            for page, seconds in sorted(self.pages, key=lambda p: p[1], reverse=True)[:20]:
+                lines.append(f"  {seconds * 1000:10.2f} ms  {page}")
+        return lines
+
+    def write_reports(self, out_dir: Path) -> Tuple[Path, Path]:
+        """Write report.txt and trace.folded to out_dir. Returns their paths."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        report_file = out_dir / "report.txt"
+        trace_file = out_dir / "trace.folded"
+        trace_file.write_text("\n".join(self.folded_stacks()) + "\n", encoding="utf-8")
+        report_file.write_text("\n".join(self.report_lines()) + "\n", encoding="utf-8")
+        return report_file, trace_file
+
+
+class _ProfiledConnector:
+    """Connector proxy that times fetchall() and forwards everything else."""
+
+    def __init__(self, db: Any, label: str, profiler: BuildProfiler):
+        self._db = db
+        self._label = label
+        self._profiler = profiler
+
+    def fetchall(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        source = sys._getframe(1).f_code.co_name
+        stats = self._profiler._query_stats(self._label, query, source)
+
+        start = time.perf_counter()
+        rows = self._db.fetchall(query, *args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        stats.calls += 1
+        stats.rows += len(rows)
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        self._profiler.record(f"sql:{stats.query_id}", seconds)
+
+        if self._profiler.explain and stats.plan is None:
+            try:
+                plan_rows = self._db.fetchall(f"EXPLAIN QUERY PLAN {query}", *args, **kwargs)
+                stats.plan = [str(row[-1]) for row in plan_rows]
+            except Exception as e:  # EXPLAIN must never break the build
+                stats.plan = [f"EXPLAIN failed: {e}"]
+        return rows
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._db, name)
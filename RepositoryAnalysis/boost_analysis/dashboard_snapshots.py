@@ -0,0 +1,267 @@
+"""
+Dated, content-addressed snapshots of the dashboard's aggregate metrics.
+
+Every collect_dashboard_data() run reduces the collected data to a flat,
+key-sorted list of numeric metrics (repositories per year, per-library usage,
+dependents and contributor counts, ...) and stores it as a gzipped JSON object
+named by the SHA-256 of its content. A manifest maps dates to objects, so
+identical data collected on several days is stored once.
+
+    data/snapshots/manifest.json            {"snapshots": [{"date", "collected_at", "sha256", "file"}]}
+    data/snapshots/objects/<sha256>.json.gz {"metrics": [[key, value], ...]}
+
+Because metrics are stored sorted by key, the delta between two snapshots is a
+single linear merge (diff_metrics), and data/trends.json (the change since the
+previous snapshot) costs one diff per collection instead of re-aggregating history.
+
+Retention keeps one snapshot per day for the last KEEP_DAILY days and the last
+snapshot of each month for KEEP_MONTHLY months; unreferenced objects are deleted.
+
+Usage:
+    python dashboard_snapshots.py list
+    python dashboard_snapshots.py diff [OLD_DATE] [NEW_DATE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+KEEP_DAILY = 30
+KEEP_MONTHLY = 24
+
+Metric = Tuple[str, float]
+
+
+def snapshot_metrics(dashboard_data: Dict[str, Any]) -> List[Metric]:
+    """
+    Reduce collected dashboard data to a key-sorted list of (metric key, number).
+
+    Args:
+        dashboard_data: Data as assembled by collect_dashboard_data(), with full library payloads
+    """
+    metrics: Dict[str, float] = {}
+    for row in dashboard_data.get("repos_by_year", []):
+        metrics[f"repos_by_year/{row['year']}"] = row["count"]
+    for row in dashboard_data.get("repos_by_version", []):
+        metrics[f"repos_by_version/{row['version']}"] = row["count"]
+
+    for name, lib in dashboard_data.get("libraries", {}).items():
+        prefix = f"library/{name}"
+        usage_by_year = lib.get("usage_by_year", {})
+        metrics[f"{prefix}/usage"] = sum(usage_by_year.values())
+        for year, count in usage_by_year.items():
+            metrics[f"{prefix}/usage_by_year/{year}"] = count
+        dependents = lib.get("dependents_table_data", [])
+        metrics[f"{prefix}/dependents"] = len(dependents)
+        metrics[f"{prefix}/direct_dependents"] = sum(
+            1 for dep in dependents if not isinstance(dep, dict) or dep.get("depth", 1) == 1
+        )
+        contributors = lib.get("contributors", [])
+        metrics[f"{prefix}/contributors"] = len(contributors)
+        metrics[f"{prefix}/commits_latest_version"] = sum(c.get("commit_count", 0) for c in contributors)
+        metrics[f"{prefix}/top_repos_usage"] = sum(r.get("usage_count", 0) for r in lib.get("top_repos", []))
+    return sorted(metrics.items())
+
+
+def diff_metrics(old: Iterable[Metric], new: Iterable[Metric]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the changed metrics between two key-sorted metric lists in one linear merge.
+
+    Each change is {"key", "old", "new", "delta"}; old or new is None for a metric
+    that was added or removed (delta then counts the missing side as 0).
+    """
+    old_iter, new_iter = iter(old), iter(new)
+    old_item, new_item = next(old_iter, None), next(new_iter, None)
+    while old_item is not None or new_item is not None:
+        if new_item is None or (old_item is not None and old_item[0] < new_item[0]):
+            key, old_value, new_value = old_item[0], old_item[1], None
+            old_item = next(old_iter, None)
+        elif old_item is None or new_item[0] < old_item[0]:
+            key, old_value, new_value = new_item[0], None, new_item[1]
+            new_item = next(new_iter, None)
+        else:
+            key, old_value, new_value = old_item[0], old_item[1], new_item[1]
+            old_item, new_item = next(old_iter, None), next(new_iter, None)
+            if old_value == new_value:
+                continue
+        yield {"key": key, "old": old_value, "new": new_value, "delta": (new_value or 0) - (old_value or 0)}
+
+
+class SnapshotStore:
+    """Manifest and content-addressed objects under a snapshots directory."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.manifest_file = self.directory / "manifest.json"
+        self.objects_dir = self.directory / "objects"
+        self.snapshots: List[Dict[str, Any]] = []
+        if self.manifest_file.exists():
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.snapshots = manifest.get("snapshots", [])
+
+    def find(self, snapshot_date: Optional[str] = None, before: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Snapshot taken on snapshot_date, else the latest one (strictly before `before` if given)."""
+        for entry in reversed(self.snapshots):
+            if snapshot_date is not None:
+                if entry["date"] == snapshot_date:
+                    return entry
+            elif before is None or entry["date"] < before:
+                return entry
+        return None
+
+    def load(self, entry: Dict[str, Any]) -> List[Metric]:
+        with gzip.open(self.directory / entry["file"], "rt", encoding="utf-8") as f:
+            return [tuple(item) for item in json.load(f)["metrics"]]
+
+    def add(self, metrics: List[Metric], collected_at: datetime) -> Tuple[Dict[str, Any], bool]:
+        """
+        Store metrics as the snapshot of collected_at's date (replacing an earlier one that day).
+
+        Returns:
+            (manifest entry, whether a new object file was written)
+        """
+        encoded = json.dumps({"metrics": metrics}, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        sha256 = hashlib.sha256(encoded).hexdigest()
+        rel_path = f"objects/{sha256}.json.gz"
+        object_file = self.directory / rel_path
+        written = not object_file.exists()
+        if written:
+            # mtime=0 keeps the compressed bytes a pure function of the content
+            _write_bytes_atomic(object_file, gzip.compress(encoded, mtime=0))
+
+        entry = {
+            "date": collected_at.date().isoformat(),
+            "collected_at": collected_at.isoformat(),
+            "sha256": sha256,
+            "file": rel_path,
+        }
+        self.snapshots = [s for s in self.snapshots if s["date"] != entry["date"]] + [entry]
+        self.snapshots.sort(key=lambda s: s["date"])
+        return entry, written
+
+    def prune(self, today: date, keep_daily: int = KEEP_DAILY, keep_monthly: int = KEEP_MONTHLY) -> int:
+        """
+        Apply the retention policy and delete objects no snapshot refers to.
+
+        Returns:
+            Number of snapshots dropped
+        """
+        daily_cutoff = (today - timedelta(days=keep_daily - 1)).isoformat()
+        month_index = today.year * 12 + today.month - 1 - (keep_monthly - 1)
+        monthly_cutoff = f"{month_index // 12:04d}-{month_index % 12 + 1:02d}"
+
+        last_of_month: Dict[str, str] = {}
+        for entry in self.snapshots:
+            last_of_month[entry["date"][:7]] = entry["date"]
+
+        kept = [
+            entry for entry in self.snapshots
+            if entry["date"] >= daily_cutoff
+            or (entry["date"][:7] >= monthly_cutoff and last_of_month[entry["date"][:7]] == entry["date"])
+        ]
+        dropped = len(self.snapshots) - len(kept)
+        self.snapshots = kept
+
+        referenced = {entry["file"] for entry in kept}
+        if self.objects_dir.exists():
+            for object_file in self.objects_dir.glob("*.json.gz"):
+                if object_file.relative_to(self.directory).as_posix() not in referenced:
+                    object_file.unlink()
+        return dropped
+
+    def save(self) -> None:
+        manifest = {"version": MANIFEST_VERSION, "snapshots": self.snapshots}
+        _write_bytes_atomic(self.manifest_file, json.dumps(manifest, indent=2).encode("utf-8"))
+
+
+def record_snapshot(
+    dashboard_data: Dict[str, Any],
+    snapshots_dir: Path,
+    trends_file: Path,
+    collected_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Snapshot collected data, apply retention and write the trend since the previous snapshot.
+
+    Args:
+        dashboard_data: Data as assembled by collect_dashboard_data()
+        snapshots_dir: Directory holding manifest.json and objects/
+        trends_file: Where to write {"date", "baseline", "changes"}
+        collected_at: Snapshot time (now, UTC, by default)
+
+    Returns:
+        The trends document that was written
+    """
+    collected_at = collected_at or datetime.now(timezone.utc)
+    store = SnapshotStore(snapshots_dir)
+    metrics = snapshot_metrics(dashboard_data)
+    entry, written = store.add(metrics, collected_at)
+    dropped = store.prune(collected_at.date())
+    store.save()
+
+    baseline = store.find(before=entry["date"])
+    trends = {
+        "date": entry["date"],
+        "baseline": baseline["date"] if baseline else None,
+        "changes": list(diff_metrics(store.load(baseline), metrics)) if baseline else [],
+    }
+    _write_bytes_atomic(trends_file, json.dumps(trends, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    print(f"  - Snapshot {entry['date']}: {len(metrics)} metrics "
+          f"({'new object' if written else 'content unchanged'}, {dropped} pruned); "
+          f"{len(trends['changes'])} changes since {trends['baseline'] or 'no earlier snapshot'}")
+    return trends
+
+
+def _write_bytes_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def main() -> None:
+    """List snapshots or print the changes between two of them."""
+    from config import DASHBOARD_DIR
+
+    parser = argparse.ArgumentParser(description="Inspect dashboard data snapshots")
+    parser.add_argument("--dir", type=Path, default=DASHBOARD_DIR / "data" / "snapshots", help="Snapshots directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List snapshots in the manifest")
+    diff_parser = subparsers.add_parser("diff", help="Print metric changes between two snapshots")
+    diff_parser.add_argument("old", nargs="?", help="Baseline date (default: the snapshot before NEW)")
+    diff_parser.add_argument("new", nargs="?", help="Date to compare (default: latest snapshot)")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.dir)
+    if args.command == "list":
+        for entry in store.snapshots:
+            print(f"{entry['date']}  {entry['sha256'][:12]}  {entry['collected_at']}")
+        return
+
+    new = store.find(args.new)
+    old = store.find(args.old) if args.old else (store.find(before=new["date"]) if new else None)
+    if new is None or old is None:
+        print("Error: need two snapshots to compare", file=sys.stderr)
+        sys.exit(1)
+    for change in diff_metrics(store.load(old), store.load(new)):
+        print(f"{change['key']}: {change['old']} -> {change['new']} ({change['delta']:+g})")
+
+
+if __name__ == "__main__":
+    main()
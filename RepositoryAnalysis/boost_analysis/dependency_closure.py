@@ -0,0 +1,229 @@
+"""
+Transitive dependency closures for the library_dependency table.
+
+DependencyClosureIndex computes, for every Boost version, the shortest
+dependency depth from each library to every library it reaches
+(1 = direct, 2+ = transitive). The whole version graph is processed with a
+level-synchronous bitset BFS that advances all sources at once:
+frontier[v] holds, as an integer bitmask, the set of sources whose BFS frontier
+currently contains v, so one pass over the edge list moves every source forward
+by one level.
+
+Consecutive Boost versions usually share the same dependency graph, so closures
+are memoized by edge set and computed once per distinct graph.
+
+Run this module directly to benchmark it against the per-(library, version) BFS
+previously used in create_dashboard._collect_dependents_data:
+
+    python dependency_closure.py --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+# source library id -> {dependency library id -> shortest depth}
+Closure = Dict[int, Dict[int, int]]
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def compute_shortest_depths(edges: Iterable[Tuple[int, int]]) -> Closure:
+    """
+    Compute shortest-depth closures for every source of a directed graph.
+
+    Args:
+        edges: (main_library_id, dependency_library_id) pairs
+
+    Returns:
+        Dict mapping each library with outgoing edges to {dependency id: depth}.
+        A library never appears in its own closure.
+    """
+    adjacency: Dict[int, set] = {}
+    for source, target in edges:
+        adjacency.setdefault(source, set()).add(target)
+        adjacency.setdefault(target, set())
+
+    nodes = sorted(adjacency)
+    position = {node: i for i, node in enumerate(nodes)}
+    successors = [[position[t] for t in adjacency[node] if t != node] for node in nodes]
+
+    # Bit s set in reached[v] / frontier[v] means source s has reached v / has v on its frontier
+    reached = [1 << i for i in range(len(nodes))]
+    frontier = list(reached)
+    closures: Closure = {node: {} for node in nodes if adjacency[node]}
+
+    depth = 0
+    while True:
+        depth += 1
+        next_frontier = [0] * len(nodes)
+        for v, mask in enumerate(frontier):
+            if mask:
+                for w in successors[v]:
+                    next_frontier[w] |= mask
+
+        advanced = False
+        for w, mask in enumerate(next_frontier):
+            mask &= ~reached[w]
+            next_frontier[w] = mask
+            if mask:
+                advanced = True
+                reached[w] |= mask
+                target = nodes[w]
+                for s in _iter_bits(mask):
+                    closures[nodes[s]][target] = depth
+        if not advanced:
+            return closures
+        frontier = next_frontier
+
+
+class DependencyClosureIndex:
+    """Per-version shortest-depth closures, memoized by dependency edge set."""
+
+    def __init__(self, edges_by_version: Dict[int, FrozenSet[Tuple[int, int]]]):
+        self.edges_by_version = edges_by_version
+        self._closures_by_edges: Dict[FrozenSet[Tuple[int, int]], Closure] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> "DependencyClosureIndex":
+        """Build from library_dependency rows (main_library_id, dependency_library_id, version_id)."""
+        edges: Dict[int, set] = {}
+        for row in rows:
+            edges.setdefault(row["version_id"], set()).add(
+                (row["main_library_id"], row["dependency_library_id"])
+            )
+        return cls({version_id: frozenset(pairs) for version_id, pairs in edges.items()})
+
+    def closure(self, version_id: int) -> Closure:
+        """Return {library_id: {dependency_id: depth}} for a version (empty if it has no edges)."""
+        edges = self.edges_by_version.get(version_id)
+        if not edges:
+            return {}
+        closure = self._closures_by_edges.get(edges)
+        if closure is None:
+            closure = compute_shortest_depths(edges)
+            self._closures_by_edges[edges] = closure
+        return closure
+
+    def transitive_deps(self, library_id: int, version_id: int) -> Dict[int, int]:
+        """Return {dependency_id: depth} for one library in one version."""
+        return self.closure(version_id).get(library_id, {})
+
+    @property
+    def distinct_graph_count(self) -> int:
+        return len(set(self.edges_by_version.values()))
+
+
+# ===== Benchmark against the previous implementation =====
+
+def _legacy_transitive_deps(main_lib_id: int, version_id: int, graph: Dict) -> Dict[int, int]:
+    """Per-(library, version) BFS formerly nested in _collect_dependents_data (kept for benchmarking)."""
+    if main_lib_id not in graph or version_id not in graph[main_lib_id]:
+        return {}
+
+    all_deps = {}
+    initial_deps = [dep_id for dep_id in graph[main_lib_id][version_id] if dep_id != main_lib_id]
+    queue = [(dep_id, 1) for dep_id in initial_deps]
+    visited = set()
+    visited.add(main_lib_id)
+
+    while queue:
+        current_lib_id, depth = queue.pop(0)
+
+        if current_lib_id in visited or current_lib_id == main_lib_id:
+            continue
+        visited.add(current_lib_id)
+
+        if current_lib_id not in all_deps or all_deps[current_lib_id] > depth:
+            all_deps[current_lib_id] = depth
+
+        if current_lib_id in graph and version_id in graph[current_lib_id]:
+            for next_dep_id in graph[current_lib_id][version_id]:
+                if next_dep_id not in visited and next_dep_id != main_lib_id and next_dep_id != current_lib_id:
+                    queue.append((next_dep_id, depth + 1))
+
+    return all_deps
+
+
+def benchmark(db_path: Path, repeat: int = 3) -> Dict[str, float]:
+    """
+    Time the legacy BFS and DependencyClosureIndex on a real library_dependency table.
+
+    Both implementations compute every (library, version) closure; results are
+    checked for equality. Returns the best wall time of each in seconds.
+    """
+    conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute(
+        "SELECT main_library_id, dependency_library_id, version_id FROM library_dependency ORDER BY version_id"
+    ).fetchall()
+    library_ids = [row["id"] for row in conn.execute("SELECT id FROM boost_library")]
+    version_ids = [row["id"] for row in conn.execute("SELECT id FROM boost_version")]
+    conn.close()
+
+    graph: Dict[int, Dict[int, List[int]]] = {}
+    for row in rows:
+        graph.setdefault(row["main_library_id"], {}).setdefault(row["version_id"], []).append(
+            row["dependency_library_id"]
+        )
+
+    def run_legacy() -> Dict[Tuple[int, int], Dict[int, int]]:
+        return {
+            (lib_id, version_id): _legacy_transitive_deps(lib_id, version_id, graph)
+            for version_id in version_ids
+            for lib_id in library_ids
+        }
+
+    def run_index() -> Dict[Tuple[int, int], Dict[int, int]]:
+        index = DependencyClosureIndex.from_rows(rows)
+        return {
+            (lib_id, version_id): index.transitive_deps(lib_id, version_id)
+            for version_id in version_ids
+            for lib_id in library_ids
+        }
+
+    timings: Dict[str, float] = {}
+    results: Dict[str, Any] = {}
+    for name, func in (("legacy_bfs", run_legacy), ("closure_index", run_index)):
+        best: Optional[float] = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[name] = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+
+    if results["legacy_bfs"] != results["closure_index"]:
+        raise AssertionError("DependencyClosureIndex results differ from the legacy BFS")
+
+    distinct_graphs = DependencyClosureIndex.from_rows(rows).distinct_graph_count
+    print(f"library_dependency rows: {len(rows):,} | libraries: {len(library_ids)} | "
+          f"versions: {len(version_ids)} ({distinct_graphs} distinct graphs)")
+    print(f"  legacy BFS:       {timings['legacy_bfs'] * 1000:10.1f} ms")
+    print(f"  closure index:    {timings['closure_index'] * 1000:10.1f} ms")
+    print(f"  speedup:          {timings['legacy_bfs'] / max(timings['closure_index'], 1e-9):10.1f}x")
+    return timings
+
+
+def main():
+    from config import DB_PATH
+
+    parser = argparse.ArgumentParser(description="Benchmark transitive dependency closures on library_dependency")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="Path to boost_usage.db")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best time is reported)")
+    args = parser.parse_args()
+    benchmark(args.db, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
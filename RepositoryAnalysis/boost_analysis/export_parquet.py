@@ -0,0 +1,354 @@
+"""
+Export the Boost usage database to Parquet and query it with Arrow.
+
+This script writes the `repository`, `boost_library`, `boost_header`,
+`source_file` and `boost_usage` tables of boost_usage.db to a Parquet dataset:
+
+    parquet/
+        repository/part-0.parquet
+        boost_library/part-0.parquet
+        boost_header/part-0.parquet
+        source_file/part-0.parquet
+        boost_usage/year=2019/part-0.parquet      (or library_id=42/...)
+        export.json                               (partition column of boost_usage)
+
+String columns are dictionary-encoded. `boost_usage` is denormalized with the
+`library_id` of its header and the commit `year` so the usual dashboard filters
+never need a join back to SQLite.
+
+ParquetUsageStore computes the report/dashboard aggregates from that dataset
+with vectorized Arrow scans, so analysts can slice the usage table without
+opening the production SQLite file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:  # pyarrow is only needed for the Parquet path
+    pa = None
+
+from config import DB_PATH
+
+PARQUET_DIR = Path(__file__).resolve().parent / "parquet"
+
+# Tables small enough to be written as a single unpartitioned file
+DIMENSION_TABLES = ("repository", "boost_library", "boost_header", "source_file")
+USAGE_TABLE = "boost_usage"
+PARTITION_COLUMNS = {"year": "year", "library": "library_id"}
+EXPORT_METADATA = "export.json"
+
+DEFAULT_BATCH_SIZE = 200_000
+MIN_STARS = 10
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("pyarrow is required for the Parquet export: pip install pyarrow")
+
+
+def _arrow_type(declared_type: str) -> "pa.DataType":
+    """Map a declared SQLite column type to the Arrow type used in Parquet."""
+    declared_type = (declared_type or "").upper()
+    if "INT" in declared_type:
+        return pa.int64()
+    if "REAL" in declared_type or "FLOA" in declared_type or "DOUB" in declared_type:
+        return pa.float64()
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> List[tuple]:
+    """Return (name, declared_type) for every column of a table or view."""
+    return [(row[1], row[2]) for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _to_array(values: List[Any], arrow_type: "pa.DataType") -> "pa.Array":
+    if pa.types.is_dictionary(arrow_type):
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    return pa.array(values, type=arrow_type)
+
+
+def _iter_batches(
+    cursor: sqlite3.Cursor, schema: "pa.Schema", batch_size: int
+) -> Iterator["pa.RecordBatch"]:
+    """Stream a SQLite cursor as Arrow record batches without materializing the table."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        columns = list(zip(*rows))
+        yield pa.RecordBatch.from_arrays(
+            [_to_array(list(col), field.type) for col, field in zip(columns, schema)],
+            schema=schema,
+        )
+
+
+def _usage_partitioning(partition_column: str) -> "ds.Partitioning":
+    column_type = pa.string() if partition_column == "year" else pa.int64()
+    return ds.partitioning(pa.schema([(partition_column, column_type)]), flavor="hive")
+
+
+def _write_options() -> "ds.FileWriteOptions":
+    return ds.ParquetFileFormat().make_write_options(use_dictionary=True, compression="zstd")
+
+
+def export_dimension_table(conn: sqlite3.Connection, table: str, out_dir: Path, batch_size: int) -> int:
+    """Write a small table to a single Parquet file. Returns the number of rows written."""
+    columns = _table_columns(conn, table)
+    schema = pa.schema([(name, _arrow_type(declared)) for name, declared in columns])
+    column_list = ", ".join(name for name, _ in columns)
+    cursor = conn.execute(f"SELECT {column_list} FROM {table}")
+
+    ds.write_dataset(
+        _iter_batches(cursor, schema, batch_size),
+        out_dir / table,
+        schema=schema,
+        format="parquet",
+        file_options=_write_options(),
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+    )
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def export_usage_table(
+    conn: sqlite3.Connection, out_dir: Path, partition_by: str, batch_size: int
+) -> int:
+    """
+    Write boost_usage partitioned by commit year or by library.
+
+    Each row carries the header's library_id and the commit year in addition to
+    the original columns, so library/year filters work on the usage files alone.
+    """
+    columns = _table_columns(conn, USAGE_TABLE)
+    fields = [(name, _arrow_type(declared)) for name, declared in columns]
+    fields.append(("library_id", pa.int64()))
+    fields.append(("year", pa.string()))
+    schema = pa.schema(fields)
+
+    # delete_matching only replaces partitions written again: drop the previous
+    # export so year=* and library_id=* folders never coexist
+    usage_dir = out_dir / USAGE_TABLE
+    if usage_dir.exists():
+        shutil.rmtree(usage_dir)
+
+    column_list = ", ".join(f"bu.{name}" for name, _ in columns)
+    cursor = conn.execute(f"""
+        SELECT
+            {column_list},
+            bh.library_id,
+            CASE WHEN LENGTH(bu.last_commit_ts) >= 4 THEN SUBSTR(bu.last_commit_ts, 1, 4) END
+        FROM {USAGE_TABLE} bu
+        JOIN boost_header bh ON bh.id = bu.header_id
+    """)
+
+    ds.write_dataset(
+        _iter_batches(cursor, schema, batch_size),
+        usage_dir,
+        schema=schema,
+        format="parquet",
+        partitioning=_usage_partitioning(PARTITION_COLUMNS[partition_by]),
+        file_options=_write_options(),
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+        max_partitions=4096,
+    )
+    (out_dir / EXPORT_METADATA).write_text(
+        json.dumps({"partition_by": partition_by, "partition_column": PARTITION_COLUMNS[partition_by]}, indent=2),
+        encoding="utf-8",
+    )
+    return conn.execute(f"SELECT COUNT(*) FROM {USAGE_TABLE}").fetchone()[0]
+
+
+def read_export_metadata(root: Path) -> Dict[str, str]:
+    """Read export.json written by export_usage_table()."""
+    metadata_path = Path(root) / EXPORT_METADATA
+    if not metadata_path.exists():
+        raise FileNotFoundError(f"{metadata_path} not found; re-run export_parquet.py to write it")
+    return json.loads(metadata_path.read_text(encoding="utf-8"))
+
+
+def export_to_parquet(
+    db_path: Path = DB_PATH,
+    out_dir: Path = PARQUET_DIR,
+    partition_by: str = "year",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Export the usage database to a Parquet dataset.
+
+    Args:
+        db_path: boost_usage.db to read (opened read-only)
+        out_dir: Root directory of the Parquet dataset
+        partition_by: "year" or "library" partitioning for boost_usage
+        batch_size: Rows per Arrow record batch
+
+    Returns:
+        Dict mapping table name to the number of rows exported
+    """
+    _require_pyarrow()
+    if partition_by not in PARTITION_COLUMNS:
+        raise ValueError(f"partition_by must be one of {sorted(PARTITION_COLUMNS)}")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # write_dataset pulls record batches from a writer thread
+    conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        row_counts: Dict[str, int] = {}
+        for table in DIMENSION_TABLES:
+            row_counts[table] = export_dimension_table(conn, table, out_dir, batch_size)
+            print(f"Exported {row_counts[table]:,} rows from {table}")
+        row_counts[USAGE_TABLE] = export_usage_table(conn, out_dir, partition_by, batch_size)
+        print(f"Exported {row_counts[USAGE_TABLE]:,} rows from {USAGE_TABLE} (partitioned by {partition_by})")
+    finally:
+        conn.close()
+    return row_counts
+
+
+class ParquetUsageStore:
+    """
+    Vectorized read path over a dataset written by export_to_parquet().
+
+    The aggregate methods return the same shapes as the SQL used in
+    create_dashboard.py and analyze_boost_usage.py, so results can be compared
+    or fed into the dashboard directly.
+    """
+
+    def __init__(self, root: Path = PARQUET_DIR):
+        _require_pyarrow()
+        self.root = Path(root)
+        usage_dir = self.root / USAGE_TABLE
+        partition_column = read_export_metadata(self.root)["partition_column"]
+        self.usage = ds.dataset(usage_dir, format="parquet", partitioning=_usage_partitioning(partition_column))
+        self.repositories = ds.dataset(self.root / "repository", format="parquet").to_table()
+        self.libraries = ds.dataset(self.root / "boost_library", format="parquet").to_table()
+        self._library_names = dict(zip(
+            self.libraries.column("id").to_pylist(),
+            self.libraries.column("name").cast(pa.string()).to_pylist(),
+        ))
+
+    def _starred_repository_ids(self, min_stars: int) -> "pa.Array":
+        stars = self.repositories.column("stars")
+        mask = pc.fill_null(pc.greater_equal(stars, min_stars), False)
+        return self.repositories.column("id").filter(mask).combine_chunks()
+
+    def _usage_table(self, columns: List[str], min_stars: Optional[int], library_id: Optional[int] = None) -> "pa.Table":
+        """Scan usage rows that are not excepted, optionally restricted to starred repos and one library."""
+        expression = ds.field("excepted_ts").is_null()
+        if library_id is not None:
+            expression = expression & (ds.field("library_id") == library_id)
+        if min_stars is not None:
+            expression = expression & ds.field("repository_id").isin(self._starred_repository_ids(min_stars))
+        return self.usage.to_table(columns=columns, filter=expression)
+
+    def library_usage_counts(self, min_stars: Optional[int] = MIN_STARS) -> List[Dict[str, Any]]:
+        """Usage and distinct repository counts per library, highest usage first."""
+        table = self._usage_table(["id", "library_id", "repository_id"], min_stars)
+        grouped = table.group_by("library_id").aggregate([
+            ("id", "count"),
+            ("repository_id", "count_distinct"),
+        ])
+        rows = [
+            {
+                "library_name": self._library_names.get(lib_id, str(lib_id)),
+                "usage_count": usage_count,
+                "repo_count": repo_count,
+            }
+            for lib_id, usage_count, repo_count in zip(
+                grouped.column("library_id").to_pylist(),
+                grouped.column("id_count").to_pylist(),
+                grouped.column("repository_id_count_distinct").to_pylist(),
+            )
+        ]
+        rows.sort(key=lambda row: row["usage_count"], reverse=True)
+        return rows
+
+    def top_libraries(self, limit: int = 20, ascending: bool = False, min_stars: Optional[int] = MIN_STARS) -> List[Dict[str, Any]]:
+        """Equivalent of the top20_libs / bottom20_libs dashboard queries."""
+        rows = [
+            {"library_name": row["library_name"], "usage_count": row["usage_count"]}
+            for row in self.library_usage_counts(min_stars)
+        ]
+        if ascending:
+            rows.reverse()
+        return rows[:limit]
+
+    def usage_by_year(self, library_id: Optional[int] = None, min_stars: Optional[int] = MIN_STARS) -> Dict[str, int]:
+        """Usage counts per commit year (2000..current year), optionally for one library."""
+        table = self._usage_table(["id", "year"], min_stars, library_id)
+        table = table.filter(pc.is_valid(table.column("year")))
+        grouped = table.group_by("year").aggregate([("id", "count")])
+        current_year = str(datetime.now().year)
+        counts = {
+            year: count
+            for year, count in zip(grouped.column("year").to_pylist(), grouped.column("id_count").to_pylist())
+            if "2000" <= year <= current_year
+        }
+        return dict(sorted(counts.items()))
+
+    def usage_by_library_and_year(self, min_stars: Optional[int] = MIN_STARS) -> Dict[str, Dict[str, int]]:
+        """Usage counts per (library, year) for every library in a single scan."""
+        table = self._usage_table(["id", "library_id", "year"], min_stars)
+        table = table.filter(pc.is_valid(table.column("year")))
+        grouped = table.group_by(["library_id", "year"]).aggregate([("id", "count")])
+        current_year = str(datetime.now().year)
+        result: Dict[str, Dict[str, int]] = {}
+        for lib_id, year, count in sorted(zip(
+            grouped.column("library_id").to_pylist(),
+            grouped.column("year").to_pylist(),
+            grouped.column("id_count").to_pylist(),
+        ), key=lambda row: (row[0], row[1])):
+            if "2000" <= year <= current_year:
+                result.setdefault(self._library_names.get(lib_id, str(lib_id)), {})[year] = count
+        return result
+
+    def top_repositories(self, library_id: int, limit: int = 10, min_stars: int = MIN_STARS) -> List[Dict[str, Any]]:
+        """Equivalent of the per-library top_repos query (most starred repositories using the library)."""
+        table = self._usage_table(["id", "repository_id"], min_stars, library_id)
+        grouped = table.group_by("repository_id").aggregate([("id", "count")])
+        repos = self.repositories.select(["id", "repo_name", "stars"])
+        joined = grouped.join(repos, keys="repository_id", right_keys="id")
+        rows = [
+            {"repo_name": repo_name, "stars": stars, "usage_count": usage_count}
+            for repo_name, stars, usage_count in zip(
+                joined.column("repo_name").cast(pa.string()).to_pylist(),
+                joined.column("stars").to_pylist(),
+                joined.column("id_count").to_pylist(),
+            )
+        ]
+        rows.sort(key=lambda row: row["stars"], reverse=True)
+        return rows[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export boost_usage.db to a partitioned Parquet dataset")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="Path to boost_usage.db")
+    parser.add_argument("--out", type=Path, default=PARQUET_DIR, help="Output directory for the Parquet dataset")
+    parser.add_argument("--partition-by", choices=sorted(PARTITION_COLUMNS), default="year",
+                        help="Partition boost_usage by commit year or by library (default: year)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Rows per record batch (default: {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args()
+
+    export_to_parquet(args.db, args.out, args.partition_by, args.batch_size)
+
+    store = ParquetUsageStore(args.out)
+    print("\nTop 10 libraries by usage count (from Parquet):")
+    for row in store.top_libraries(limit=10):
+        print(f"  {row['library_name']}: {row['usage_count']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,474 @@
+"""
+Time-windowed queries over the Boost usage database.
+
+UsageQueryService answers the dashboard's filter questions ("usage of asio in
+the last 30 days", "top libraries since the last release") without touching
+static HTML. On startup (and whenever boost_usage.db changes) it reads the
+database once into daily rollups:
+
+- usage rows per (library, day of last commit)
+- the most recent usage day per (library, repository)
+- the creation day per (library, repository)
+
+Each rollup is a sorted day array with prefix sums, so any window is answered
+with two binary searches. Results are kept in an LRU cache keyed by
+(metric, window, filters).
+
+Windows end on the as-of day (today, UTC, by default) and include it:
+today, 7d, 30d, 90d, 1y, since_release (needs --last-release) and all.
+
+Usage:
+
+    python query_service.py query usage 30d --library asio
+    python query_service.py serve --port 8765
+    curl 'http://127.0.0.1:8765/query?metric=top_libraries&window=90d&limit=10'
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from config import DB_PATH
+
+# Window name -> length in days (None: defined by a start date instead)
+WINDOWS: Dict[str, Optional[int]] = {
+    "today": 1,
+    "7d": 7,
+    "30d": 30,
+    "90d": 90,
+    "1y": 365,
+    "since_release": None,
+    "all": None,
+}
+
+METRICS = ("usage", "active_repos", "new_repos", "top_libraries", "usage_by_day")
+
+DEFAULT_MIN_STARS = 10  # same repository filter as the dashboard
+DEFAULT_CACHE_SIZE = 1024
+
+
+def _day_ordinal(raw: Optional[str]) -> Optional[int]:
+    """Convert the YYYY-MM-DD prefix of a timestamp to a date ordinal (None if unparsable)."""
+    if not raw or len(raw) < 10:
+        return None
+    try:
+        return date.fromisoformat(raw[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+class _DaySeries:
+    """Counts per day stored as sorted day ordinals with prefix sums."""
+
+    def __init__(self, counts_by_day: Dict[int, int]):
+        self.days = sorted(counts_by_day)
+        self.prefix = [0]
+        for day in self.days:
+            self.prefix.append(self.prefix[-1] + counts_by_day[day])
+
+    @classmethod
+    def from_days(cls, days: Iterable[int]) -> "_DaySeries":
+        """One count per occurrence of a day."""
+        counts: Dict[int, int] = {}
+        for day in days:
+            counts[day] = counts.get(day, 0) + 1
+        return cls(counts)
+
+    def total(self, start: int, end: int) -> int:
+        """Sum of counts for start <= day <= end."""
+        if start > end:
+            return 0
+        return self.prefix[bisect_right(self.days, end)] - self.prefix[bisect_left(self.days, start)]
+
+    def per_day(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """(day, count) pairs for start <= day <= end."""
+        if start > end:
+            return []
+        lo, hi = bisect_left(self.days, start), bisect_right(self.days, end)
+        return [(self.days[i], self.prefix[i + 1] - self.prefix[i]) for i in range(lo, hi)]
+
+
+class _LRUCache:
+    """Thread-safe least-recently-used result cache."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return True, self._items[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._items), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+class _Rollups:
+    """Daily rollups of boost_usage.db, keyed by library id (None = all libraries)."""
+
+    def __init__(self, db_path: Path, min_stars: int):
+        conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            self.library_ids = {
+                row["name"]: row["id"] for row in conn.execute("SELECT id, name FROM boost_library ORDER BY name")
+            }
+            self.library_names = {library_id: name for name, library_id in self.library_ids.items()}
+            self.usage = self._usage_series(conn, min_stars)
+            self.last_active = self._repo_day_series(conn, min_stars, "MAX(SUBSTR(bu.last_commit_ts, 1, 10))")
+            self.created = self._repo_day_series(conn, min_stars, "SUBSTR(r.created_at, 1, 10)")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _usage_series(conn: sqlite3.Connection, min_stars: int) -> Dict[Optional[int], _DaySeries]:
+        """Usage row counts per (library, day of last commit)."""
+        counts: Dict[Optional[int], Dict[int, int]] = {None: {}}
+        for row in conn.execute("""
+            SELECT
+                bh.library_id,
+                SUBSTR(bu.last_commit_ts, 1, 10) AS day,
+                COUNT(*) AS usage_count
+            FROM boost_usage bu
+            JOIN boost_header bh ON bh.id = bu.header_id
+            JOIN repository r ON r.id = bu.repository_id
+            WHERE bu.excepted_ts IS NULL
+              AND bu.last_commit_ts IS NOT NULL
+              AND r.stars IS NOT NULL
+              AND r.stars >= ?
+            GROUP BY bh.library_id, day
+        """, (min_stars,)):
+            day = _day_ordinal(row["day"])
+            if day is None:
+                continue
+            for key in (row["library_id"], None):
+                bucket = counts.setdefault(key, {})
+                bucket[day] = bucket.get(day, 0) + row["usage_count"]
+        return {key: _DaySeries(bucket) for key, bucket in counts.items()}
+
+    @staticmethod
+    def _repo_day_series(conn: sqlite3.Connection, min_stars: int, day_expr: str) -> Dict[Optional[int], _DaySeries]:
+        """
+        One day per (library, repository) from day_expr; the "all libraries" series
+        keeps one day per repository (the latest one across its libraries).
+        """
+        days: Dict[Optional[int], List[int]] = {None: []}
+        per_repo: Dict[int, int] = {}
+        for row in conn.execute(f"""
+            SELECT
+                bh.library_id,
+                bu.repository_id,
+                {day_expr} AS day
+            FROM boost_usage bu
+            JOIN boost_header bh ON bh.id = bu.header_id
+            JOIN repository r ON r.id = bu.repository_id
+            WHERE bu.excepted_ts IS NULL
+              AND r.stars IS NOT NULL
+              AND r.stars >= ?
+            GROUP BY bh.library_id, bu.repository_id
+        """, (min_stars,)):
+            day = _day_ordinal(row["day"])
+            if day is None:
+                continue
+            days.setdefault(row["library_id"], []).append(day)
+            repo_id = row["repository_id"]
+            per_repo[repo_id] = max(per_repo.get(repo_id, day), day)
+        days[None] = list(per_repo.values())
+        return {key: _DaySeries.from_days(values) for key, values in days.items()}
+
+    def data_range(self) -> Optional[Tuple[str, str]]:
+        days = self.usage[None].days
+        if not days:
+            return None
+        return date.fromordinal(days[0]).isoformat(), date.fromordinal(days[-1]).isoformat()
+
+
+class UsageQueryService:
+    """
+    Windowed aggregate queries over boost_usage.db, served from daily rollups.
+
+    Metrics:
+        usage          usage rows whose last commit falls in the window
+        active_repos   repositories whose most recent Boost-using commit falls in the window
+        new_repos      repositories created in the window
+        top_libraries  libraries ranked by usage in the window (limit)
+        usage_by_day   daily usage counts in the window
+
+    usage, active_repos, new_repos and usage_by_day accept a library filter. Only
+    repositories with at least min_stars stars and non-excepted usages count, as on
+    the dashboard.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DB_PATH,
+        min_stars: int = DEFAULT_MIN_STARS,
+        last_release: Optional[date] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.db_path = Path(db_path)
+        self.min_stars = min_stars
+        self.last_release = last_release
+        self.cache = _LRUCache(cache_size)
+        self._lock = threading.Lock()
+        # Held while rollups are built, so one thread rebuilds and the others keep
+        # answering from the current rollups instead of building their own copy
+        self._rebuild_lock = threading.Lock()
+        self._rollups: Optional[_Rollups] = None
+        self._db_mtime: Optional[float] = None
+        # Bumped on every rebuild; part of each cache key so results computed
+        # from replaced rollups are never served or stored after a refresh
+        self._generation = 0
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rebuild the rollups if the database file changed. Returns True if rebuilt."""
+        mtime = self.db_path.stat().st_mtime
+        with self._lock:
+            if not force and self._rollups is not None and mtime == self._db_mtime:
+                return False
+        # Without rollups (or when forced) wait for the rebuild; otherwise leave it
+        # to the thread already rebuilding and keep serving the current generation
+        if not self._rebuild_lock.acquire(blocking=force or self._rollups is None):
+            return False
+        try:
+            with self._lock:
+                if not force and self._rollups is not None and mtime == self._db_mtime:
+                    return False
+            # Build outside _lock so queries keep using the current rollups meanwhile
+            start = time.perf_counter()
+            rollups = _Rollups(self.db_path, self.min_stars)
+            with self._lock:
+                self._rollups = rollups
+                self._db_mtime = mtime
+                self._generation += 1
+                self.cache.clear()
+        finally:
+            self._rebuild_lock.release()
+        print(f"Built usage rollups from {self.db_path} in {time.perf_counter() - start:.2f}s")
+        return True
+
+    def resolve_window(self, window: str, as_of: Optional[date] = None) -> Tuple[int, int]:
+        """Return the (start, end) day ordinals of a window, both inclusive."""
+        if window not in WINDOWS:
+            raise ValueError(f"Unknown window {window!r}; expected one of {', '.join(WINDOWS)}")
+        end = (as_of or datetime.now(timezone.utc).date()).toordinal()
+        days = WINDOWS[window]
+        if days is not None:
+            return end - days + 1, end
+        if window == "since_release":
+            if self.last_release is None:
+                raise ValueError("The since_release window needs a last release date (--last-release)")
+            return self.last_release.toordinal(), end
+        return 1, end
+
+    def query(
+        self,
+        metric: str,
+        window: str,
+        library: Optional[str] = None,
+        limit: int = 20,
+        as_of: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """
+        Answer one windowed query.
+
+        Returns:
+            Dict with metric, window, start, end, filters, result, cached and elapsed_ms
+        """
+        started = time.perf_counter()
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {', '.join(METRICS)}")
+        start, end = self.resolve_window(window, as_of)
+        with self._lock:
+            rollups, generation = self._rollups, self._generation
+        if library is not None and library not in rollups.library_ids:
+            raise ValueError(f"Unknown library {library!r}")
+
+        filters = {"library": library} if metric != "top_libraries" else {"limit": limit}
+        key = (generation, metric, window, end, tuple(sorted(filters.items())))
+        cached, result = self.cache.get(key)
+        if not cached:
+            result = self._compute(rollups, metric, start, end, library, limit)
+            with self._lock:
+                if generation == self._generation:
+                    self.cache.put(key, result)
+
+        return {
+            "metric": metric,
+            "window": window,
+            "start": date.fromordinal(start).isoformat() if start > 1 else None,
+            "end": date.fromordinal(end).isoformat(),
+            "filters": filters,
+            "result": result,
+            "cached": cached,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    @staticmethod
+    def _compute(rollups: _Rollups, metric: str, start: int, end: int, library: Optional[str], limit: int) -> Any:
+        library_id = rollups.library_ids[library] if library is not None else None
+        empty = _DaySeries({})
+
+        if metric == "usage":
+            return rollups.usage.get(library_id, empty).total(start, end)
+        if metric == "active_repos":
+            return rollups.last_active.get(library_id, empty).total(start, end)
+        if metric == "new_repos":
+            return rollups.created.get(library_id, empty).total(start, end)
+        if metric == "usage_by_day":
+            return [
+                {"day": date.fromordinal(day).isoformat(), "usage_count": count}
+                for day, count in rollups.usage.get(library_id, empty).per_day(start, end)
+            ]
+
+        # top_libraries
+        ranked = []
+        for library_id, series in rollups.usage.items():
+            if library_id is None:
+                continue
+            usage_count = series.total(start, end)
+            if usage_count:
+                ranked.append((-usage_count, rollups.library_names.get(library_id, str(library_id))))
+        ranked.sort()
+        return [{"library_name": name, "usage_count": -neg_count} for neg_count, name in ranked[:limit]]
+
+    def metadata(self) -> Dict[str, Any]:
+        """Available metrics, windows and libraries, the covered date range and cache stats."""
+        rollups = self._rollups
+        data_range = rollups.data_range()
+        return {
+            "metrics": list(METRICS),
+            "windows": list(WINDOWS),
+            "libraries": sorted(rollups.library_ids),
+            "last_release": self.last_release.isoformat() if self.last_release else None,
+            "min_stars": self.min_stars,
+            "data_range": {"first_day": data_range[0], "last_day": data_range[1]} if data_range else None,
+            "cache": self.cache.stats(),
+        }
+
+
+# ===== HTTP endpoint =====
+
+def _make_handler(service: UsageQueryService):
+    class QueryHandler(BaseHTTPRequestHandler):
+        """GET /query?metric=&window=[&library=][&limit=][&as_of=YYYY-MM-DD] and GET /metadata."""
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            try:
+                if url.path == "/metadata":
+                    self._send(200, service.metadata())
+                elif url.path == "/query":
+                    try:
+                        service.refresh()
+                    except (OSError, sqlite3.Error) as e:
+                        self._send(503, {"error": f"Usage database unavailable: {e}"})
+                        return
+                    as_of = date.fromisoformat(params["as_of"]) if params.get("as_of") else None
+                    self._send(200, service.query(
+                        params.get("metric", ""),
+                        params.get("window", ""),
+                        library=params.get("library") or None,
+                        limit=int(params.get("limit", 20)),
+                        as_of=as_of,
+                    ))
+                else:
+                    self._send(404, {"error": f"Unknown path {url.path}"})
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+
+        def _send(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return QueryHandler
+
+
+def serve(service: UsageQueryService, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Serve queries over HTTP until interrupted."""
+    server = ThreadingHTTPServer((host, port), _make_handler(service))
+    print(f"Serving usage queries on http://{host}:{port}/query (metadata at /metadata)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-windowed queries over boost_usage.db")
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="Path to boost_usage.db")
+    parser.add_argument("--min-stars", type=int, default=DEFAULT_MIN_STARS,
+                        help=f"Only count repositories with at least this many stars (default: {DEFAULT_MIN_STARS})")
+    parser.add_argument("--last-release", type=date.fromisoformat, default=None,
+                        help="Release date (YYYY-MM-DD) used by the since_release window")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f"Maximum number of cached query results (default: {DEFAULT_CACHE_SIZE})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve queries over HTTP")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+
+    query_parser = subparsers.add_parser("query", help="Run one query and print the JSON result")
+    query_parser.add_argument("metric", choices=METRICS)
+    query_parser.add_argument("window", choices=list(WINDOWS))
+    query_parser.add_argument("--library", default=None)
+    query_parser.add_argument("--limit", type=int, default=20)
+    query_parser.add_argument("--as-of", type=date.fromisoformat, default=None,
+                              help="Last day of the window (default: today, UTC)")
+
+    args = parser.parse_args()
+    service = UsageQueryService(args.db, args.min_stars, args.last_release, args.cache_size)
+
+    if args.command == "serve":
+        serve(service, args.host, args.port)
+    else:
+        result = service.query(args.metric, args.window, args.library, args.limit, args.as_of)
+        print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
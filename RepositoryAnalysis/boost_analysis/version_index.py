@@ -0,0 +1,56 @@
+"""
+Canonical ordering of the boost_version table.
+
+VersionIndex sorts boost_version once by (major, minor, patch) and gives every
+dashboard collector the same release order: version strings by id, the latest
+version, and the 1.66.0-to-latest range used for chart x-axes.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+# First version shown on the dashboard's per-version charts
+CHART_FIRST_VERSION = (1, 66)
+
+
+class VersionIndex:
+    """boost_version rows in release order, with version strings by id."""
+
+    def __init__(self, rows: Iterable[Any]):
+        """
+        Args:
+            rows: boost_version rows with id, version, major, minor and patch
+        """
+        self.ordered: List[Dict[str, Any]] = sorted(
+            (
+                {"id": row["id"], "version": row["version"],
+                 "major": row["major"], "minor": row["minor"], "patch": row["patch"]}
+                for row in rows
+            ),
+            key=lambda v: (v["major"], v["minor"], v["patch"]),
+        )
+        self.version_by_id: Dict[int, str] = {v["id"]: v["version"] for v in self.ordered}
+
+        first_major, first_minor = CHART_FIRST_VERSION
+        self.chart_version_ids: List[int] = [
+            v["id"] for v in self.ordered if v["major"] == first_major and v["minor"] >= first_minor
+        ]
+
+    @classmethod
+    def from_db(cls, db: Any) -> "VersionIndex":
+        """Load boost_version through a connector exposing fetchall()."""
+        return cls(db.fetchall("SELECT id, version, major, minor, patch FROM boost_version"))
+
+    @property
+    def latest_id(self) -> Optional[int]:
+        return self.ordered[-1]["id"] if self.ordered else None
+
+    @property
+    def latest_version(self) -> Optional[str]:
+        return self.ordered[-1]["version"] if self.ordered else None
+
+    @property
+    def chart_versions(self) -> List[str]:
+        """Version strings from 1.66.0 to the latest version, in release order."""
+        return [self.version_by_id[vid] for vid in self.chart_version_ids]